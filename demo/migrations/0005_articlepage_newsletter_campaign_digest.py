@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("demo", "0004_articlepage_newsletter_preview"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articlepage",
+            name="newsletter_campaign_digest",
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
@@ -7,6 +7,7 @@ from wagtail.models import Page
 from wagtail.permission_policies.base import ModelPermissionPolicy
 
 from wagtail_newsletter.models import NewsletterPageMixin, NewsletterRecipientsBase
+from wagtail_newsletter.permissions import NEWSLETTER_ACTIONS
 
 from .blocks import StoryBlock
 from .fields import StreamField
@@ -40,6 +41,12 @@ class ArticlePage(NewsletterPageMixin, Page):  # type: ignore
         permission_policy = ModelPermissionPolicy(type(self))
         return permission_policy.user_has_permission(user, "sendnewsletter")
 
+    def get_newsletter_permissions(self, user):
+        # All newsletter actions need the same permission, so check it once
+        if self.has_newsletter_permission(user, "send_campaign"):
+            return frozenset(NEWSLETTER_ACTIONS)
+        return frozenset()
+
     @classmethod
     def get_newsletter_panels(cls):
         panels = [panel.clone() for panel in super().get_newsletter_panels()]
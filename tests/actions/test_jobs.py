@@ -0,0 +1,201 @@
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from tests.conftest import MemoryCampaignBackend
+from wagtail_newsletter import jobs
+from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.models import NewsletterJob
+from wagtail_newsletter.test.models import ArticlePage
+
+
+pytestmark = pytest.mark.django_db
+
+CAMPAIGN_ID = "test-campaign-id"
+EMAIL = "test@example.com"
+
+
+@pytest.fixture(autouse=True)
+def background_jobs(settings):
+    settings.WAGTAIL_NEWSLETTER_BACKGROUND_JOBS = True
+
+
+def send_test_email(admin_client: Client, page: ArticlePage):
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "send_test_email",
+        "newsletter-test-email": EMAIL,
+    }
+    return admin_client.post(url, data, follow=True)
+
+
+def test_enqueue(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.save_campaign = Mock()
+    memory_backend.get_campaign = Mock(return_value=None)
+
+    response = send_test_email(admin_client, page)
+
+    html = response.content.decode()
+    assert "The newsletter action will run in the background" in html
+    assert "A newsletter action is running in the background" in html
+    memory_backend.save_campaign.assert_not_called()
+
+    [job] = NewsletterJob.objects.all()
+    assert job.page.pk == page.pk
+    assert job.action == "send_test_email"
+    assert job.data == {
+        "newsletter-action": "send_test_email",
+        "newsletter-test-email": EMAIL,
+    }
+    assert job.user is not None and job.user.is_superuser
+    assert job.status == NewsletterJob.Status.PENDING
+
+
+def test_run_job(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=None)
+    memory_backend.send_test_email = Mock()
+    send_test_email(admin_client, page)
+
+    assert jobs.run_pending_jobs() == 1
+
+    memory_backend.send_test_email.assert_called_once_with(
+        campaign_id=CAMPAIGN_ID, email=EMAIL
+    )
+    job = NewsletterJob.objects.get()
+    assert job.status == NewsletterJob.Status.DONE
+    assert job.started_at is not None and job.finished_at is not None
+    assert [message["level"] for message in job.messages] == ["success", "success"]
+    assert f"Test message sent to &#x27;{EMAIL}&#x27;" in job.messages[1]["message"]
+
+    page.refresh_from_db()
+    assert page.newsletter_campaign == CAMPAIGN_ID
+
+    # The messages are shown once, on the next panel load
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    html = admin_client.get(url).content.decode()
+    assert f"Test message sent to &#x27;{EMAIL}&#x27;" in html
+    assert "A newsletter action is running in the background" not in html
+
+    html = admin_client.get(url).content.decode()
+    assert "Test message sent to" not in html
+
+
+def test_job_messages_shown_to_queuing_user(
+    page: ArticlePage,
+    admin_client: Client,
+    admin_user,
+    django_user_model,
+    memory_backend: MemoryCampaignBackend,
+):
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=None)
+    memory_backend.send_test_email = Mock()
+    send_test_email(admin_client, page)
+    jobs.run_pending_jobs()
+
+    other_client = Client()
+    other_client.force_login(
+        django_user_model.objects.create_superuser(
+            username="other", email="other@example.com"
+        )
+    )
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    html = other_client.get(url).content.decode()
+    assert EMAIL not in html
+
+    html = admin_client.get(url).content.decode()
+    assert f"Test message sent to &#x27;{EMAIL}&#x27;" in html
+    assert NewsletterJob.objects.get().user == admin_user
+
+
+def test_run_job_error(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.save_campaign = Mock(side_effect=CampaignBackendError("Failed"))
+    memory_backend.get_campaign = Mock(return_value=None)
+    send_test_email(admin_client, page)
+
+    jobs.run_pending_jobs()
+
+    job = NewsletterJob.objects.get()
+    assert job.status == NewsletterJob.Status.FAILED
+    assert job.messages[0]["level"] == "error"
+
+
+def test_run_job_unexpected_error(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.get_campaign = Mock(return_value=None)
+    send_test_email(admin_client, page)
+
+    # `MemoryCampaignBackend.save_campaign` raises `NotImplementedError`
+    jobs.run_pending_jobs()
+
+    job = NewsletterJob.objects.get()
+    assert job.status == NewsletterJob.Status.FAILED
+    assert job.messages == [
+        {
+            "level": "error",
+            "message": "An unexpected error occurred. Please try again.",
+        }
+    ]
+
+
+def test_claimed_job_is_not_run_again(page: ArticlePage):
+    job = NewsletterJob.objects.create(page=page, action="send_campaign")
+
+    assert jobs.claim(job)
+    assert not jobs.claim(job)
+    assert jobs.run_pending_jobs() == 0
+
+
+def test_worker_command(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=None)
+    memory_backend.send_test_email = Mock()
+    send_test_email(admin_client, page)
+
+    call_command("newsletter_worker", "--once")
+
+    assert NewsletterJob.objects.get().status == NewsletterJob.Status.DONE
+
+
+def test_stale_running_job_fails(page: ArticlePage, settings):
+    settings.WAGTAIL_NEWSLETTER_BACKGROUND_JOB_TIMEOUT = 60
+    stale = NewsletterJob.objects.create(
+        page=page,
+        action="send_campaign",
+        status=NewsletterJob.Status.RUNNING,
+        started_at=timezone.now() - timedelta(minutes=5),
+    )
+    running = NewsletterJob.objects.create(
+        page=page,
+        action="send_test_email",
+        status=NewsletterJob.Status.RUNNING,
+        started_at=timezone.now(),
+    )
+    assert jobs.has_pending_jobs(page)
+
+    running.delete()
+    assert not jobs.has_pending_jobs(page)
+
+    assert jobs.run_pending_jobs() == 0
+    stale.refresh_from_db()
+    assert stale.status == NewsletterJob.Status.FAILED
+    assert stale.finished_at is not None
+    assert stale.messages[0]["level"] == "error"
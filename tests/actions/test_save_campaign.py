@@ -7,6 +7,7 @@ from django.urls import reverse
 
 from tests.conftest import MemoryCampaignBackend
 from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.models import NewsletterCampaign
 from wagtail_newsletter.test.models import ArticlePage
 
 
@@ -59,6 +60,10 @@ def test_save_campaign(
     page.refresh_from_db()
     assert page.newsletter_campaign == CAMPAIGN_ID
 
+    mirror = NewsletterCampaign.objects.get(campaign_id=CAMPAIGN_ID)
+    assert mirror.page.pk == page.pk
+    assert mirror.last_pushed_revision == page.latest_revision
+
 
 def test_save_campaign_failed_to_save(
     page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
@@ -77,3 +82,30 @@ def test_save_campaign_failed_to_save(
 
     page.refresh_from_db()
     assert page.newsletter_campaign == ""
+    assert not NewsletterCampaign.objects.exists()
+
+
+def test_save_campaign_unchanged(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    """
+    Explicitly saving the campaign always sends it to the backend, even if it's
+    unchanged, e.g. so that it's recreated if it was deleted in the backend.
+    """
+
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=Mock(url=CAMPAIGN_URL))
+
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "save_campaign",
+    }
+    admin_client.post(url, data)
+    admin_client.post(url, data)
+
+    assert memory_backend.save_campaign.call_count == 2
+
+    page.refresh_from_db()
+    assert len(page.newsletter_campaign_digest) == 64
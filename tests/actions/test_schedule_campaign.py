@@ -9,6 +9,7 @@ from django.utils.formats import localize
 
 from tests.conftest import MemoryCampaignBackend
 from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.models import NewsletterCampaign
 from wagtail_newsletter.test.models import ArticlePage
 
 
@@ -72,6 +73,40 @@ def test_schedule_campaign(
     ]
 
 
+def test_schedule_campaign_updates_mirror(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=None)
+    memory_backend.schedule_campaign = Mock()
+
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    schedule_time = get_schedule_time(timedelta(days=1))
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "schedule_campaign",
+        "newsletter-schedule-schedule_time": schedule_time.isoformat(),
+    }
+    admin_client.post(url, data)
+
+    mirror = NewsletterCampaign.objects.get(campaign_id=CAMPAIGN_ID)
+    assert mirror.status == NewsletterCampaign.SCHEDULED
+    assert mirror.is_scheduled
+    assert not mirror.is_sent
+    assert mirror.schedule_time == schedule_time.replace(tzinfo=timezone.utc)
+
+    # Unscheduling puts the campaign back in draft
+    memory_backend.unschedule_campaign = Mock()
+    admin_client.post(
+        reverse("wagtail_newsletter:unschedule", kwargs={"page_id": page.pk})
+    )
+    mirror.refresh_from_db()
+    assert mirror.status == NewsletterCampaign.DRAFT
+    assert not mirror.is_scheduled
+    assert mirror.schedule_time is None
+
+
 def test_schedule_campaign_failed_to_schedule(
     page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
 ):
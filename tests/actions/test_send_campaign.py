@@ -7,6 +7,7 @@ from django.urls import reverse
 
 from tests.conftest import MemoryCampaignBackend
 from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.models import NewsletterCampaign
 from wagtail_newsletter.test.models import ArticlePage
 
 
@@ -59,6 +60,27 @@ def test_send_campaign(
     assert memory_backend.send_campaign.mock_calls == [call(CAMPAIGN_ID)]
 
 
+def test_send_campaign_updates_mirror(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=None)
+    memory_backend.send_campaign = Mock()
+
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "send_campaign",
+    }
+    admin_client.post(url, data)
+
+    mirror = NewsletterCampaign.objects.get(campaign_id=CAMPAIGN_ID)
+    assert mirror.status == NewsletterCampaign.SENDING
+    assert mirror.is_sent
+    assert not mirror.is_scheduled
+
+
 def test_send_campaign_failed_to_send(
     page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
 ):
@@ -6,7 +6,10 @@ from django.test import Client
 from django.urls import reverse
 
 from tests.conftest import MemoryCampaignBackend
-from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.campaign_backends import (
+    CampaignBackendError,
+    CampaignNotFound,
+)
 from wagtail_newsletter.test.models import ArticlePage
 
 
@@ -104,3 +107,73 @@ def test_send_test_email_failed_to_send(
     response = admin_client.post(url, data, follow=True)
 
     assert "Mock error" in response.content.decode()
+
+
+def test_send_test_email_skips_unchanged_campaign(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=Mock(url=CAMPAIGN_URL))
+    memory_backend.send_test_email = Mock()
+
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "send_test_email",
+        "newsletter-test-email": EMAIL,
+    }
+    admin_client.post(url, data)
+    response = admin_client.post(url, data, follow=True)
+    assert (
+        f"Newsletter campaign &#x27;{page.title}&#x27; is unchanged since it was "
+        "last saved to Testing" in response.content.decode()
+    )
+    admin_client.post(url, {**data, "title": "Changed title"})
+
+    assert [
+        mock_call.kwargs["subject"]
+        for mock_call in memory_backend.save_campaign.mock_calls
+    ] == [page.title, "Changed title"]
+    assert memory_backend.send_test_email.call_count == 3
+
+
+def test_send_test_email_recreates_deleted_campaign(
+    page: ArticlePage, admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    """
+    If the campaign was deleted in the backend, the unchanged campaign is saved
+    again in full, which recreates it, and the test email is sent again.
+    """
+    new_campaign_id = "new-campaign-id"
+    memory_backend.save_campaign = Mock(side_effect=[CAMPAIGN_ID, new_campaign_id])
+    memory_backend.get_campaign = Mock(return_value=Mock(url=CAMPAIGN_URL))
+    memory_backend.send_test_email = Mock()
+
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "send_test_email",
+        "newsletter-test-email": EMAIL,
+    }
+    admin_client.post(url, data)
+
+    def send_test_email(*, campaign_id, email):
+        if campaign_id == CAMPAIGN_ID:
+            raise CampaignNotFound("Campaign not found")
+
+    memory_backend.send_test_email = Mock(side_effect=send_test_email)
+    response = admin_client.post(url, data, follow=True)
+
+    assert f"Test message sent to &#x27;{EMAIL}&#x27;" in response.content.decode()
+    assert [
+        mock_call.kwargs["campaign_id"]
+        for mock_call in memory_backend.save_campaign.mock_calls
+    ] == ["", CAMPAIGN_ID]
+    assert memory_backend.send_test_email.mock_calls == [
+        call(campaign_id=CAMPAIGN_ID, email=EMAIL),
+        call(campaign_id=new_campaign_id, email=EMAIL),
+    ]
+    page.refresh_from_db()
+    assert page.newsletter_campaign == new_campaign_id
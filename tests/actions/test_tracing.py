@@ -0,0 +1,54 @@
+from unittest.mock import Mock
+
+import pytest
+
+from django.test import Client
+from django.urls import reverse
+
+from tests.conftest import MemoryCampaignBackend
+from wagtail_newsletter import tracing
+from wagtail_newsletter.test.models import ArticlePage
+
+
+pytestmark = pytest.mark.django_db
+
+CAMPAIGN_ID = "test-campaign-id"
+
+
+def test_save_campaign_spans(
+    page: ArticlePage,
+    settings,
+    admin_client: Client,
+    memory_backend: MemoryCampaignBackend,
+):
+    settings.WAGTAIL_NEWSLETTER_TRACE_EXPORTER = (
+        "wagtail_newsletter.tracing.InMemorySpanExporter"
+    )
+    memory_backend.save_campaign = Mock(return_value=CAMPAIGN_ID)
+    memory_backend.get_campaign = Mock(return_value=None)
+
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "save_campaign",
+    }
+    admin_client.post(url, data)
+
+    exporter = tracing.get_exporter()
+    assert isinstance(exporter, tracing.InMemorySpanExporter)
+    spans = {span.name: span for span in exporter.spans}
+    assert list(spans) == [
+        "page.revision_as_object",
+        "mrml.to_html",
+        "page.get_newsletter_html",
+        "backend.get_campaign_digest",
+        "newsletter.save_campaign",
+    ]
+
+    root = spans["newsletter.save_campaign"]
+    assert root.parent_id is None
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert spans["mrml.to_html"].parent_id == spans["page.get_newsletter_html"].span_id
+    assert spans["page.get_newsletter_html"].parent_id == root.span_id
+    assert spans["page.get_newsletter_html"].attributes["html_size"] > 0
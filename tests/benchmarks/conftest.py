@@ -0,0 +1,145 @@
+"""
+Benchmarks of the campaign backend operations, run against the fake Mailchimp
+API over real HTTP connections.
+
+By default, each benchmark runs once, with the smallest parameters, as a smoke
+test. To run the full suite and save the results:
+
+    pytest tests/benchmarks --newsletter-benchmark-json=results.json
+"""
+
+import json
+import platform
+import statistics
+import time
+
+from datetime import datetime, timezone
+from typing import Any, cast
+
+import django
+import pytest
+import wagtail
+
+import wagtail_newsletter
+
+from wagtail_newsletter.campaign_backends.mailchimp import MailchimpCampaignBackend
+from wagtail_newsletter.test.mailchimp_server import FakeMailchimpServer
+
+
+# Injected latency of each API request, in seconds
+LATENCIES = [0.0, 0.02, 0.1]
+
+# Payload sizes, for each parameter
+SIZES = {
+    "html_kb": [1, 100, 1000],
+    "audience_count": [10, 1000, 3000],
+    "segment_count": [10, 1000, 3000],
+}
+
+
+def is_full_run(config: pytest.Config) -> bool:
+    return bool(config.getoption("newsletter_benchmark_json"))
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc):
+    full = is_full_run(metafunc.config)
+    if "latency" in metafunc.fixturenames:
+        metafunc.parametrize("latency", LATENCIES if full else LATENCIES[:1])
+
+    for name, values in SIZES.items():
+        if name in metafunc.fixturenames:
+            metafunc.parametrize(name, values if full else values[:1])
+
+
+class BenchmarkResults:
+    def __init__(self, rounds: int):
+        self.rounds = rounds
+        self.results: list[dict[str, Any]] = []
+
+    def to_json(self) -> "dict[str, Any]":
+        return {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "environment": {
+                "python": platform.python_version(),
+                "django": django.__version__,
+                "wagtail": wagtail.__version__,
+                "wagtail_newsletter": wagtail_newsletter.__version__,
+            },
+            "benchmarks": self.results,
+        }
+
+
+@pytest.fixture(scope="session")
+def newsletter_benchmark_results(request: pytest.FixtureRequest):
+    config = request.config
+    results = BenchmarkResults(
+        rounds=cast(int, config.getoption("newsletter_benchmark_rounds"))
+        if is_full_run(config)
+        else 1
+    )
+    yield results
+
+    path = config.getoption("newsletter_benchmark_json")
+    if path:
+        with open(path, "w") as f:
+            json.dump(results.to_json(), f, indent=2)
+
+
+@pytest.fixture
+def server(latency: float):
+    with FakeMailchimpServer(latency=latency) as server:
+        yield server
+
+
+@pytest.fixture
+def backend(settings, server: FakeMailchimpServer):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_URL = server.url
+    return MailchimpCampaignBackend()
+
+
+@pytest.fixture
+def newsletter_benchmark(
+    request: pytest.FixtureRequest,
+    newsletter_benchmark_results: BenchmarkResults,
+    server: FakeMailchimpServer,
+):
+    """
+    Call `newsletter_benchmark(func)` to time `func` over several rounds, and
+    record the statistics, along with the test parameters. `setup`, if given, is
+    called before each round, without being timed.
+    """
+
+    def run(func, *args, setup=None, **kwargs):
+        # Warm up the connection pool
+        func(*args, **kwargs)
+
+        requests_before = server.request_count
+        durations = []
+        for _ in range(newsletter_benchmark_results.rounds):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            durations.append(time.perf_counter() - start)
+
+        durations.sort()
+        newsletter_benchmark_results.results.append(
+            {
+                "name": request.node.originalname,
+                "params": dict(request.node.callspec.params),
+                "rounds": len(durations),
+                "min": durations[0],
+                "max": durations[-1],
+                "mean": statistics.mean(durations),
+                "median": statistics.median(durations),
+                "p95": durations[int(0.95 * (len(durations) - 1))],
+                "requests_per_round": (
+                    (server.request_count - requests_before) / len(durations)
+                ),
+            }
+        )
+
+    return run
@@ -0,0 +1,90 @@
+from wagtail_newsletter.campaign_backends.mailchimp import MailchimpCampaignBackend
+from wagtail_newsletter.test.mailchimp_server import FakeMailchimpServer
+from wagtail_newsletter.test.models import CustomRecipients
+
+
+def make_html(size_kb: int) -> str:
+    paragraph = "<p>" + "Lorem ipsum dolor sit amet. " * 35 + "</p>\n"
+    return paragraph * size_kb
+
+
+def save_campaign(backend, server, *, campaign_id=None, html="<p>Hello</p>"):
+    audience = next(iter(server.state.audiences.values()))
+    return backend.save_campaign(
+        campaign_id=campaign_id,
+        recipients=CustomRecipients(audience=audience["id"]),
+        subject="Subject",
+        reply_to="reply@example.com",
+        from_name="Sender",
+        html=html,
+    )
+
+
+def sent_campaign(backend, server):
+    server.state.add_audience("Readers", member_count=1000)
+    campaign_id = save_campaign(backend, server)
+    backend.send_campaign(campaign_id)
+    campaign = backend.get_campaign(campaign_id)
+    assert campaign is not None
+    return campaign
+
+
+def test_save_campaign_create(
+    backend: MailchimpCampaignBackend,
+    server: FakeMailchimpServer,
+    newsletter_benchmark,
+    html_kb: int,
+):
+    server.state.add_audience("Readers")
+    newsletter_benchmark(save_campaign, backend, server, html=make_html(html_kb))
+
+
+def test_save_campaign_update(
+    backend: MailchimpCampaignBackend,
+    server: FakeMailchimpServer,
+    newsletter_benchmark,
+    html_kb: int,
+):
+    server.state.add_audience("Readers")
+    campaign_id = save_campaign(backend, server)
+    newsletter_benchmark(
+        save_campaign, backend, server, campaign_id=campaign_id, html=make_html(html_kb)
+    )
+
+
+def test_get_campaign(
+    backend: MailchimpCampaignBackend, server: FakeMailchimpServer, newsletter_benchmark
+):
+    campaign = sent_campaign(backend, server)
+    newsletter_benchmark(backend.get_campaign, campaign.id)
+
+
+def test_get_report(
+    backend: MailchimpCampaignBackend, server: FakeMailchimpServer, newsletter_benchmark
+):
+    campaign = sent_campaign(backend, server)
+    # Time fetching the report, not reading it from the cache
+    newsletter_benchmark(
+        campaign.get_report,
+        setup=lambda: backend.invalidate_cached_report(campaign.id),
+    )
+
+
+def test_get_audiences(
+    backend: MailchimpCampaignBackend,
+    server: FakeMailchimpServer,
+    newsletter_benchmark,
+    audience_count: int,
+):
+    server.state.populate(audiences=audience_count, segments=0)
+    newsletter_benchmark(lambda: list(backend.get_audiences()))
+
+
+def test_get_audience_segments(
+    backend: MailchimpCampaignBackend,
+    server: FakeMailchimpServer,
+    newsletter_benchmark,
+    segment_count: int,
+):
+    audience = server.state.add_audience("Readers", segments=segment_count)
+    newsletter_benchmark(lambda: list(backend.get_audience_segments(audience["id"])))
@@ -0,0 +1,181 @@
+import asyncio
+import threading
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from wagtail_newsletter.audiences import Audience, AudienceSegment
+from wagtail_newsletter.campaign_backends import (
+    AsyncCampaignBackend,
+    AsyncToSyncCampaignBackend,
+    CampaignBackendError,
+    SyncToAsyncCampaignBackend,
+    get_async_backend,
+    get_backend,
+)
+from wagtail_newsletter.campaign_backends.mailchimp import (
+    AsyncMailchimpCampaignBackend,
+    MailchimpCampaignBackend,
+)
+
+from ..conftest import MemoryCampaignBackend
+
+
+CAMPAIGN_ID = "test-campaign-id"
+SCHEDULE_TIME = datetime(2024, 8, 10, 16, 30, tzinfo=timezone.utc)
+AUDIENCE = Audience(id="audience1", name="Audience", member_count=10)
+SEGMENT = AudienceSegment(id="audience1/segment1", name="Segment", member_count=5)
+
+
+class AsyncMemoryCampaignBackend(AsyncCampaignBackend):
+    name = "Async testing"
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_audiences(self):
+        return [AUDIENCE]
+
+    async def get_audience_segments(self, audience_id):
+        return [SEGMENT]
+
+    async def save_campaign(self, **kwargs):
+        self.calls.append(("save_campaign", kwargs))
+        return CAMPAIGN_ID
+
+    async def get_campaign(self, campaign_id):
+        return None
+
+    async def get_report(self, campaign):
+        return {}
+
+    async def send_test_email(self, *, campaign_id, email):
+        self.calls.append(("send_test_email", campaign_id, email))
+
+    async def send_campaign(self, campaign_id):
+        self.calls.append(("send_campaign", campaign_id))
+
+    def validate_schedule_time(self, schedule_time):
+        if schedule_time.minute % 15:
+            raise CampaignBackendError("Invalid schedule time")
+
+    async def schedule_campaign(self, campaign_id, schedule_time):
+        self.calls.append(("schedule_campaign", campaign_id, schedule_time))
+
+    async def unschedule_campaign(self, campaign_id):
+        self.calls.append(("unschedule_campaign", campaign_id))
+
+
+def test_sync_to_async(memory_backend: MemoryCampaignBackend):
+    memory_backend.add(AUDIENCE, [SEGMENT])
+    campaign = Mock()
+    campaign.get_report.return_value = {"emails_sent": 3}
+    memory_backend.get_campaign = Mock(return_value=campaign)
+    memory_backend.send_campaign = Mock()
+    backend = get_async_backend()
+    assert isinstance(backend, SyncToAsyncCampaignBackend)
+    assert backend.name == memory_backend.name
+
+    async def run():
+        audiences, segments = await asyncio.gather(
+            backend.get_audiences(),
+            backend.get_audience_segments(AUDIENCE.id),
+        )
+        campaign = await backend.get_campaign(CAMPAIGN_ID)
+        assert campaign is not None
+        report = await backend.get_report(campaign)
+        await backend.send_campaign(CAMPAIGN_ID)
+        return audiences, segments, report
+
+    audiences, segments, report = asyncio.run(run())
+    assert audiences == [AUDIENCE]
+    assert segments == [SEGMENT]
+    assert report == {"emails_sent": 3}
+    memory_backend.get_campaign.assert_called_once_with(CAMPAIGN_ID)
+    memory_backend.send_campaign.assert_called_once_with(CAMPAIGN_ID)
+
+
+def test_sync_to_async_consumes_listings_in_worker_thread(
+    memory_backend: MemoryCampaignBackend, monkeypatch: pytest.MonkeyPatch
+):
+    threads = []
+
+    def get_audiences():
+        threads.append(threading.current_thread())
+        yield AUDIENCE
+
+    monkeypatch.setattr(memory_backend, "get_audiences", get_audiences)
+    backend = get_async_backend()
+
+    audiences = asyncio.run(backend.get_audiences())
+    assert audiences == [AUDIENCE]
+    assert threads
+    assert threads[0] is not threading.main_thread()
+
+
+def test_sync_to_async_propagates_errors(memory_backend: MemoryCampaignBackend):
+    memory_backend.send_campaign = Mock(side_effect=CampaignBackendError("failed"))
+    backend = get_async_backend()
+
+    with pytest.raises(CampaignBackendError):
+        asyncio.run(backend.send_campaign(CAMPAIGN_ID))
+
+
+def test_get_backend_wraps_async_backend(settings, monkeypatch):
+    settings.WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND = (
+        "tests.campaign_backends.test_async.AsyncMemoryCampaignBackend"
+    )
+    backend = get_backend()
+    assert isinstance(backend, AsyncToSyncCampaignBackend)
+    assert isinstance(backend.async_backend, AsyncMemoryCampaignBackend)
+
+    monkeypatch.setattr(
+        "wagtail_newsletter.campaign_backends.get_backend", lambda: backend
+    )
+    assert get_async_backend() is backend.async_backend
+
+
+def test_async_to_sync():
+    async_backend = AsyncMemoryCampaignBackend()
+    backend = AsyncToSyncCampaignBackend(async_backend)
+
+    assert backend.name == "Async testing"
+    assert backend.get_audiences() == [AUDIENCE]
+    assert backend.get_audience_segments(AUDIENCE.id) == [SEGMENT]
+    assert backend.get_campaign(CAMPAIGN_ID) is None
+    assert backend.save_campaign(campaign_id=None, subject="Subject") == CAMPAIGN_ID
+    backend.send_test_email(campaign_id=CAMPAIGN_ID, email="test@example.com")
+    backend.send_campaign(CAMPAIGN_ID)
+    backend.schedule_campaign(CAMPAIGN_ID, SCHEDULE_TIME)
+    backend.unschedule_campaign(CAMPAIGN_ID)
+
+    with pytest.raises(CampaignBackendError):
+        backend.validate_schedule_time(SCHEDULE_TIME.replace(minute=31))
+
+    assert async_backend.calls == [
+        ("save_campaign", {"campaign_id": None, "subject": "Subject"}),
+        ("send_test_email", CAMPAIGN_ID, "test@example.com"),
+        ("send_campaign", CAMPAIGN_ID),
+        ("schedule_campaign", CAMPAIGN_ID, SCHEDULE_TIME),
+        ("unschedule_campaign", CAMPAIGN_ID),
+    ]
+
+
+def test_async_mailchimp_backend(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    backend = AsyncMailchimpCampaignBackend()
+    assert isinstance(backend.backend, MailchimpCampaignBackend)
+    assert backend.name == "Mailchimp"
+
+    backend.backend.client = Mock()
+    backend.backend.client.campaigns.get.return_value = {
+        "web_id": "web-id",
+        "status": "sent",
+    }
+    campaign = asyncio.run(backend.get_campaign(CAMPAIGN_ID))
+    assert campaign is not None
+    assert campaign.is_sent
@@ -0,0 +1,199 @@
+import logging
+
+import pytest
+
+from wagtail_newsletter.audiences import Audience
+from wagtail_newsletter.campaign_backends import (
+    CampaignBackendError,
+    CampaignBackendTimeout,
+)
+from wagtail_newsletter.campaign_backends.instrumentation import BackendCall
+from wagtail_newsletter.campaign_backends.mailchimp import MailchimpCampaignBackend
+from wagtail_newsletter.signals import campaign_backend_call
+from wagtail_newsletter.test.mailchimp_server import FakeMailchimpServer
+from wagtail_newsletter.test.models import CustomRecipients
+
+from ..conftest import MemoryCampaignBackend
+
+
+@pytest.fixture
+def calls():
+    calls: list[tuple[type, BackendCall]] = []
+
+    def handler(sender, call, **kwargs):
+        calls.append((sender, call))
+
+    campaign_backend_call.connect(handler)
+    yield calls
+    campaign_backend_call.disconnect(handler)
+
+
+@pytest.fixture
+def server():
+    with FakeMailchimpServer() as server:
+        yield server
+
+
+@pytest.fixture
+def mailchimp_backend(settings, server: FakeMailchimpServer):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_URL = server.url
+    return MailchimpCampaignBackend()
+
+
+def test_signal(memory_backend: MemoryCampaignBackend, calls):
+    memory_backend.get_audiences()
+
+    [(sender, call)] = calls
+    assert sender is MemoryCampaignBackend
+    assert call.operation == "get_audiences"
+    assert call.outcome == "success"
+    assert call.duration >= 0
+    assert call.request_count == 0
+
+
+def test_signal_error(memory_backend: MemoryCampaignBackend, calls):
+    with pytest.raises(NotImplementedError):
+        memory_backend.send_campaign("campaign-id")
+
+    [(_, call)] = calls
+    assert call.operation == "send_campaign"
+    assert call.outcome == "error"
+    assert isinstance(call.error, NotImplementedError)
+
+
+def test_signal_timeout(calls):
+    class SlowBackend(MemoryCampaignBackend):
+        def get_campaign(self, campaign_id):
+            raise CampaignBackendTimeout("Too slow")
+
+    with pytest.raises(CampaignBackendTimeout):
+        SlowBackend().get_campaign("campaign-id")
+
+    assert calls[0][1].outcome == "timeout"
+
+
+def test_nested_calls_counted_once(calls):
+    class CustomBackend(MemoryCampaignBackend):
+        def get_audiences(self):
+            return super().get_audiences()
+
+    CustomBackend().get_audiences()
+
+    assert [(sender, call.operation) for sender, call in calls] == [
+        (CustomBackend, "get_audiences")
+    ]
+
+
+def test_generator_streamed(calls):
+    fetched = []
+
+    class PaginatedBackend(MemoryCampaignBackend):
+        def get_audiences(self):  # type: ignore
+            for page in range(2):
+                fetched.append(page)
+                yield Audience(id=f"audience-{page}", name="Audience", member_count=1)
+
+    audiences = PaginatedBackend().get_audiences()
+    assert next(audiences).id == "audience-0"
+    assert fetched == [0]
+    assert calls == []
+
+    assert [audience.id for audience in audiences] == ["audience-1"]
+    assert fetched == [0, 1]
+    [(_, call)] = calls
+    assert call.operation == "get_audiences"
+    assert call.outcome == "success"
+
+
+def test_generator_closed(calls):
+    class PaginatedBackend(MemoryCampaignBackend):
+        def get_audiences(self):  # type: ignore
+            yield Audience(id="audience", name="Audience", member_count=1)
+            raise AssertionError("Not fetched")
+
+    audiences = PaginatedBackend().get_audiences()
+    next(audiences)
+    audiences.close()
+
+    [(_, call)] = calls
+    assert call.outcome == "success"
+
+
+def test_generator_error(calls):
+    class PaginatedBackend(MemoryCampaignBackend):
+        def get_audiences(self):  # type: ignore
+            yield from super().get_audiences()
+            raise CampaignBackendError("Error while fetching page")
+
+    audiences = PaginatedBackend().get_audiences()
+    with pytest.raises(CampaignBackendError):
+        list(audiences)
+
+    [(_, call)] = calls
+    assert call.operation == "get_audiences"
+    assert call.outcome == "error"
+
+
+def test_mailchimp_requests(
+    mailchimp_backend: MailchimpCampaignBackend, server: FakeMailchimpServer, calls
+):
+    audience = server.state.add_audience("Readers", segments=5)
+    html = "<p>Hello</p>" * 100
+
+    campaign_id = mailchimp_backend.save_campaign(
+        recipients=CustomRecipients(audience=audience["id"]),
+        subject="Subject",
+        reply_to="reply@example.com",
+        from_name="Sender",
+        html=html,
+    )
+    list(mailchimp_backend.get_audience_segments(audience["id"], count=2))
+    campaign = mailchimp_backend.get_campaign(campaign_id)
+    assert campaign is not None
+    mailchimp_backend.send_campaign(campaign_id)
+    campaign.get_report()
+
+    save, segments, get, send, report = (call for _, call in calls)
+    assert save.operation == "save_campaign"
+    assert save.request_count == 2
+    assert save.request_bytes > len(html)
+    assert save.status_code == 200
+
+    # Pages fetched by worker threads are counted too
+    assert segments.operation == "get_audience_segments"
+    assert segments.request_count == 3
+
+    assert get.operation == "get_campaign"
+    assert get.payload_size == get.response_bytes > 0
+
+    assert send.status_code == 204
+
+    assert report.operation == "get_report"
+    assert calls[-1][0] is mailchimp_backend.campaign_class
+
+
+def test_slow_call_logger(
+    settings, mailchimp_backend: MailchimpCampaignBackend, caplog
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_SLOW_CALL_THRESHOLD = 0
+
+    with caplog.at_level(logging.WARNING):
+        mailchimp_backend.get_campaign("missing")
+
+    [record] = caplog.records
+    assert record.getMessage().startswith(
+        "Slow Mailchimp call: operation=get_campaign, duration="
+    )
+    assert record.getMessage().endswith(", status_code=404")
+
+
+def test_slow_call_logger_below_threshold(
+    mailchimp_backend: MailchimpCampaignBackend, caplog
+):
+    with caplog.at_level(logging.WARNING):
+        mailchimp_backend.get_campaign("missing")
+
+    assert caplog.records == []
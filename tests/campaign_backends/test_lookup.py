@@ -1,6 +1,8 @@
+from unittest.mock import Mock
+
 import pytest
 
-from wagtail_newsletter.campaign_backends import get_backend
+from wagtail_newsletter.campaign_backends import get_backend, reset_backends
 from wagtail_newsletter.campaign_backends.mailchimp import MailchimpCampaignBackend
 
 from ..conftest import MemoryCampaignBackend
@@ -21,3 +23,49 @@ def test_get_backend_lookup(settings, dotted_path, cls):
         settings.WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND = dotted_path
 
     assert type(get_backend()) is cls
+
+
+def test_get_backend_is_reused(settings):
+    settings.WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND = (
+        "tests.conftest.MemoryCampaignBackend"
+    )
+    assert get_backend() is get_backend()
+
+
+def test_get_backend_settings_changed(settings):
+    settings.WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND = (
+        "tests.conftest.MemoryCampaignBackend"
+    )
+    backend = get_backend()
+
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = "other key"
+    assert get_backend() is not backend
+
+
+def test_get_backend_prepares_shared_resources(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = "mock key"
+    del settings.WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND
+
+    backend = get_backend()
+    assert {"client", "executor", "circuit_breaker"} <= vars(backend).keys()
+
+
+def test_reset_backends(settings):
+    settings.WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND = (
+        "tests.conftest.MemoryCampaignBackend"
+    )
+    backend = get_backend()
+
+    reset_backends()
+    assert get_backend() is not backend
+
+
+def test_default_get_campaigns(memory_backend: MemoryCampaignBackend):
+    memory_backend.get_campaign = Mock(
+        side_effect=lambda campaign_id: None if campaign_id == "deleted" else "found"
+    )
+
+    assert memory_backend.get_campaigns(["one", "deleted", "two"]) == {
+        "one": "found",
+        "two": "found",
+    }
@@ -1,23 +1,36 @@
 import logging
+import threading
+import time
 
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, cast
 from unittest.mock import ANY, Mock, call
 
 import pytest
 
 from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone as django_timezone
 from mailchimp_marketing.api_client import ApiClientError
+from requests import Timeout
+from requests.adapters import HTTPAdapter
 
 from wagtail_newsletter.audiences import (
     Audience,
     AudienceSegment,
 )
-from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.campaign_backends import (
+    CampaignBackendError,
+    CampaignBackendTimeout,
+    CampaignNotFound,
+)
 from wagtail_newsletter.campaign_backends.mailchimp import (
+    MailchimpCampaign,
     MailchimpCampaignBackend,
     _log_and_raise,
+    request_timeout,
 )
+from wagtail_newsletter.campaign_backends.throttling import ConcurrencyLimitExceeded
 from wagtail_newsletter.test.models import CustomRecipients
 
 
@@ -55,6 +68,129 @@ def test_configure_client(settings):
     assert backend.client.api_client.server == "us13"
 
 
+def test_client_uses_connection_pool(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    backend = MailchimpCampaignBackend()
+    api_client = backend.client.api_client
+    assert backend.client.campaigns.api_client is api_client
+    assert backend.client.lists.api_client is api_client
+    assert backend.client.reports.api_client is api_client
+
+    assert api_client.session.headers["Accept-Encoding"] == "gzip, deflate"
+    adapter = api_client.session.get_adapter("https://us13.api.mailchimp.com/3.0")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 10
+
+
+def test_client_request_goes_through_session(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    backend = MailchimpCampaignBackend()
+    session = backend.client.api_client.session = Mock()
+    session.request.return_value.headers = {"content-type": "application/json"}
+    session.request.return_value.json.return_value = {"id": CAMPAIGN_ID}
+    session.request.return_value.content = b'{"id": "test-campaign-id"}'
+    session.request.return_value.ok = True
+
+    assert backend._create_campaign({}) == CAMPAIGN_ID
+    assert session.request.call_count == 1
+    request_call = session.request.call_args
+    assert request_call.args == (
+        "POST",
+        "https://us13.api.mailchimp.com/3.0/campaigns",
+    )
+    assert request_call.kwargs["data"] == '{"type": "regular"}'
+    connect_timeout, read_timeout = request_call.kwargs["timeout"]
+    assert connect_timeout == 5
+    assert 29 < read_timeout <= 30
+
+
+def test_client_concurrency_limit(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_CONCURRENCY_LIMIT = {"max_concurrent": 3}
+    backend = MailchimpCampaignBackend()
+    api_client = backend.client.api_client
+    limiter = api_client.limiter
+    assert limiter is not None
+    assert limiter.max_concurrent == 3
+    assert "00000000000000000000000000000000" not in limiter.key
+
+    session = api_client.session = Mock()
+    session.request.return_value.headers = {"content-type": "application/json"}
+    session.request.return_value.json.return_value = {"id": CAMPAIGN_ID}
+    session.request.return_value.content = b'{"id": "test-campaign-id"}'
+    session.request.return_value.ok = True
+    backend._create_campaign({})
+    assert limiter.get_metrics()["acquired"] == 1
+
+
+def test_client_concurrency_limit_within_timeout(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_CONCURRENCY_LIMIT = {"max_concurrent": 1}
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS = {"create_campaign": 0.1}
+    backend = MailchimpCampaignBackend()
+    limiter = backend.client.api_client.limiter
+    assert limiter is not None
+    backend.client.api_client.session = Mock()
+
+    # Waiting for a slot counts towards the time budget of the call
+    start = time.monotonic()
+    with limiter.limit():
+        with pytest.raises(CampaignBackendError):
+            backend._create_campaign({})
+
+    assert time.monotonic() - start < 1
+    assert limiter.get_metrics()["rejected"] == 1
+
+
+def test_operation_timeouts(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS = {"connect": 2, "get_campaign": 3}
+    backend = MailchimpCampaignBackend()
+    assert backend.client.api_client.timeout == (2, 30)
+
+    session = backend.client.api_client.session = Mock()
+    session.request.return_value.headers = {"content-type": "application/json"}
+    session.request.return_value.json.return_value = {"web_id": 1, "status": "save"}
+    session.request.return_value.content = b'{"web_id": 1, "status": "save"}'
+    session.request.return_value.ok = True
+    backend.get_campaign(CAMPAIGN_ID)
+
+    connect_timeout, read_timeout = session.request.call_args.kwargs["timeout"]
+    assert connect_timeout == 2
+    assert 2 < read_timeout <= 3
+
+
+def test_timeout_error(backend: MockMailchimpCampaignBackend, settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY = {"max_retries": 0}
+    backend.client.campaigns.get.side_effect = ApiClientError(Timeout())
+
+    with pytest.raises(CampaignBackendTimeout) as error:
+        backend.get_campaign(CAMPAIGN_ID)
+
+    assert error.match("Mailchimp took too long to respond")
+
+
+def test_timeout_budget_limits_retries(backend: MockMailchimpCampaignBackend, settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY = {"backoff": 10, "max_backoff": 10}
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS = {"get_campaign": 0.001}
+    backend.client.campaigns.get.side_effect = ApiClientError(Timeout())
+
+    with pytest.raises(CampaignBackendTimeout):
+        backend.get_campaign(CAMPAIGN_ID)
+
+    assert backend.client.campaigns.get.call_count == 1
+
+
 def test_no_api_key(settings):
     settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = None
     with pytest.raises(ImproperlyConfigured) as error:
@@ -69,12 +205,25 @@ def test_get_audiences(backend: MockMailchimpCampaignBackend):
             {"id": "be13e6ca91", "name": "Torchbox", "stats": {"member_count": 8}},
             {"id": "9af08f2afa", "name": "Other", "stats": {"member_count": 13}},
         ],
+        "total_items": 2,
     }
 
-    assert backend.get_audiences() == [
+    assert list(backend.get_audiences()) == [
         Audience(id="be13e6ca91", name="Torchbox", member_count=8),
         Audience(id="9af08f2afa", name="Other", member_count=13),
     ]
+    assert backend.client.lists.get_all_lists.mock_calls == [
+        call(
+            count=1000,
+            offset=0,
+            fields=[
+                "lists.id",
+                "lists.name",
+                "lists.stats.member_count",
+                "total_items",
+            ],
+        )
+    ]
 
 
 def test_get_audience_segments(backend: MockMailchimpCampaignBackend):
@@ -85,13 +234,88 @@ def test_get_audience_segments(backend: MockMailchimpCampaignBackend):
             {"id": 2103837, "member_count": 1, "name": "Segment Two"},
             {"id": 2103838, "member_count": 1, "name": "Segment Three"},
         ],
+        "total_items": 3,
     }
 
-    assert backend.get_audience_segments("be13e6ca91") == [
+    assert list(backend.get_audience_segments("be13e6ca91")) == [
         AudienceSegment(id="be13e6ca91/2103836", name="Segment One", member_count=3),
         AudienceSegment(id="be13e6ca91/2103837", name="Segment Two", member_count=1),
         AudienceSegment(id="be13e6ca91/2103838", name="Segment Three", member_count=1),
     ]
+    assert backend.client.lists.list_segments.mock_calls == [
+        call(
+            "be13e6ca91",
+            count=1000,
+            offset=0,
+            fields=[
+                "segments.id",
+                "segments.name",
+                "segments.member_count",
+                "total_items",
+            ],
+            type="saved",
+        )
+    ]
+
+
+def test_get_audience_segments_paginated(backend: MockMailchimpCampaignBackend):
+    def list_segments(audience_id, *, count, offset, **kwargs):
+        return {
+            "segments": [
+                {"id": i, "member_count": 1, "name": f"Segment {i}"}
+                for i in range(offset, min(offset + count, 25))
+            ],
+            "total_items": 25,
+        }
+
+    backend.client.lists.list_segments.side_effect = list_segments
+
+    segments = list(backend.get_audience_segments("be13e6ca91", count=10))
+    assert [segment.id for segment in segments] == [
+        f"be13e6ca91/{i}" for i in range(25)
+    ]
+    assert sorted(
+        mock_call.kwargs["offset"]
+        for mock_call in backend.client.lists.list_segments.mock_calls
+    ) == [0, 10, 20]
+
+
+def test_get_audience_segments_streamed(backend: MockMailchimpCampaignBackend):
+    later_pages = threading.Event()
+
+    def list_segments(audience_id, *, count, offset, **kwargs):
+        if offset > 0:
+            later_pages.wait(timeout=5)
+        return {
+            "segments": [
+                {"id": i, "member_count": 1, "name": f"Segment {i}"}
+                for i in range(offset, min(offset + count, 25))
+            ],
+            "total_items": 25,
+        }
+
+    backend.client.lists.list_segments.side_effect = list_segments
+
+    # The first page is available before the later ones are fetched
+    segments = backend.get_audience_segments("be13e6ca91", count=10)
+    assert next(segments).id == "be13e6ca91/0"
+    assert not later_pages.is_set()
+
+    later_pages.set()
+    assert len(list(segments)) == 24
+
+
+def test_get_audiences_paginated_error(backend: MockMailchimpCampaignBackend):
+    backend.client.lists.get_all_lists.side_effect = [
+        {"lists": [], "total_items": 1500},
+        ApiClientError("", 400),
+    ]
+
+    audiences = backend.get_audiences()
+    with pytest.raises(CampaignBackendError) as error:
+        list(audiences)
+
+    assert error.match("Error while fetching page")
 
 
 def test_get_audience_segments_list_not_found(backend: MockMailchimpCampaignBackend):
@@ -110,6 +334,74 @@ def test_get_audience_segments_api_error(backend: MockMailchimpCampaignBackend):
     assert error.match(r"Error while fetching audience segments")
 
 
+def test_get_audience(backend: MockMailchimpCampaignBackend):
+    backend.client.lists.get_list.return_value = {
+        "id": "be13e6ca91",
+        "name": "Torchbox",
+        "stats": {"member_count": 8},
+    }
+
+    assert backend.get_audience("be13e6ca91") == Audience(
+        id="be13e6ca91", name="Torchbox", member_count=8
+    )
+    assert backend.client.lists.get_list.mock_calls == [
+        call("be13e6ca91", fields=["id", "name", "stats.member_count"])
+    ]
+
+
+def test_get_audience_not_found(backend: MockMailchimpCampaignBackend):
+    backend.client.lists.get_list.side_effect = ApiClientError("", 404)
+
+    assert backend.get_audience("be13e6ca91") is None
+
+
+def test_get_audience_api_error(backend: MockMailchimpCampaignBackend):
+    backend.client.lists.get_list.side_effect = ApiClientError("", 400)
+
+    with pytest.raises(CampaignBackendError) as error:
+        backend.get_audience("be13e6ca91")
+
+    assert error.match(r"Error while fetching audience")
+
+
+def test_get_audience_segment(backend: MockMailchimpCampaignBackend):
+    backend.client.lists.get_segment.return_value = {
+        "id": 2103836,
+        "name": "Segment One",
+        "member_count": 3,
+        "type": "saved",
+    }
+
+    segment = backend.get_audience_segment("be13e6ca91", "be13e6ca91/2103836")
+
+    assert segment is not None
+    assert (segment.id, segment.name, segment.member_count) == (
+        "be13e6ca91/2103836",
+        "Segment One",
+        3,
+    )
+    assert backend.client.lists.get_segment.mock_calls == [
+        call("be13e6ca91", "2103836", fields=["id", "name", "member_count", "type"])
+    ]
+
+
+def test_get_audience_segment_not_saved(backend: MockMailchimpCampaignBackend):
+    backend.client.lists.get_segment.return_value = {
+        "id": 2103836,
+        "name": "Tag",
+        "member_count": 3,
+        "type": "static",
+    }
+
+    assert backend.get_audience_segment("be13e6ca91", "be13e6ca91/2103836") is None
+
+
+def test_get_audience_segment_not_found(backend: MockMailchimpCampaignBackend):
+    backend.client.lists.get_segment.side_effect = ApiClientError("", 404)
+
+    assert backend.get_audience_segment("be13e6ca91", "be13e6ca91/2103836") is None
+
+
 @pytest.mark.parametrize(
     "recipients_object,recipients_data",
     [
@@ -287,6 +579,83 @@ def test_update_campaign_handle_update_exception(backend: MockMailchimpCampaignB
     assert error.match(r"Error while updating campaign")
 
 
+def test_update_campaign_concurrently(backend: MockMailchimpCampaignBackend, settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_CONCURRENT_SAVE = True
+
+    campaign_id = backend.save_campaign(
+        campaign_id=CAMPAIGN_ID,
+        recipients=None,
+        subject=SUBJECT,
+        html=HTML,
+        from_name=FROM_NAME,
+        reply_to=REPLY_TO,
+    )
+    assert campaign_id == CAMPAIGN_ID
+    assert backend.client.campaigns.update.mock_calls == [call(CAMPAIGN_ID, ANY)]
+    assert backend.client.campaigns.set_content.mock_calls == [
+        call(CAMPAIGN_ID, {"html": HTML}),
+    ]
+
+
+def test_update_campaign_concurrently_not_found(
+    backend: MockMailchimpCampaignBackend, settings
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_CONCURRENT_SAVE = True
+    backend.client.campaigns.update.side_effect = ApiClientError("", 404)
+    backend.client.campaigns.set_content.side_effect = [
+        ApiClientError("", 404),
+        None,
+    ]
+    backend.client.campaigns.create.return_value = {"id": NEW_CAMPAIGN_ID}
+
+    campaign_id = backend.save_campaign(
+        campaign_id=CAMPAIGN_ID,
+        recipients=None,
+        subject=SUBJECT,
+        html=HTML,
+        from_name=FROM_NAME,
+        reply_to=REPLY_TO,
+    )
+    assert campaign_id == NEW_CAMPAIGN_ID
+    assert backend.client.campaigns.set_content.mock_calls == [
+        call(CAMPAIGN_ID, {"html": HTML}),
+        call(NEW_CAMPAIGN_ID, {"html": HTML}),
+    ]
+
+
+def test_update_campaign_concurrently_content_exception(
+    backend: MockMailchimpCampaignBackend, settings
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_CONCURRENT_SAVE = True
+    backend.client.campaigns.set_content.side_effect = ApiClientError("", 400)
+
+    with pytest.raises(CampaignBackendError) as error:
+        backend.save_campaign(
+            campaign_id=CAMPAIGN_ID,
+            recipients=None,
+            subject=SUBJECT,
+            html=HTML,
+            from_name=FROM_NAME,
+            reply_to=REPLY_TO,
+        )
+
+    assert error.match(r"Error while saving campaign content")
+
+
+def test_campaign_digest(backend: MockMailchimpCampaignBackend):
+    kwargs = {
+        "recipients": CustomRecipients(audience=LIST_ID),
+        "subject": SUBJECT,
+        "html": HTML,
+        "from_name": FROM_NAME,
+        "reply_to": REPLY_TO,
+    }
+    digest = backend.get_campaign_digest(**kwargs)
+    assert backend.get_campaign_digest(**kwargs) == digest
+    assert backend.get_campaign_digest(**{**kwargs, "html": "<p>other</p>"}) != digest
+    assert backend.get_campaign_digest(**{**kwargs, "recipients": None}) != digest
+
+
 @pytest.mark.parametrize(
     "data,is_scheduled,is_sent,url",
     [
@@ -323,7 +692,9 @@ def test_get_campaign(
     backend.client.api_client.server = WEB_SERVER
     campaign = backend.get_campaign(CAMPAIGN_ID)
     assert campaign is not None
-    assert backend.client.campaigns.get.mock_calls == [call(CAMPAIGN_ID)]
+    assert backend.client.campaigns.get.mock_calls == [
+        call(CAMPAIGN_ID, fields=["id", "web_id", "status"])
+    ]
     assert campaign.is_scheduled == is_scheduled
     assert campaign.is_sent == is_sent
     assert campaign.url == url
@@ -342,6 +713,86 @@ def test_get_campaign_handle_exception(backend: MockMailchimpCampaignBackend):
     assert error.match("Error while fetching campaign")
 
 
+@pytest.mark.parametrize("status_code", [None, 429, 503])
+def test_get_campaign_retries_transient_errors(
+    backend: MockMailchimpCampaignBackend, settings, status_code
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY = {"backoff": 0}
+    backend.client.campaigns.get.side_effect = [
+        ApiClientError("", status_code),
+        {"web_id": CAMPAIGN_WEB_ID, "status": "save"},
+    ]
+    campaign = backend.get_campaign(CAMPAIGN_ID)
+    assert campaign is not None
+    assert backend.client.campaigns.get.call_count == 2
+
+
+def test_get_campaign_gives_up_retrying(
+    backend: MockMailchimpCampaignBackend, settings
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY = {"backoff": 0, "max_retries": 2}
+    backend.client.campaigns.get.side_effect = ApiClientError("", 503)
+
+    with pytest.raises(CampaignBackendError) as error:
+        backend.get_campaign(CAMPAIGN_ID)
+
+    assert error.match("Error while fetching campaign")
+    assert backend.client.campaigns.get.call_count == 3
+
+
+def test_send_campaign_is_not_retried(backend: MockMailchimpCampaignBackend, settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY = {"backoff": 0}
+    backend.client.campaigns.send.side_effect = ApiClientError("", 503)
+
+    with pytest.raises(CampaignBackendError):
+        backend.send_campaign(CAMPAIGN_ID)
+
+    assert backend.client.campaigns.send.call_count == 1
+
+
+def test_circuit_breaker(backend: MockMailchimpCampaignBackend, settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY = {"max_retries": 0}
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_CIRCUIT_BREAKER = {"failure_threshold": 2}
+    backend.client.campaigns.get.side_effect = ApiClientError("", 503)
+
+    for _ in range(2):
+        with pytest.raises(CampaignBackendError) as error:
+            backend.get_campaign(CAMPAIGN_ID)
+        assert error.match("Error while fetching campaign")
+
+    with pytest.raises(CampaignBackendError) as error:
+        backend.get_campaign(CAMPAIGN_ID)
+
+    assert error.match("Mailchimp is not responding")
+    assert backend.client.campaigns.get.call_count == 2
+
+
+def test_circuit_breaker_ignores_client_errors(
+    backend: MockMailchimpCampaignBackend, settings
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_CIRCUIT_BREAKER = {"failure_threshold": 1}
+    backend.client.campaigns.get.side_effect = ApiClientError("", 400)
+
+    for _ in range(2):
+        with pytest.raises(CampaignBackendError) as error:
+            backend.get_campaign(CAMPAIGN_ID)
+        assert error.match("Error while fetching campaign")
+
+
+def test_circuit_breaker_ignores_concurrency_limit(
+    backend: MockMailchimpCampaignBackend,
+):
+    backend.circuit_breaker.record_failure()
+    backend.client.campaigns.send.side_effect = ApiClientError(
+        ConcurrencyLimitExceeded("No connection slot available")
+    )
+
+    with pytest.raises(CampaignBackendError):
+        backend.send_campaign(CAMPAIGN_ID)
+
+    assert backend.circuit_breaker.failures == 1
+
+
 @pytest.mark.parametrize("send_completed", [True, False])
 def test_campaign_report(backend: MockMailchimpCampaignBackend, send_completed: bool):
     backend.client.campaigns.get.return_value = {
@@ -371,6 +822,233 @@ def test_campaign_report(backend: MockMailchimpCampaignBackend, send_completed:
     assert campaign is not None
     report = campaign.get_report()
     assert report == expected
+    assert backend.client.reports.get_campaign_report.mock_calls == [
+        call(CAMPAIGN_ID, fields=backend.report_fields)
+    ]
+
+
+@pytest.mark.parametrize(
+    "age,timeout",
+    [
+        (timedelta(minutes=-5), 0),
+        (timedelta(minutes=5), 60),
+        (timedelta(hours=5), 600),
+        (timedelta(days=5), 6 * 60 * 60),
+        (timedelta(days=60), None),
+    ],
+)
+def test_report_cache_timeout(
+    backend: MockMailchimpCampaignBackend, age: timedelta, timeout
+):
+    report = {"send_time": datetime.now(timezone.utc) - age}
+    assert backend.report_cache_timeout(report) == timeout
+    assert backend.report_cache_timeout({}) == 0
+
+
+def test_report_cache_timeout_setting(settings, backend: MockMailchimpCampaignBackend):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_REPORT_CACHE_TIMEOUTS = [(60 * 60, 30)]
+    now = datetime.now(timezone.utc)
+    assert backend.report_cache_timeout({"send_time": now}) == 30
+    assert backend.report_cache_timeout({"send_time": now - timedelta(hours=2)}) is None
+
+
+@pytest.mark.parametrize("use_tz", [True, False])
+def test_report_cache_timeout_naive(
+    settings, backend: MockMailchimpCampaignBackend, use_tz: bool
+):
+    settings.USE_TZ = use_tz
+    aware_send_time = datetime.now(timezone.utc) - timedelta(minutes=5)
+    naive_send_time = django_timezone.make_naive(aware_send_time)
+
+    assert backend.report_cache_timeout({"send_time": aware_send_time}) == 60
+    assert backend.report_cache_timeout({"send_time": naive_send_time}) == 60
+
+
+def test_campaign_report_cached(backend: MockMailchimpCampaignBackend):
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "sent",
+    }
+    backend.client.reports.get_campaign_report.return_value = {
+        "emails_sent": 13,
+        "bounces": {"hard_bounces": 1, "soft_bounces": 2, "syntax_errors": 3},
+        "opens": {"unique_opens": 5},
+        "clicks": {"unique_clicks": 3},
+        "send_time": "2024-06-17T12:51:46+00:00",
+    }
+    campaign = backend.get_campaign(CAMPAIGN_ID)
+    assert campaign is not None
+
+    report = campaign.get_report()
+    assert campaign.get_report() == report
+    assert backend.client.reports.get_campaign_report.call_count == 1
+
+    backend.invalidate_cached_report(CAMPAIGN_ID)
+    assert campaign.get_report() == report
+    assert backend.client.reports.get_campaign_report.call_count == 2
+
+
+def test_campaign_report_not_cached_before_sending(
+    backend: MockMailchimpCampaignBackend,
+):
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "sending",
+    }
+    backend.client.reports.get_campaign_report.return_value = {
+        "emails_sent": 0,
+        "bounces": {},
+        "opens": {"unique_opens": 0},
+        "clicks": {"unique_clicks": 0},
+        "send_time": None,
+    }
+    campaign = backend.get_campaign(CAMPAIGN_ID)
+    assert campaign is not None
+
+    campaign.get_report()
+    campaign.get_report()
+    assert backend.client.reports.get_campaign_report.call_count == 2
+
+
+REPORT_DATA = {
+    "emails_sent": 13,
+    "bounces": {"hard_bounces": 1, "soft_bounces": 2, "syntax_errors": 3},
+    "opens": {"unique_opens": 5},
+    "clicks": {"unique_clicks": 3},
+    "send_time": "2024-06-17T12:51:46+00:00",
+}
+
+
+def slow(return_value, delay=0.2):
+    def side_effect(*args, **kwargs):
+        time.sleep(delay)
+        return return_value
+
+    return side_effect
+
+
+def test_campaign_with_report(backend: MockMailchimpCampaignBackend):
+    backend.client.campaigns.get.side_effect = slow(
+        {"web_id": CAMPAIGN_WEB_ID, "status": "sent"}
+    )
+    backend.client.reports.get_campaign_report.side_effect = slow(REPORT_DATA)
+
+    start = time.monotonic()
+    campaign, report = backend.get_campaign_with_report(CAMPAIGN_ID)
+
+    # Both requests are made at the same time
+    assert time.monotonic() - start < 0.35
+    assert campaign is not None and campaign.is_sent
+    assert report is not None and report["emails_sent"] == 13
+
+
+def test_campaign_with_report_draft(
+    backend: MockMailchimpCampaignBackend, caplog: pytest.LogCaptureFixture
+):
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "save",
+    }
+    backend.client.reports.get_campaign_report.side_effect = ApiClientError(
+        "Resource Not Found", 404
+    )
+
+    with caplog.at_level(logging.ERROR, "wagtail_newsletter"):
+        campaign, report = backend.get_campaign_with_report(CAMPAIGN_ID)
+
+    assert campaign is not None and not campaign.is_sent
+    assert report is None
+    # The report of a draft campaign is expected to be missing
+    assert caplog.records == []
+
+
+def test_campaign_with_report_without_report(backend: MockMailchimpCampaignBackend):
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "sent",
+    }
+
+    campaign, report = backend.get_campaign_with_report(CAMPAIGN_ID, with_report=False)
+
+    assert campaign is not None
+    assert report is None
+    backend.client.reports.get_campaign_report.assert_not_called()
+
+
+def test_campaign_with_report_error(backend: MockMailchimpCampaignBackend):
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "sent",
+    }
+    backend.client.reports.get_campaign_report.side_effect = ApiClientError("", 400)
+
+    with pytest.raises(CampaignBackendError) as error:
+        backend.get_campaign_with_report(CAMPAIGN_ID)
+
+    assert error.match("Error while fetching campaign report")
+
+
+def test_campaign_with_report_deadline(settings, backend: MockMailchimpCampaignBackend):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS = {"get_campaign_with_report": 0.1}
+    backend.client.campaigns.get.side_effect = slow(
+        {"web_id": CAMPAIGN_WEB_ID, "status": "sent"}, delay=0.05
+    )
+    backend.client.reports.get_campaign_report.side_effect = slow(
+        REPORT_DATA, delay=0.5
+    )
+
+    start = time.monotonic()
+    campaign, report = backend.get_campaign_with_report(CAMPAIGN_ID)
+
+    assert time.monotonic() - start < 0.4
+    # The campaign is still shown when its report is too slow
+    assert campaign is not None and campaign.is_sent
+    assert report is None
+    # Don't let the report fetched in the background leak into other tests
+    backend.executor.shutdown(wait=True)
+
+
+def test_campaign_with_report_busy_workers_share_deadline(
+    settings, backend: MockMailchimpCampaignBackend, monkeypatch: pytest.MonkeyPatch
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS = {"get_campaign_with_report": 1.0}
+    # A report that never gets a worker thread is fetched in the calling thread
+    monkeypatch.setattr(backend, "_submit", Mock(return_value=Future()))
+    backend.client.campaigns.get.side_effect = slow(
+        {"web_id": CAMPAIGN_WEB_ID, "status": "sent"}, delay=0.3
+    )
+    report_timeouts = []
+
+    def get_campaign_report(*args, **kwargs):
+        report_timeouts.append(request_timeout.get())
+        return REPORT_DATA
+
+    backend.client.reports.get_campaign_report.side_effect = get_campaign_report
+
+    campaign, report = backend.get_campaign_with_report(CAMPAIGN_ID)
+
+    assert report is not None
+    # The report only gets the time left after fetching the campaign
+    [(_, read_timeout)] = report_timeouts
+    assert read_timeout <= 0.7
+
+
+def test_campaign_with_report_out_of_time(
+    settings, backend: MockMailchimpCampaignBackend, monkeypatch: pytest.MonkeyPatch
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS = {"get_campaign_with_report": 0.1}
+    monkeypatch.setattr(backend, "_submit", Mock(return_value=Future()))
+    backend.client.campaigns.get.side_effect = slow(
+        {"web_id": CAMPAIGN_WEB_ID, "status": "sent"}, delay=0.15
+    )
+
+    campaign, report = backend.get_campaign_with_report(CAMPAIGN_ID)
+
+    assert campaign is not None
+    assert report is None
+    backend.client.reports.get_campaign_report.assert_not_called()
+    # Running out of time says nothing about Mailchimp's health
+    assert backend.circuit_breaker.allow_request()
 
 
 def test_campaign_report_handle_exception(backend: MockMailchimpCampaignBackend):
@@ -469,6 +1147,12 @@ def test_send_campaign_failure(backend: MockMailchimpCampaignBackend):
     assert error.match("Error while sending campaign")
 
 
+def test_send_campaign_not_found(backend: MockMailchimpCampaignBackend):
+    backend.client.campaigns.send.side_effect = ApiClientError("", 404)
+    with pytest.raises(CampaignNotFound):
+        backend.send_campaign(campaign_id=CAMPAIGN_ID)
+
+
 def test_schedule_campaign(backend: MockMailchimpCampaignBackend):
     backend.schedule_campaign(CAMPAIGN_ID, SCHEDULE_TIME)
     assert backend.client.campaigns.schedule.mock_calls == [
@@ -542,3 +1226,103 @@ def test_unschedule_campaign_failure(backend: MockMailchimpCampaignBackend):
         backend.unschedule_campaign(CAMPAIGN_ID)
 
     assert error.match("Error while unscheduling campaign")
+
+
+def test_get_campaigns(backend: MockMailchimpCampaignBackend):
+    def list_campaigns(*, count, offset, **kwargs):
+        return {
+            "campaigns": [
+                {"id": f"campaign-{i}", "web_id": i, "status": "sent"}
+                for i in range(offset, min(offset + count, 50))
+            ],
+            "total_items": 50,
+        }
+
+    backend.client.campaigns.list.side_effect = list_campaigns
+
+    def get_campaign(campaign_id, **kwargs):
+        if campaign_id != "campaign-42":
+            raise ApiClientError("", 404)
+        return {"id": campaign_id, "web_id": 42, "status": "sent"}
+
+    backend.client.campaigns.get.side_effect = get_campaign
+
+    campaigns = backend.get_campaigns(
+        ["campaign-3", "campaign-12", "campaign-42", "deleted"], 10
+    )
+    assert {
+        campaign_id: cast(MailchimpCampaign, campaign).web_id
+        for campaign_id, campaign in campaigns.items()
+    } == {"campaign-3": 3, "campaign-12": 12, "campaign-42": 42}
+    # Only the first pages are listed; the rest are fetched one by one
+    assert backend.client.campaigns.list.call_count == 2
+    assert backend.client.campaigns.get.call_count == 2
+    assert backend.client.campaigns.list.mock_calls[0] == call(
+        count=10,
+        offset=0,
+        sort_field="create_time",
+        sort_dir="DESC",
+        fields=[
+            "campaigns.id",
+            "campaigns.web_id",
+            "campaigns.status",
+            "total_items",
+        ],
+    )
+
+
+def test_get_campaigns_stops_when_all_found(backend: MockMailchimpCampaignBackend):
+    backend.client.campaigns.list.return_value = {
+        "campaigns": [{"id": CAMPAIGN_ID, "web_id": 1, "status": "save"}],
+        "total_items": 5000,
+    }
+
+    campaigns = backend.get_campaigns([CAMPAIGN_ID])
+    assert list(campaigns) == [CAMPAIGN_ID]
+    assert backend.client.campaigns.list.call_count == 1
+
+
+def test_get_campaigns_handle_exception(backend: MockMailchimpCampaignBackend):
+    backend.client.campaigns.list.side_effect = ApiClientError("", 400)
+
+    with pytest.raises(CampaignBackendError) as error:
+        backend.get_campaigns([CAMPAIGN_ID])
+
+    assert error.match("Error while fetching campaigns")
+
+
+def test_get_campaign_cached_with_webhooks(
+    settings, backend: MockMailchimpCampaignBackend
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_WEBHOOK_SECRET = "secret"  # noqa: S105
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "save",
+    }
+
+    backend.get_campaign(CAMPAIGN_ID)
+    backend.get_campaign(CAMPAIGN_ID)
+    assert backend.client.campaigns.get.call_count == 1
+
+    # Sending the campaign invalidates the cache
+    backend.send_campaign(CAMPAIGN_ID)
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "sending",
+    }
+    campaign = backend.get_campaign(CAMPAIGN_ID)
+    assert campaign is not None and campaign.is_sent
+    assert backend.client.campaigns.get.call_count == 2
+
+
+def test_get_campaign_not_cached_without_webhooks(
+    backend: MockMailchimpCampaignBackend,
+):
+    backend.client.campaigns.get.return_value = {
+        "web_id": CAMPAIGN_WEB_ID,
+        "status": "save",
+    }
+
+    backend.get_campaign(CAMPAIGN_ID)
+    backend.get_campaign(CAMPAIGN_ID)
+    assert backend.client.campaigns.get.call_count == 2
@@ -0,0 +1,171 @@
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+
+from django.core.cache import caches
+
+from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.campaign_backends.mailchimp import MailchimpCampaignBackend
+from wagtail_newsletter.test.mailchimp_server import FakeMailchimpServer, project
+from wagtail_newsletter.test.models import CustomRecipients
+
+
+@pytest.fixture
+def server():
+    with FakeMailchimpServer(seed=0) as server:
+        server.state.add_audience("Readers", member_count=120, segments=3)
+        yield server
+
+
+@pytest.fixture
+def backend(settings, server: FakeMailchimpServer):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY = (
+        "00000000000000000000000000000000-us13"
+    )
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_URL = server.url
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY = {"backoff": 0.01}
+    return MailchimpCampaignBackend()
+
+
+def test_project():
+    data = {
+        "lists": [
+            {"id": "a", "name": "A", "stats": {"member_count": 1, "open_rate": 0}},
+            {"id": "b", "name": "B", "stats": {"member_count": 2, "open_rate": 0}},
+        ],
+        "total_items": 2,
+    }
+    assert project(data, ["lists.id", "lists.stats.member_count", "total_items"]) == {
+        "lists": [
+            {"id": "a", "stats": {"member_count": 1}},
+            {"id": "b", "stats": {"member_count": 2}},
+        ],
+        "total_items": 2,
+    }
+
+
+def test_audiences(backend: MailchimpCampaignBackend, server: FakeMailchimpServer):
+    server.state.populate(audiences=4)
+
+    audiences = list(backend.get_audiences())
+    assert [audience.name for audience in audiences][:2] == ["Readers", "Audience 1"]
+    assert len(audiences) == 5
+
+    segments = list(backend.get_audience_segments(audiences[0].id, count=2))
+    assert [segment.member_count for segment in segments] == [60, 40, 30]
+    # One request for each page of segments
+    assert server.request_count == 1 + 2
+
+
+def test_single_audience_lookups(
+    backend: MailchimpCampaignBackend, server: FakeMailchimpServer
+):
+    audience = next(iter(server.state.audiences.values()))
+    segment = server.state.segments[audience["id"]][1]
+
+    found = backend.get_audience(audience["id"])
+    assert found is not None and found.name == "Readers"
+    found_segment = backend.get_audience_segment(
+        audience["id"], f"{audience['id']}/{segment['id']}"
+    )
+    assert found_segment is not None and found_segment.member_count == 40
+    assert server.request_count == 2
+
+    assert backend.get_audience("missing") is None
+    assert backend.get_audience_segment(audience["id"], "missing/0") is None
+
+
+def test_campaign_lifecycle(
+    backend: MailchimpCampaignBackend, server: FakeMailchimpServer
+):
+    audience = next(iter(server.state.audiences.values()))
+    recipients = CustomRecipients(audience=audience["id"])
+    campaign_id = backend.save_campaign(
+        recipients=recipients,
+        subject="Subject",
+        reply_to="reply@example.com",
+        from_name="Sender",
+        html="<p>Hello</p>",
+    )
+    assert server.state.content[campaign_id] == "<p>Hello</p>"
+
+    backend.send_test_email(campaign_id=campaign_id, email="test@example.com")
+    assert server.state.test_emails == [(campaign_id, ["test@example.com"])]
+
+    backend.schedule_campaign(
+        campaign_id, datetime(2030, 1, 1, 10, 15, tzinfo=timezone.utc)
+    )
+    campaign = backend.get_campaign(campaign_id)
+    assert campaign is not None and campaign.is_scheduled
+
+    backend.unschedule_campaign(campaign_id)
+    backend.send_campaign(campaign_id)
+    campaign = backend.get_campaigns([campaign_id])[campaign_id]
+    assert campaign.is_sent
+    assert campaign.get_report()["emails_sent"] == 120
+
+    with pytest.raises(CampaignBackendError):
+        backend.send_campaign(campaign_id)
+
+    assert backend.get_campaign("missing") is None
+
+
+def test_campaign_with_report_busy_workers(
+    settings, backend: MailchimpCampaignBackend, server: FakeMailchimpServer
+):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_WORKER_THREADS = 1
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS = {"get_campaign_with_report": 0.5}
+    audience = next(iter(server.state.audiences.values()))
+    campaign_ids = []
+    for _ in range(4):
+        campaign_id = backend.save_campaign(
+            recipients=CustomRecipients(audience=audience["id"]),
+            subject="Subject",
+            reply_to="reply@example.com",
+            from_name="Sender",
+            html="<p>Hello</p>",
+        )
+        backend.send_campaign(campaign_id)
+        campaign_ids.append(campaign_id)
+
+    # Reports queued behind busy worker threads are fetched in the calling thread
+    server.latency = 0.15
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(backend.get_campaign_with_report, campaign_ids))
+
+    assert all(report is not None for _, report in results)
+
+    # Reports that don't fit in the time left are left out, within the budget
+    caches["default"].clear()
+    server.latency = 0.3
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(backend.get_campaign_with_report, campaign_ids))
+
+    assert time.monotonic() - start < 0.7
+    assert all(campaign is not None for campaign, _ in results)
+    assert any(report is None for _, report in results)
+
+
+def test_retry_injected_errors(
+    backend: MailchimpCampaignBackend, server: FakeMailchimpServer
+):
+    server.rate_limit_rate = 1
+
+    with pytest.raises(CampaignBackendError):
+        list(backend.get_audiences())
+
+    # The first attempt, and two retries
+    assert server.request_count == 3
+
+    server.rate_limit_rate = 0
+    assert len(list(backend.get_audiences())) == 1
+
+
+def test_max_connections(server: FakeMailchimpServer):
+    server.max_connections = 0
+    assert not server.enter()
+    assert server.injected_error() is None
@@ -0,0 +1,65 @@
+from unittest.mock import patch
+
+import pytest
+
+from wagtail_newsletter.campaign_backends.resilience import (
+    CircuitBreaker,
+    backoff_delay,
+)
+
+
+@pytest.fixture
+def clock():
+    with patch("time.monotonic") as monotonic:
+        monotonic.return_value = 1000.0
+        yield monotonic
+
+
+def test_circuit_breaker_opens_after_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_circuit_breaker_success_resets_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.parametrize("trial_succeeds", [True, False])
+def test_circuit_breaker_half_open(clock, trial_succeeds):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    assert not breaker.allow_request()
+
+    clock.return_value += 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.allow_request()
+    # Only one trial request is allowed
+    assert not breaker.allow_request()
+
+    if trial_succeeds:
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.allow_request()
+
+    else:
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+
+
+def test_backoff_delay():
+    for attempt in range(10):
+        delay = backoff_delay(attempt, base=0.5, cap=4)
+        assert 0 <= delay <= min(4, 0.5 * 2**attempt)
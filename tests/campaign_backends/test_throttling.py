@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from wagtail_newsletter.campaign_backends.throttling import (
+    ConcurrencyLimiter,
+    ConcurrencyLimitExceeded,
+)
+
+
+def test_limit():
+    limiter = ConcurrencyLimiter("test-limiter", max_concurrent=2)
+
+    with limiter.limit():
+        with limiter.limit():
+            pass
+
+    assert limiter.get_metrics() == {
+        "acquired": 2,
+        "rejected": 0,
+        "waiting": 0,
+        "queue_length": 0,
+        "total_wait_time": 0.0,
+        "max_wait_time": 0.0,
+    }
+
+
+def test_limit_exceeded():
+    limiter = ConcurrencyLimiter(
+        "test-limiter", max_concurrent=1, max_wait=0.1, poll_interval=0.01
+    )
+
+    with limiter.limit():
+        # A second limiter with the same key, as if in another process
+        other = ConcurrencyLimiter(
+            "test-limiter", max_concurrent=1, max_wait=0.1, poll_interval=0.01
+        )
+        with pytest.raises(ConcurrencyLimitExceeded):
+            with other.limit():
+                pass
+
+    assert other.get_metrics()["rejected"] == 1
+
+    with other.limit():
+        pass
+
+
+def test_limit_max_wait():
+    limiter = ConcurrencyLimiter("test-limiter", max_concurrent=1, poll_interval=0.01)
+
+    with limiter.limit():
+        start = time.monotonic()
+        with pytest.raises(ConcurrencyLimitExceeded):
+            with limiter.limit(max_wait=0.05):
+                pass
+        assert time.monotonic() - start < 1
+
+
+def test_expired_slot_not_released():
+    limiter = ConcurrencyLimiter("test-limiter", max_concurrent=1)
+
+    with limiter.limit():
+        # The lease expired, and another process took the slot
+        limiter.cache.set(limiter.slot_key(0), "other-token")
+
+    assert limiter.cache.get(limiter.slot_key(0)) == "other-token"
+
+
+def test_slot_near_end_of_lease_not_released():
+    limiter = ConcurrencyLimiter(
+        "test-limiter", max_concurrent=1, lease=10, release_margin=10
+    )
+
+    with limiter.limit():
+        token = limiter.cache.get(limiter.slot_key(0))
+
+    # Left to expire, rather than checked and deleted
+    assert limiter.cache.get(limiter.slot_key(0)) == token
+
+
+def test_limit_waits_for_slot():
+    limiter = ConcurrencyLimiter("test-limiter", max_concurrent=1, poll_interval=0.01)
+    in_slot = threading.Event()
+    release = threading.Event()
+
+    def hold_slot():
+        with limiter.limit():
+            in_slot.set()
+            release.wait()
+
+    thread = threading.Thread(target=hold_slot)
+    thread.start()
+    in_slot.wait()
+
+    threading.Timer(0.1, release.set).start()
+    start = time.monotonic()
+    with limiter.limit():
+        assert time.monotonic() - start >= 0.05
+
+    thread.join()
+    metrics = limiter.get_metrics()
+    assert metrics["acquired"] == 2
+    assert metrics["max_wait_time"] >= 0.05
+    assert metrics["queue_length"] == 0
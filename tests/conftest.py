@@ -9,6 +9,21 @@ from wagtail_newsletter.audiences import Audience, AudienceSegment
 from wagtail_newsletter.campaign_backends import CampaignBackend
 
 
+def pytest_addoption(parser: pytest.Parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption(
+        "--newsletter-benchmark-json",
+        metavar="PATH",
+        help="Run the full benchmark suite and write the results to PATH.",
+    )
+    group.addoption(
+        "--newsletter-benchmark-rounds",
+        type=int,
+        default=20,
+        help="How many times to run each benchmark (with --newsletter-benchmark-json).",
+    )
+
+
 @pytest.fixture(autouse=True)
 def temporary_media_dir(settings, tmp_path: Path):
     settings.MEDIA_ROOT = tmp_path / "media"
@@ -5,13 +5,19 @@ from unittest.mock import Mock
 
 import pytest
 
+from django.contrib.auth.models import Permission
 from django.core.exceptions import ImproperlyConfigured
+from django.template import Context, Template
 from django.test import Client
 from django.urls import reverse
 from wagtail.models import Site
 
 from tests.conftest import MemoryCampaignBackend
-from wagtail_newsletter.campaign_backends import CampaignBackendError
+from wagtail_newsletter.campaign_backends import (
+    CampaignBackendError,
+    CampaignBackendTimeout,
+)
+from wagtail_newsletter.models import NewsletterCampaign
 from wagtail_newsletter.test.models import ArticlePage
 
 
@@ -102,6 +108,22 @@ def test_warn_backend_error(
     assert BACKEND_ERROR_TEXT in response.content.decode()
 
 
+def test_warn_backend_slow(admin_client: Client, memory_backend: MemoryCampaignBackend):
+    memory_backend.get_campaign = Mock(
+        side_effect=CampaignBackendTimeout(BACKEND_ERROR_TEXT)
+    )
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+
+    for _ in range(2):
+        response = admin_client.get(url)
+        assert "Testing is responding slowly." in response.content.decode()
+
+    # The slow state is cached, so the backend is only called once
+    assert memory_backend.get_campaign.call_count == 1
+
+
 @pytest.mark.parametrize("has_permission", [True, False])
 def test_campaign_report(
     admin_client: Client,
@@ -136,6 +158,240 @@ def test_campaign_report(
         assert re.search(r"<b>Emails sent:</b>\s*13 \(6 bounces\)", html)
         assert re.search(r"<b>Opens:</b>\s*5", html)
         assert re.search(r"<b>Clicks:</b>\s*3", html)
+        refresh_url = reverse(
+            "wagtail_newsletter:refresh_report", kwargs={"page_id": page.pk}
+        )
+        assert f'action="{refresh_url}"' in html
 
     else:
         assert "report" not in context
+
+
+def test_campaign_mirror(admin_client: Client, memory_backend: MemoryCampaignBackend):
+    memory_backend.get_campaign = Mock(
+        return_value=Mock(is_sent=True, is_scheduled=False, url=CAMPAIGN_URL)
+    )
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    admin_client.get(url)
+
+    mirror = NewsletterCampaign.objects.get(campaign_id=CAMPAIGN_ID)
+    assert mirror.page.pk == page.pk
+    assert mirror.is_sent
+    assert mirror.url == CAMPAIGN_URL
+    assert mirror.last_synced_at is not None
+
+    # The mirror is only written to when the campaign changes
+    admin_client.get(url)
+    assert NewsletterCampaign.objects.get().last_synced_at == mirror.last_synced_at
+
+    # The last known state is shown while the backend is unavailable
+    memory_backend.get_campaign = Mock(
+        side_effect=CampaignBackendError(BACKEND_ERROR_TEXT)
+    )
+    response = admin_client.get(url)
+    html = response.content.decode()
+    assert BACKEND_ERROR_TEXT in html
+    assert response.context["campaign"] == mirror
+    assert f'href="{CAMPAIGN_URL}"' in html
+
+
+def test_campaign_report_without_time_zones(
+    admin_client: Client, memory_backend: MemoryCampaignBackend, settings
+):
+    settings.USE_TZ = False
+    campaign = Mock(status="sent", is_sent=True, is_scheduled=False, url=CAMPAIGN_URL)
+    campaign.get_report.return_value = {
+        "bounces": 0,
+        "clicks": 0,
+        "emails_sent": 13,
+        "opens": 0,
+        "send_time": datetime(2024, 6, 17, 12, 51, 46, tzinfo=timezone.utc),
+    }
+    memory_backend.get_campaign = Mock(return_value=campaign)
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+
+    response = admin_client.get(url)
+    assert response.status_code == 200
+    mirror = NewsletterCampaign.objects.get(campaign_id=CAMPAIGN_ID)
+    assert mirror.send_time is not None and mirror.send_time.tzinfo is None
+
+
+@pytest.mark.parametrize("is_sent", [True, False])
+def test_campaign_status_block(is_sent: bool):
+    template = Template(
+        '{% extends "wagtail_newsletter/panels/newsletter_panel.html" %}'
+        "{% block campaign_status %}Custom status{% endblock %}"
+    )
+    campaign = Mock(
+        status="sent", is_sent=is_sent, is_scheduled=False, url=CAMPAIGN_URL
+    )
+
+    html = template.render(Context({"campaign": campaign, "backend_name": "Testing"}))
+
+    assert ("Custom status" in html) == is_sent
+    assert f'href="{CAMPAIGN_URL}"' in html
+
+
+@pytest.mark.parametrize("has_permission", [True, False])
+def test_refresh_report(
+    admin_client: Client,
+    memory_backend: MemoryCampaignBackend,
+    monkeypatch: pytest.MonkeyPatch,
+    has_permission: bool,
+):
+    monkeypatch.setattr(
+        ArticlePage, "has_newsletter_permission", Mock(return_value=has_permission)
+    )
+    memory_backend.invalidate_cached_report = Mock()
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+
+    url = reverse("wagtail_newsletter:refresh_report", kwargs={"page_id": page.pk})
+    assert admin_client.get(url).status_code == 405
+    response = admin_client.post(url)
+
+    if has_permission:
+        assert response.status_code == 302
+        assert response["Location"] == reverse(
+            "wagtailadmin_pages:edit", kwargs={"page_id": page.pk}
+        )
+        memory_backend.invalidate_cached_report.assert_called_once_with(CAMPAIGN_ID)
+
+    else:
+        # Wagtail redirects to the dashboard on `PermissionDenied`
+        assert response.status_code == 302
+        assert response["Location"] == reverse("wagtailadmin_home")
+        memory_backend.invalidate_cached_report.assert_not_called()
+
+
+def test_deferred_panel(
+    admin_client: Client, settings, memory_backend: MemoryCampaignBackend
+):
+    settings.WAGTAIL_NEWSLETTER_DEFERRED_PANEL = True
+    memory_backend.get_campaign = Mock()
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    response = admin_client.get(url)
+    html = response.content.decode()
+
+    campaign_url = reverse("wagtail_newsletter:campaign", kwargs={"page_id": page.pk})
+    assert f'data-wn-panel-campaign-url-value="{campaign_url}"' in html
+    assert "Loading campaign details from Testing" in html
+    memory_backend.get_campaign.assert_not_called()
+
+
+def test_campaign_view(admin_client: Client, memory_backend: MemoryCampaignBackend):
+    campaign = Mock(status="sent", is_sent=True, is_scheduled=False, url=CAMPAIGN_URL)
+    campaign.get_report.return_value = {
+        "bounces": 6,
+        "clicks": 3,
+        "emails_sent": 13,
+        "opens": 5,
+        "send_time": datetime(2024, 6, 17, 12, 51, 46, tzinfo=timezone.utc),
+    }
+    memory_backend.get_campaign = Mock(return_value=campaign)
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+
+    response = admin_client.get(
+        reverse("wagtail_newsletter:campaign", kwargs={"page_id": page.pk})
+    )
+    data = response.json()
+
+    assert data["campaign"] == {
+        "id": CAMPAIGN_ID,
+        "status": "sent",
+        "is_sent": True,
+        "is_scheduled": False,
+        "url": CAMPAIGN_URL,
+    }
+    assert data["report"]["emails_sent"] == 13
+    assert data["report"]["send_time"] == "2024-06-17T12:51:46Z"
+    assert data["error_message"] is None
+    assert re.search(r"<b>Status:</b>\s*sent", data["html"])
+    assert f'href="{CAMPAIGN_URL}"' in data["html"]
+
+
+def test_campaign_view_backend_error(
+    admin_client: Client, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.get_campaign = Mock(
+        side_effect=CampaignBackendError(BACKEND_ERROR_TEXT)
+    )
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+
+    response = admin_client.get(
+        reverse("wagtail_newsletter:campaign", kwargs={"page_id": page.pk})
+    )
+    data = response.json()
+
+    assert data["campaign"] is None
+    assert data["error_message"] == BACKEND_ERROR_TEXT
+    assert BACKEND_ERROR_TEXT in data["html"]
+
+
+def test_campaign_view_permission(
+    client: Client, django_user_model, memory_backend: MemoryCampaignBackend
+):
+    memory_backend.get_campaign = Mock()
+    user = django_user_model.objects.create_user(username="user")
+    user.user_permissions.add(
+        Permission.objects.get(
+            codename="access_admin", content_type__app_label="wagtailadmin"
+        )
+    )
+    client.force_login(user)
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+
+    response = client.get(
+        reverse("wagtail_newsletter:campaign", kwargs={"page_id": page.pk})
+    )
+
+    assert response.status_code == 302
+    memory_backend.get_campaign.assert_not_called()
+
+
+def test_campaign_view_without_newsletter_permissions(
+    admin_client: Client,
+    memory_backend: MemoryCampaignBackend,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        ArticlePage, "get_newsletter_permissions", Mock(return_value=set())
+    )
+    memory_backend.get_campaign = Mock()
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+
+    response = admin_client.get(
+        reverse("wagtail_newsletter:campaign", kwargs={"page_id": page.pk})
+    )
+
+    assert response.status_code == 302
+    memory_backend.get_campaign.assert_not_called()
+
+
+def test_campaign_view_not_a_newsletter_page(admin_client: Client):
+    page = Site.objects.get().root_page
+    response = admin_client.get(
+        reverse("wagtail_newsletter:campaign", kwargs={"page_id": page.pk})
+    )
+    assert response.status_code == 404
+
+
+def test_recipients_max_age(
+    admin_client: Client, settings, memory_backend: MemoryCampaignBackend
+):
+    settings.WAGTAIL_NEWSLETTER_CACHE_TIMEOUT = 120
+    page = ArticlePage(title="Page title")
+    Site.objects.get().root_page.add_child(instance=page)
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    response = admin_client.get(url)
+    assert 'data-wn-panel-recipients-max-age-value="120"' in response.content.decode()
@@ -0,0 +1,91 @@
+from unittest.mock import Mock
+
+import pytest
+
+from django.test import Client, RequestFactory
+from django.urls import reverse
+from wagtail.models import Site
+
+from wagtail_newsletter import permissions
+from wagtail_newsletter.test.models import ArticlePage
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def page():
+    page = ArticlePage(title="Test Article")
+    Site.objects.get().root_page.add_child(instance=page)
+    return page
+
+
+@pytest.fixture
+def has_newsletter_permission(monkeypatch: pytest.MonkeyPatch):
+    mock = Mock(side_effect=lambda user, action: action != "send_campaign")
+    monkeypatch.setattr(ArticlePage, "has_newsletter_permission", mock)
+    return mock
+
+
+def test_get_permissions(page: ArticlePage, admin_user, has_newsletter_permission):
+    request = RequestFactory().get("/")
+    request.user = admin_user
+
+    assert permissions.get_permissions(request, page) == {
+        "save_campaign",
+        "send_test_email",
+        "schedule_campaign",
+        "unschedule_campaign",
+        "get_report",
+    }
+    assert permissions.has_permission(request, page, "save_campaign")
+    assert not permissions.has_permission(request, page, "send_campaign")
+
+    # Permissions are evaluated once per request
+    assert has_newsletter_permission.call_count == len(permissions.NEWSLETTER_ACTIONS)
+
+
+def test_get_permissions_per_request(
+    page: ArticlePage, admin_user, has_newsletter_permission
+):
+    for _ in range(2):
+        request = RequestFactory().get("/")
+        request.user = admin_user
+        permissions.get_permissions(request, page)
+
+    assert has_newsletter_permission.call_count == 2 * len(
+        permissions.NEWSLETTER_ACTIONS
+    )
+
+
+def test_get_newsletter_permissions_override(
+    page: ArticlePage, admin_user, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(
+        ArticlePage,
+        "get_newsletter_permissions",
+        Mock(return_value=frozenset(["send_test_email"])),
+    )
+    request = RequestFactory().get("/")
+    request.user = admin_user
+
+    assert permissions.get_permissions(request, page) == {"send_test_email"}
+
+
+def test_edit_view_evaluates_permissions_once(
+    page: ArticlePage, admin_client: Client, has_newsletter_permission
+):
+    url = reverse("wagtailadmin_pages:edit", kwargs={"page_id": page.pk})
+    data = {
+        "title": page.title,
+        "slug": page.slug,
+        "newsletter-action": "send_campaign",
+    }
+    response = admin_client.post(url, data, follow=True)
+
+    assert "You do not have permission" in response.content.decode()
+    # Once for the action, and once for the panel of the page that the
+    # response is redirected to
+    assert has_newsletter_permission.call_count == 2 * len(
+        permissions.NEWSLETTER_ACTIONS
+    )
@@ -1,10 +1,15 @@
 import json
+import time
+
+from unittest.mock import Mock
 
 import pytest
 
 from django.core.exceptions import ValidationError
 from django.urls import reverse
+from django.utils.http import http_date
 
+from wagtail_newsletter import views
 from wagtail_newsletter.audiences import Audience, AudienceSegment
 from wagtail_newsletter.models import NewsletterRecipients
 from wagtail_newsletter.test.models import ArticlePage, CustomRecipients
@@ -87,3 +92,92 @@ def test_recipients_api(admin_client, monkeypatch: pytest.MonkeyPatch):
     assert response.status_code == 200
     body = json.loads(response.content)
     assert body == {"name": NAME, "member_count": MEMBER_COUNT}
+
+
+@pytest.mark.django_db
+def test_recipients_api_batch(admin_client, memory_backend: MemoryCampaignBackend):
+    memory_backend.add(
+        Audience(id="audience1", member_count=10),
+        [AudienceSegment(id="audience1/segment1", member_count=5)],
+    )
+    audience = CustomRecipients.objects.create(name="audience", audience="audience1")
+    segment = CustomRecipients.objects.create(
+        name="segment", audience="audience1", segment="audience1/segment1"
+    )
+    url = reverse("wagtail_newsletter:recipients")
+
+    response = admin_client.get(f"{url}?pk={audience.pk}&pk={segment.pk}&pk=0")
+
+    assert response.status_code == 200
+    # Recipients that don't exist are left out
+    assert json.loads(response.content) == {
+        str(audience.pk): {"name": "audience", "member_count": 10},
+        str(segment.pk): {"name": "segment", "member_count": 5},
+    }
+
+
+@pytest.mark.django_db
+def test_recipients_api_invalid_pk(admin_client):
+    url = reverse("wagtail_newsletter:recipients")
+    assert admin_client.get(f"{url}?pk=x&pk=y").status_code == 400
+    assert admin_client.get(f"{url}?pk=0").status_code == 404
+
+
+@pytest.mark.django_db
+def test_recipients_api_etag(
+    admin_client, memory_backend: MemoryCampaignBackend, monkeypatch
+):
+    audience = Audience(id="audience1", member_count=MEMBER_COUNT)
+    memory_backend.add(audience, [])
+    get_audience = Mock(side_effect=memory_backend.get_audience)
+    monkeypatch.setattr(memory_backend, "get_audience", get_audience)
+    recipients = CustomRecipients.objects.create(name=NAME, audience="audience1")
+    url = f"{reverse('wagtail_newsletter:recipients')}?pk={recipients.pk}"
+
+    response = admin_client.get(url)
+    etag = response["ETag"]
+    assert etag
+    assert response["Last-Modified"]
+    assert get_audience.call_count == 1
+
+    response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response["ETag"] == etag
+
+    response = admin_client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 1))
+    assert response.status_code == 304
+
+    # Conditional requests are answered from the cached audience
+    assert get_audience.call_count == 1
+
+    # The ETag changes with the member count
+    Audience.objects.adjust_cached_member_count("audience1", 1)
+    response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert json.loads(response.content)["member_count"] == MEMBER_COUNT + 1
+    assert response["ETag"] != etag
+
+    # And with the recipients
+    etag = response["ETag"]
+    CustomRecipients.objects.filter(pk=recipients.pk).update(name="renamed")
+    response = admin_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert get_audience.call_count == 1
+
+
+@pytest.mark.django_db
+def test_recipients_api_cache_control(
+    rf, admin_user, settings, memory_backend: MemoryCampaignBackend
+):
+    settings.WAGTAIL_NEWSLETTER_CACHE_TIMEOUT = 120
+    memory_backend.add(Audience(id="audience1", member_count=MEMBER_COUNT), [])
+    recipients = CustomRecipients.objects.create(name=NAME, audience="audience1")
+    request = rf.get("/", {"pk": recipients.pk})
+    request.user = admin_user
+
+    response = views.recipients(request)
+
+    # The Wagtail admin overrides this, but the view itself can be cached
+    assert set(response["Cache-Control"].split(", ")) == {"private", "max-age=120"}
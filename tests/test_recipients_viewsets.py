@@ -1,7 +1,8 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from django.core.cache import caches
 from django.urls import reverse
 
 from wagtail_newsletter.viewsets import Audience, AudienceSegment
@@ -51,6 +52,81 @@ def test_audience_get_instance_is_cached(backend):
     assert backend.get_audiences.call_count == 1
 
 
+def test_audience_cached_by_older_version():
+    caches["default"].set(
+        Audience.objects.cache_key("be13e6ca91"), {"name": "Old", "member_count": 1}
+    )
+    assert Audience.objects.get(pk="be13e6ca91").member_count == 8
+
+
+def test_audience_get_instance_single_lookup(backend):
+    backend.get_audiences = Mock()
+    backend.get_audience = Mock(
+        return_value=Audience(id="9af08f2afa", name="Other", member_count=13)
+    )
+    audience = Audience.objects.get(pk="9af08f2afa")
+    assert audience.member_count == 13
+    backend.get_audience.assert_called_once_with("9af08f2afa")
+    backend.get_audiences.assert_not_called()
+
+
+def test_audience_segment_get_instance_single_lookup(backend):
+    backend.get_audience_segments = Mock()
+    backend.get_audience_segment = Mock(
+        return_value=AudienceSegment(
+            id="be13e6ca91/2103837", name="Segment Two", member_count=1
+        )
+    )
+    segment = AudienceSegment.objects.get(pk="be13e6ca91/2103837")
+    assert segment.name == "Segment Two"
+    backend.get_audience_segment.assert_called_once_with(
+        "be13e6ca91", "be13e6ca91/2103837"
+    )
+    backend.get_audience_segments.assert_not_called()
+
+
+def test_audience_streamed_from_generator(backend):
+    audiences = backend.audiences
+    backend.get_audiences = Mock(side_effect=lambda: iter(audiences))
+    assert [audience.pk for audience in Audience.objects.all()] == [
+        "be13e6ca91",
+        "9af08f2afa",
+    ]
+    assert Audience.objects.get(pk="9af08f2afa").name == "Other"
+
+
+def test_audience_listing_is_cached(backend, settings):
+    settings.WAGTAIL_NEWSLETTER_CACHE_TIMEOUT = 123
+    backend.get_audiences = Mock(side_effect=backend.get_audiences)
+    backend.get_audience = Mock()
+    cache = caches["default"]
+    set_many = Mock(side_effect=cache.set_many)
+
+    with patch.object(cache, "set_many", set_many):
+        assert [audience.pk for audience in Audience.objects.filter()] == [
+            "be13e6ca91",
+            "9af08f2afa",
+        ]
+        assert [audience.pk for audience in Audience.objects.filter()] == [
+            "be13e6ca91",
+            "9af08f2afa",
+        ]
+
+    assert backend.get_audiences.call_count == 1
+    set_many.assert_called_once()
+    assert set_many.call_args.args[1] == 123
+    assert Audience.objects.get(pk="9af08f2afa").member_count == 13
+    backend.get_audience.assert_not_called()
+
+
+def test_audience_listing_member_count_adjusted(backend):
+    list(Audience.objects.filter())
+    Audience.objects.adjust_cached_member_count("9af08f2afa", 2)
+    backend.get_audiences = Mock()
+    assert [audience.member_count for audience in Audience.objects.filter()] == [8, 15]
+    assert Audience.objects.get(pk="9af08f2afa").member_count == 15
+
+
 def test_audience_get_deleted():
     with pytest.raises(Audience.DoesNotExist):
         Audience.objects.get(pk="deleted_audience")
@@ -82,6 +158,18 @@ def test_audience_segment_get_instance_is_cached(backend):
     assert backend.get_audience_segments.call_count == 1
 
 
+def test_audience_segment_listing_is_cached_per_audience(backend):
+    backend.get_audience_segments = Mock(side_effect=backend.get_audience_segments)
+    for _ in range(2):
+        assert [
+            segment.pk
+            for segment in AudienceSegment.objects.filter(audience="be13e6ca91")
+        ] == ["be13e6ca91/2103836", "be13e6ca91/2103837", "be13e6ca91/2103838"]
+        assert list(AudienceSegment.objects.filter(audience="9af08f2afa")) == []
+
+    assert backend.get_audience_segments.call_count == 2
+
+
 def test_audience_segment_get_deleted():
     with pytest.raises(AudienceSegment.DoesNotExist):
         AudienceSegment.objects.get(pk="be13e6ca91/deleted_segment")
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from wagtail_newsletter import tracing
+
+
+@pytest.fixture
+def exporter(settings) -> tracing.InMemorySpanExporter:
+    settings.WAGTAIL_NEWSLETTER_TRACE_EXPORTER = (
+        "wagtail_newsletter.tracing.InMemorySpanExporter"
+    )
+    return tracing.get_exporter()  # type: ignore
+
+
+def test_disabled():
+    assert tracing.get_exporter() is None
+
+    with tracing.span("test", size=1) as span:
+        span.set_attribute("hit", True)
+        assert tracing.get_current_span() is None
+
+
+def test_nested_spans(exporter: tracing.InMemorySpanExporter):
+    with tracing.span("outer", page_id=1) as outer:
+        with tracing.span("inner") as inner:
+            assert tracing.get_current_span() is inner
+
+        with pytest.raises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("boom")
+
+    assert [span.name for span in exporter.spans] == ["inner", "failing", "outer"]
+    assert outer.parent_id is None
+    assert outer.attributes == {"page_id": 1}
+    inner, failing, _ = exporter.spans
+    assert inner.parent_id == failing.parent_id == outer.span_id
+    assert inner.trace_id == outer.trace_id
+    assert failing.status == "error"
+    assert failing.error == "ValueError('boom')"
+    assert outer.duration >= inner.duration >= 0
+
+
+def test_traced(exporter: tracing.InMemorySpanExporter):
+    @tracing.traced("double")
+    def double(value):
+        return value * 2
+
+    assert double(2) == 4
+    assert [span.name for span in exporter.spans] == ["double"]
+
+
+def test_file_exporter(settings, tmp_path):
+    path = tmp_path / "traces.jsonl"
+    settings.WAGTAIL_NEWSLETTER_TRACE_EXPORTER = (
+        "wagtail_newsletter.tracing.FileSpanExporter"
+    )
+    settings.WAGTAIL_NEWSLETTER_TRACE_EXPORTER_OPTIONS = {"path": str(path)}
+
+    with tracing.span("outer"):
+        with tracing.span("inner", size=3):
+            pass
+
+    inner, outer = (json.loads(line) for line in path.read_text().splitlines())
+    assert inner["name"] == "inner"
+    assert inner["attributes"] == {"size": 3}
+    assert inner["parent_id"] == outer["span_id"]
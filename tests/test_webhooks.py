@@ -0,0 +1,162 @@
+import time
+
+from unittest.mock import Mock
+
+import pytest
+
+from django.core.cache import caches
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from wagtail.models import Site
+
+from wagtail_newsletter.audiences import Audience
+from wagtail_newsletter.campaign_backends.mailchimp import MailchimpCampaignBackend
+from wagtail_newsletter.models import NewsletterCampaign
+from wagtail_newsletter.test.models import ArticlePage
+
+from .conftest import MemoryCampaignBackend
+
+
+pytestmark = pytest.mark.django_db
+
+SECRET = "webhook-secret"  # noqa: S105
+CAMPAIGN_ID = "test-campaign-id"
+LIST_ID = "test-list-id"
+
+
+@pytest.fixture(autouse=True)
+def webhook_secret(settings):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_WEBHOOK_SECRET = SECRET
+
+
+@pytest.fixture
+def url():
+    return reverse("wagtail_newsletter_mailchimp_webhook", kwargs={"secret": SECRET})
+
+
+def test_validate_url(client: Client, url):
+    assert client.get(url).status_code == 200
+
+
+def test_wrong_secret(client: Client):
+    url = reverse("wagtail_newsletter_mailchimp_webhook", kwargs={"secret": "wrong"})
+    assert client.post(url, {"type": "subscribe"}).status_code == 404
+
+
+def test_disabled(client: Client, settings, url):
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_WEBHOOK_SECRET = None
+    assert client.get(url).status_code == 404
+
+
+def test_campaign_event(
+    client: Client, url, monkeypatch: pytest.MonkeyPatch, memory_backend
+):
+    backend = MailchimpCampaignBackend()
+    backend.client = Mock()  # type: ignore
+    backend.client.campaigns.get.return_value = {"web_id": 1, "status": "schedule"}
+    monkeypatch.setattr(
+        "wagtail_newsletter.campaign_backends.get_backend", lambda: backend
+    )
+
+    campaign = backend.get_campaign(CAMPAIGN_ID)
+    assert campaign is not None and campaign.is_scheduled
+
+    response = client.post(
+        url,
+        {
+            "type": "campaign",
+            "fired_at": "2024-08-10 16:30:00",
+            "data[id]": CAMPAIGN_ID,
+            "data[status]": "sent",
+            "data[list_id]": LIST_ID,
+        },
+    )
+    assert response.status_code == 200
+
+    # The status is read from the cache
+    campaign = backend.get_campaign(CAMPAIGN_ID)
+    assert campaign is not None and campaign.is_sent
+    assert backend.client.campaigns.get.call_count == 1
+
+
+def test_campaign_event_other_backend(
+    client: Client, url, memory_backend: MemoryCampaignBackend
+):
+    response = client.post(
+        url, {"type": "campaign", "data[id]": CAMPAIGN_ID, "data[status]": "sent"}
+    )
+    assert response.status_code == 200
+
+
+def test_campaign_event_updates_mirror(client: Client, url):
+    page = ArticlePage(title="Page title", newsletter_campaign=CAMPAIGN_ID)
+    Site.objects.get().root_page.add_child(instance=page)
+    NewsletterCampaign.objects.create(
+        campaign_id=CAMPAIGN_ID,
+        page=page,
+        status="schedule",
+        is_scheduled=True,
+        schedule_time=timezone.now(),
+    )
+
+    response = client.post(
+        url, {"type": "campaign", "data[id]": CAMPAIGN_ID, "data[status]": "sent"}
+    )
+    assert response.status_code == 200
+
+    mirror = NewsletterCampaign.objects.get(campaign_id=CAMPAIGN_ID)
+    assert mirror.status == "sent"
+    assert mirror.is_sent
+    assert not mirror.is_scheduled
+    assert mirror.schedule_time is None
+    assert mirror.last_synced_at is not None
+
+
+@pytest.mark.parametrize(
+    "event_type,member_count",
+    [("subscribe", 11), ("unsubscribe", 9), ("cleaned", 9), ("profile", 10)],
+)
+def test_list_events(
+    client: Client,
+    url,
+    memory_backend: MemoryCampaignBackend,
+    event_type,
+    member_count,
+):
+    memory_backend.add(Audience(id=LIST_ID, name="Readers", member_count=10), [])
+    assert Audience.objects.get(pk=LIST_ID).member_count == 10
+
+    response = client.post(url, {"type": event_type, "data[list_id]": LIST_ID})
+    assert response.status_code == 200
+
+    memory_backend.audiences.clear()
+    assert Audience.objects.get(pk=LIST_ID).member_count == member_count
+
+
+def test_list_events_keep_cache_expiry(
+    client: Client,
+    url,
+    settings,
+    monkeypatch: pytest.MonkeyPatch,
+    memory_backend: MemoryCampaignBackend,
+):
+    settings.WAGTAIL_NEWSLETTER_CACHE_TIMEOUT = 60
+    memory_backend.add(Audience(id=LIST_ID, name="Readers", member_count=10), [])
+    list(Audience.objects.filter())
+    start = time.time()
+
+    # A steady stream of events doesn't keep the cached count alive
+    for elapsed in [20, 40, 59]:
+        monkeypatch.setattr(time, "time", lambda elapsed=elapsed: start + elapsed)
+        client.post(url, {"type": "subscribe", "data[list_id]": LIST_ID})
+    assert Audience.objects.get(pk=LIST_ID).member_count == 13
+
+    monkeypatch.setattr(time, "time", lambda: start + 61)
+    assert Audience.objects.get(pk=LIST_ID).member_count == 10
+    assert [audience.member_count for audience in Audience.objects.filter()] == [10]
+
+
+def test_list_event_not_cached(client: Client, url):
+    client.post(url, {"type": "subscribe", "data[list_id]": LIST_ID})
+    assert caches["default"].get(Audience.objects.cache_key(LIST_ID)) is None
@@ -1,35 +1,67 @@
+from collections.abc import Callable
 from typing import cast
 
 from django.utils.formats import localize
 from wagtail.admin import messages
 from wagtail.log_actions import log
 
-from . import campaign_backends, forms
-from .models import NewsletterPageMixin
+from . import campaign_backends, forms, tracing
+from .models import NewsletterCampaign, NewsletterPageMixin
 
 
-def save_campaign(request, page: NewsletterPageMixin) -> None:
+@tracing.traced("newsletter.save_campaign")
+def save_campaign(
+    request, page: NewsletterPageMixin, *, skip_unchanged: bool = True
+) -> bool:
+    """
+    Save the latest revision of the page as a campaign. With `skip_unchanged`,
+    nothing is sent to the backend if the campaign is unchanged since it was last
+    saved. Returns `False` if the campaign couldn't be saved.
+    """
     backend = campaign_backends.get_backend()
     revision = page.latest_revision
-    version = cast(NewsletterPageMixin, revision.as_object())
+    with tracing.span("page.revision_as_object"):
+        version = cast(NewsletterPageMixin, revision.as_object())
     subject = version.get_newsletter_subject()
+    with tracing.span("page.get_newsletter_html") as span:
+        html = version.get_newsletter_html()
+        span.set_attribute("html_size", len(html))
+    campaign_data = {
+        "recipients": version.newsletter_recipients,
+        "subject": subject,
+        "html": html,
+        "from_name": version.get_newsletter_from_name(),
+        "reply_to": version.get_newsletter_reply_to(),
+    }
+    with tracing.span("backend.get_campaign_digest"):
+        digest = backend.get_campaign_digest(**campaign_data)
+
+    if (
+        skip_unchanged
+        and page.newsletter_campaign
+        and page.newsletter_campaign_digest == digest
+    ):
+        messages.info(
+            request,
+            f"Newsletter campaign {subject!r} is unchanged since it was last "
+            f"saved to {backend.name}",
+        )
+        return True
 
     try:
         campaign_id = backend.save_campaign(
             campaign_id=page.newsletter_campaign,
-            recipients=version.newsletter_recipients,
-            subject=subject,
-            html=version.get_newsletter_html(),
-            from_name=version.get_newsletter_from_name(),
-            reply_to=version.get_newsletter_reply_to(),
+            **campaign_data,
         )
 
     except campaign_backends.CampaignBackendError as error:
         messages.error(request, error.message)
-        return
+        return False
 
     page.newsletter_campaign = campaign_id
-    page.save(update_fields=["newsletter_campaign"])
+    page.newsletter_campaign_digest = digest
+    page.save(update_fields=["newsletter_campaign", "newsletter_campaign_digest"])
+    NewsletterCampaign.record_push(page, campaign_id, revision)
 
     log(
         page,
@@ -42,8 +74,33 @@ def save_campaign(request, page: NewsletterPageMixin) -> None:
     messages.success(
         request, f"Newsletter campaign {subject!r} has been saved to {backend.name}"
     )
+    return True
+
+
+def _with_saved_campaign(
+    request, page: NewsletterPageMixin, func: "Callable[[str], None]"
+) -> None:
+    """
+    Save the campaign, unless it's unchanged, and call `func` with its ID. The
+    digest of the last save doesn't tell us whether the campaign still exists in
+    the backend, so if it turns out to have been deleted there, save it in full,
+    which recreates it, and call `func` again.
+    """
+    save_campaign(request, page)
+
+    try:
+        func(page.newsletter_campaign)
+
+    except campaign_backends.CampaignNotFound:
+        page.newsletter_campaign_digest = ""
+        page.save(update_fields=["newsletter_campaign_digest"])
+        if not save_campaign(request, page, skip_unchanged=False):
+            raise
 
+        func(page.newsletter_campaign)
 
+
+@tracing.traced("newsletter.send_test_email")
 def send_test_email(request, page: NewsletterPageMixin) -> None:
     form = forms.SendTestEmailForm(request.POST, prefix="newsletter-test")
     if not form.is_valid():
@@ -54,14 +111,15 @@ def send_test_email(request, page: NewsletterPageMixin) -> None:
 
     email = form.cleaned_data["email"]
 
-    save_campaign(request, page)
-
     backend = campaign_backends.get_backend()
 
     try:
-        backend.send_test_email(
-            campaign_id=page.newsletter_campaign,
-            email=email,
+        _with_saved_campaign(
+            request,
+            page,
+            lambda campaign_id: backend.send_test_email(
+                campaign_id=campaign_id, email=email
+            ),
         )
 
     except campaign_backends.CampaignBackendError as error:
@@ -73,23 +131,27 @@ def send_test_email(request, page: NewsletterPageMixin) -> None:
     messages.success(request, f"Test message sent to {email!r}")
 
 
+@tracing.traced("newsletter.send_campaign")
 def send_campaign(request, page: NewsletterPageMixin) -> None:
-    save_campaign(request, page)
-
     backend = campaign_backends.get_backend()
 
     try:
-        backend.send_campaign(page.newsletter_campaign)
+        _with_saved_campaign(request, page, backend.send_campaign)
 
     except campaign_backends.CampaignBackendError as error:
         messages.error(request, error.message)
         return
 
+    NewsletterCampaign.update_status(
+        page.newsletter_campaign, NewsletterCampaign.SENDING
+    )
+
     log(page, "wagtail_newsletter.send_campaign")
 
     messages.success(request, "Newsletter campaign is now sending")
 
 
+@tracing.traced("newsletter.schedule_campaign")
 def schedule_campaign(request, page: NewsletterPageMixin) -> None:
     form = forms.ScheduleCampaignForm(request.POST, prefix="newsletter-schedule")
     if not form.is_valid():
@@ -108,18 +170,25 @@ def schedule_campaign(request, page: NewsletterPageMixin) -> None:
         messages.error(request, error.message)
         return
 
-    save_campaign(request, page)
-
     try:
-        backend.schedule_campaign(
-            campaign_id=page.newsletter_campaign,
-            schedule_time=schedule_time,
+        _with_saved_campaign(
+            request,
+            page,
+            lambda campaign_id: backend.schedule_campaign(
+                campaign_id=campaign_id, schedule_time=schedule_time
+            ),
         )
 
     except campaign_backends.CampaignBackendError as error:
         messages.error(request, error.message)
         return
 
+    NewsletterCampaign.update_status(
+        page.newsletter_campaign,
+        NewsletterCampaign.SCHEDULED,
+        schedule_time=schedule_time,
+    )
+
     log(
         page,
         "wagtail_newsletter.schedule_campaign",
@@ -128,3 +197,17 @@ def schedule_campaign(request, page: NewsletterPageMixin) -> None:
 
     when = f"{localize(schedule_time)} {schedule_time.tzname()}"
     messages.success(request, f"Campaign scheduled to send at {when}")
+
+
+def run_action(request, page: NewsletterPageMixin, action: str) -> None:
+    if action == "save_campaign":
+        save_campaign(request, page, skip_unchanged=False)
+
+    if action == "send_test_email":
+        send_test_email(request, page)
+
+    if action == "send_campaign":
+        send_campaign(request, page)
+
+    if action == "schedule_campaign":
+        schedule_campaign(request, page)
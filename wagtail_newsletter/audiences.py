@@ -1,26 +1,60 @@
+import time
+
 from abc import abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Iterable
+from typing import Any, Generic, NamedTuple, Optional, TypeVar
 
 from django.conf import settings
 from django.core.cache import caches
 from django.core.exceptions import ObjectDoesNotExist
 from queryish import Queryish, VirtualModel
 
-from . import campaign_backends
+from . import campaign_backends, tracing
 
 
 T = TypeVar("T", bound="AudienceBase")
 
 
+class CacheEntry(NamedTuple):
+    """
+    Cached value, along with its expiry time (a timestamp, or `None` if it
+    doesn't expire), so that it can be updated without extending its lifetime,
+    and the time it was last updated, which clients can revalidate against.
+    """
+
+    value: Any
+    expires_at: Optional[float]
+    updated_at: float = 0.0
+
+    @classmethod
+    def create(cls, value, timeout: Optional[float]) -> "CacheEntry":
+        now = time.time()
+        return cls(value, None if timeout is None else now + timeout, now)
+
+    def remaining_timeout(self) -> Optional[float]:
+        if self.expires_at is None:
+            return None
+        return self.expires_at - time.time()
+
+
 class CachedApiQueryish(Queryish, Generic[T]):
     cache_prefix: str
 
     @abstractmethod
-    def get_list(self) -> "dict[str, T]": ...
+    def get_list(self) -> "Iterable[T]":
+        """Return all items. May be a generator, to stream paginated results."""
 
     def cache_key(self, pk):
         return f"{self.cache_prefix}{pk}"
 
+    def list_cache_key(self):
+        return f"{self.cache_prefix}list"
+
+    def get_cached(self, cache_key) -> Optional[CacheEntry]:
+        entry = caches["default"].get(cache_key)
+        # Entries written by older versions are plain values
+        return entry if isinstance(entry, CacheEntry) else None
+
     def get_instance(self, pk, **kwargs):
         return self.model(id=pk, **kwargs)  # type: ignore
 
@@ -28,42 +62,112 @@ class CachedApiQueryish(Queryish, Generic[T]):
         return dict(self.filters)
 
     def get_detail(self, pk) -> T:
-        instance = self.get_list().get(pk, None)
-        if instance is None:
-            raise self.model.DoesNotExist  # type: ignore
-        return instance
+        for instance in self.get_list():
+            if instance.id == pk:
+                return instance
+        raise self.model.DoesNotExist  # type: ignore
 
     def run_query(self):
         cache = caches["default"]
+        timeout = getattr(settings, "WAGTAIL_NEWSLETTER_CACHE_TIMEOUT", 300)
         filters = self.parse_filters()
         if set(filters) == {"pk"}:
             pk = filters["pk"]
             cache_key = self.cache_key(pk)
-            kwargs = cache.get(cache_key)
-            if kwargs is None:
-                kwargs = self.get_detail(pk).to_json()
-                timeout = getattr(settings, "WAGTAIL_NEWSLETTER_CACHE_TIMEOUT", 300)
-                cache.set(cache_key, kwargs, timeout)
-            yield self.get_instance(pk, **kwargs)
+            with tracing.span("audiences.get", cache_key=cache_key) as span:
+                entry = self.get_cached(cache_key)
+                span.set_attribute("cache_hit", entry is not None)
+                if entry is None:
+                    entry = CacheEntry.create(self.get_detail(pk).to_json(), timeout)
+                    cache.set(cache_key, entry, timeout)
+            yield self.get_instance(pk, **entry.value)
             return
 
         if filters:
             raise RuntimeError(f"Filters not supported: {filters!r}")
 
-        for pk, value in self.get_list().items():
-            cache.set(self.cache_key(pk), value.to_json())
+        list_cache_key = self.list_cache_key()
+        with tracing.span("audiences.list", cache_key=list_cache_key) as span:
+            entry = self.get_cached(list_cache_key)
+            span.set_attribute("cache_hit", entry is not None)
+
+        if entry is not None:
+            for pk, kwargs in entry.value:
+                yield self.get_instance(pk, **kwargs)
+            return
+
+        items = []
+        for value in self.get_list():
+            items.append((value.id, value.to_json()))
             yield value
 
+        # Cache the listing, and each item for lookups by pk, in one round-trip
+        cache.set_many(
+            {
+                list_cache_key: CacheEntry.create(items, timeout),
+                **{
+                    self.cache_key(pk): CacheEntry.create(kwargs, timeout)
+                    for pk, kwargs in items
+                },
+            },
+            timeout,
+        )
+
 
 class AudienceQuerySet(CachedApiQueryish):
     cache_prefix = "wagtail-newsletter-audience-"
 
     def get_list(self):
-        return {
-            audience.id: audience
-            for audience in campaign_backends.get_backend().get_audiences()
+        return campaign_backends.get_backend().get_audiences()
+
+    def get_detail(self, pk):
+        audience = campaign_backends.get_backend().get_audience(pk)
+        if audience is None:
+            raise Audience.DoesNotExist
+        return audience
+
+    def adjust_cached_member_count(self, audience_id: str, delta: int) -> None:
+        """
+        Update the cached member count of an audience, e.g. when notified of a
+        subscription. Audiences that are not cached are left alone. The cached
+        entries keep their expiry time, so that the approximate count is still
+        refreshed from the backend regularly.
+        """
+        cache = caches["default"]
+        cache_key = self.cache_key(audience_id)
+        list_cache_key = self.list_cache_key()
+        cached: dict[str, CacheEntry] = {
+            key: entry
+            for key, entry in cache.get_many([cache_key, list_cache_key]).items()
+            if isinstance(entry, CacheEntry)
         }
 
+        items = [cached[cache_key].value] if cache_key in cached else []
+        if list_cache_key in cached:
+            items += [
+                kwargs
+                for pk, kwargs in cached[list_cache_key].value
+                if pk == audience_id
+            ]
+        if not items:
+            return
+
+        for kwargs in items:
+            kwargs["member_count"] = max(kwargs["member_count"] + delta, 0)
+
+        # Entries written together expire together, and are updated in one
+        # round-trip.
+        now = time.time()
+        by_expiry: dict[Optional[float], dict[str, CacheEntry]] = {}
+        for key, entry in cached.items():
+            by_expiry.setdefault(entry.expires_at, {})[key] = entry._replace(
+                updated_at=now
+            )
+        for entries in by_expiry.values():
+            timeout = next(iter(entries.values())).remaining_timeout()
+            if timeout is None or timeout > 0:
+                cache.set_many(entries, timeout)
+
 
 class AudienceSegmentQuerySet(CachedApiQueryish):
     cache_prefix = "wagtail-newsletter-audience-segment-"
@@ -80,18 +184,29 @@ class AudienceSegmentQuerySet(CachedApiQueryish):
 
         return filters
 
+    def list_cache_key(self):
+        return f"{self.cache_prefix}list-{self.audience_id}"
+
     def get_list(self):
         if self.audience_id is None:
-            return {}
+            return []
 
         backend = campaign_backends.get_backend()
         try:
-            segments = backend.get_audience_segments(self.audience_id)
+            return backend.get_audience_segments(self.audience_id)
         except Audience.DoesNotExist:
-            return {}
+            return []
 
-        else:
-            return {segment.id: segment for segment in segments}
+    def get_detail(self, pk):
+        if self.audience_id is None:
+            raise AudienceSegment.DoesNotExist
+
+        segment = campaign_backends.get_backend().get_audience_segment(
+            self.audience_id, pk
+        )
+        if segment is None:
+            raise AudienceSegment.DoesNotExist
+        return segment
 
 
 class AudienceBase(VirtualModel):
@@ -1,11 +1,21 @@
+import asyncio
+import hashlib
+import json
+import threading
+
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any, Optional
 
+from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 from django.utils.module_loading import import_string
 
 from .. import audiences, models
+from .instrumentation import instrument
 
 
 DEFAULT_CAMPAIGN_BACKEND = (
@@ -13,7 +23,20 @@ DEFAULT_CAMPAIGN_BACKEND = (
 )
 
 
+def _instrument_methods(cls):
+    for name in cls.instrumented_methods:
+        if name in vars(cls):
+            setattr(cls, name, instrument(vars(cls)[name]))
+
+
 class Campaign(ABC):
+    # Methods that send the `campaign_backend_call` signal when called
+    instrumented_methods = ["get_report"]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _instrument_methods(cls)
+
     @property
     @abstractmethod
     def is_scheduled(self) -> bool: ...
@@ -33,13 +56,67 @@ class Campaign(ABC):
 class CampaignBackend(ABC):
     name: str
 
+    # Methods that send the `campaign_backend_call` signal when called
+    instrumented_methods = [
+        "get_audiences",
+        "get_audience",
+        "get_audience_segments",
+        "get_audience_segment",
+        "save_campaign",
+        "get_campaign",
+        "get_campaign_with_report",
+        "get_campaigns",
+        "send_test_email",
+        "send_campaign",
+        "schedule_campaign",
+        "unschedule_campaign",
+    ]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _instrument_methods(cls)
+
+    def prepare(self) -> None:  # noqa: B027
+        """
+        Set up resources shared by all threads using this instance, such as API
+        clients. `get_backend()` calls this once, before handing the instance
+        out. Override in subclass if backend has such resources.
+        """
+        pass
+
     @abstractmethod
-    def get_audiences(self) -> "list[audiences.Audience]": ...
+    def get_audiences(self) -> "Iterable[audiences.Audience]": ...
+
+    def get_audience(self, audience_id: str) -> "Optional[audiences.Audience]":
+        """
+        Fetch a single audience, or `None` if it doesn't exist. Backends should
+        override this if they can fetch an audience without listing them all.
+        """
+        for audience in self.get_audiences():
+            if audience.id == audience_id:
+                return audience
+        return None
 
     @abstractmethod
     def get_audience_segments(
         self, audience_id
-    ) -> "list[audiences.AudienceSegment]": ...
+    ) -> "Iterable[audiences.AudienceSegment]": ...
+
+    def get_audience_segment(
+        self, audience_id: str, segment_id: str
+    ) -> "Optional[audiences.AudienceSegment]":
+        """
+        Fetch a single segment of an audience, by the `id` returned by
+        `get_audience_segments`, or `None` if it doesn't exist. Backends should
+        override this if they can fetch a segment without listing them all.
+        """
+        try:
+            for segment in self.get_audience_segments(audience_id):
+                if segment.id == segment_id:
+                    return segment
+        except audiences.Audience.DoesNotExist:
+            pass
+        return None
 
     @abstractmethod
     def save_campaign(
@@ -53,9 +130,63 @@ class CampaignBackend(ABC):
         reply_to: str,
     ) -> str: ...
 
+    def get_campaign_digest(
+        self,
+        *,
+        recipients: "Optional[models.NewsletterRecipientsBase]",
+        subject: str,
+        html: str,
+        from_name: str,
+        reply_to: str,
+    ) -> str:
+        """
+        Return a digest of everything `save_campaign` would send to the backend
+        for these arguments. If it matches the digest of the last save, the save
+        can be skipped.
+        """
+        data = {
+            "recipients": (
+                [recipients.audience, recipients.segment] if recipients else None
+            ),
+            "subject": subject,
+            "from_name": from_name,
+            "reply_to": reply_to,
+            "html": html,
+        }
+        return hashlib.sha256(
+            json.dumps(data, sort_keys=True).encode(), usedforsecurity=False
+        ).hexdigest()
+
     @abstractmethod
     def get_campaign(self, campaign_id: str) -> Optional[Campaign]: ...
 
+    def get_campaign_with_report(
+        self, campaign_id: str, *, with_report: bool = True
+    ) -> "tuple[Optional[Campaign], Optional[dict[str, Any]]]":
+        """
+        Fetch a campaign and, if `with_report` and the campaign is sent or
+        scheduled, its report. Backends should override this if they can fetch
+        both at the same time.
+        """
+        campaign = self.get_campaign(campaign_id)
+        if campaign is None or not (campaign.is_sent or campaign.is_scheduled):
+            return campaign, None
+
+        return campaign, campaign.get_report() if with_report else None
+
+    def get_campaigns(self, campaign_ids: "Iterable[str]") -> "dict[str, Campaign]":
+        """
+        Fetch several campaigns, returning a mapping of campaign IDs to campaigns.
+        Campaigns that don't exist are left out. Backends should override this if
+        they can fetch campaigns in bulk.
+        """
+        campaigns = {}
+        for campaign_id in campaign_ids:
+            campaign = self.get_campaign(campaign_id)
+            if campaign is not None:
+                campaigns[campaign_id] = campaign
+        return campaigns
+
     @abstractmethod
     def send_test_email(self, *, campaign_id: str, email: str) -> None: ...
 
@@ -72,14 +203,259 @@ class CampaignBackend(ABC):
     @abstractmethod
     def unschedule_campaign(self, campaign_id: str) -> None: ...
 
+    def invalidate_cached_report(self, campaign_id: str) -> None:  # noqa: B027
+        """
+        Discard the cached report of a campaign, so that it's fetched again. Override
+        in subclass if backend caches reports.
+        """
+        pass
 
-def get_backend() -> CampaignBackend:
-    backend_class = import_string(
-        getattr(
-            settings, "WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND", DEFAULT_CAMPAIGN_BACKEND
+
+class AsyncCampaignBackend(ABC):
+    """
+    Asynchronous counterpart of `CampaignBackend`, for use from async views and
+    tasks. Campaign objects returned by `get_campaign` are the same as for sync
+    backends; use `get_report(campaign)` to fetch their report without blocking.
+    """
+
+    name: str
+
+    def prepare(self) -> None:  # noqa: B027
+        """See `CampaignBackend.prepare`."""
+        pass
+
+    @abstractmethod
+    async def get_audiences(self) -> "Iterable[audiences.Audience]": ...
+
+    @abstractmethod
+    async def get_audience_segments(
+        self, audience_id
+    ) -> "Iterable[audiences.AudienceSegment]": ...
+
+    @abstractmethod
+    async def save_campaign(
+        self,
+        *,
+        campaign_id: Optional[str] = None,
+        recipients: "Optional[models.NewsletterRecipientsBase]",
+        subject: str,
+        html: str,
+        from_name: str,
+        reply_to: str,
+    ) -> str: ...
+
+    @abstractmethod
+    async def get_campaign(self, campaign_id: str) -> Optional[Campaign]: ...
+
+    async def get_campaigns(
+        self, campaign_ids: "Iterable[str]"
+    ) -> "dict[str, Campaign]":
+        campaign_ids = list(campaign_ids)
+        campaigns = await asyncio.gather(
+            *(self.get_campaign(campaign_id) for campaign_id in campaign_ids)
+        )
+        return {
+            campaign_id: campaign
+            for campaign_id, campaign in zip(campaign_ids, campaigns, strict=True)
+            if campaign is not None
+        }
+
+    @abstractmethod
+    async def get_report(self, campaign: Campaign) -> "dict[str, Any]": ...
+
+    @abstractmethod
+    async def send_test_email(self, *, campaign_id: str, email: str) -> None: ...
+
+    @abstractmethod
+    async def send_campaign(self, campaign_id: str) -> None: ...
+
+    def validate_schedule_time(self, schedule_time: datetime) -> None:  # noqa: B027
+        """Validate schedule time. Override in subclass if backend has restrictions."""
+        pass
+
+    @abstractmethod
+    async def schedule_campaign(
+        self, campaign_id: str, schedule_time: datetime
+    ) -> None: ...
+
+    @abstractmethod
+    async def unschedule_campaign(self, campaign_id: str) -> None: ...
+
+
+class SyncToAsyncCampaignBackend(AsyncCampaignBackend):
+    """
+    Expose a sync `CampaignBackend` as an `AsyncCampaignBackend`. Each call runs
+    in a worker thread, so many calls can be in flight at the same time.
+    """
+
+    backend_class: "type[CampaignBackend]"
+
+    def __init__(self, backend: Optional[CampaignBackend] = None):
+        self.backend = backend if backend is not None else self.backend_class()
+
+    @property
+    def name(self) -> str:  # type: ignore
+        return self.backend.name
+
+    def prepare(self):
+        self.backend.prepare()
+
+    def _run(self, func, *args, **kwargs):
+        return sync_to_async(func, thread_sensitive=False)(*args, **kwargs)
+
+    async def get_audiences(self):
+        # Listings may be generators that fetch their pages as they are
+        # iterated, so they are consumed in the worker thread, not the event loop.
+        return await self._run(lambda: list(self.backend.get_audiences()))
+
+    async def get_audience_segments(self, audience_id):
+        return await self._run(
+            lambda: list(self.backend.get_audience_segments(audience_id))
         )
+
+    async def save_campaign(self, **kwargs):
+        return await self._run(self.backend.save_campaign, **kwargs)
+
+    async def get_campaign(self, campaign_id):
+        return await self._run(self.backend.get_campaign, campaign_id)
+
+    async def get_campaigns(self, campaign_ids):
+        return await self._run(self.backend.get_campaigns, campaign_ids)
+
+    async def get_report(self, campaign):
+        return await self._run(campaign.get_report)
+
+    async def send_test_email(self, *, campaign_id, email):
+        return await self._run(
+            self.backend.send_test_email, campaign_id=campaign_id, email=email
+        )
+
+    async def send_campaign(self, campaign_id):
+        return await self._run(self.backend.send_campaign, campaign_id)
+
+    def validate_schedule_time(self, schedule_time):
+        self.backend.validate_schedule_time(schedule_time)
+
+    async def schedule_campaign(self, campaign_id, schedule_time):
+        return await self._run(
+            self.backend.schedule_campaign, campaign_id, schedule_time
+        )
+
+    async def unschedule_campaign(self, campaign_id):
+        return await self._run(self.backend.unschedule_campaign, campaign_id)
+
+
+class AsyncToSyncCampaignBackend(CampaignBackend):
+    """
+    Expose an `AsyncCampaignBackend` as a sync `CampaignBackend`, so it works with
+    the admin views and actions. `get_backend()` applies this automatically when
+    `WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND` points to an async backend.
+    """
+
+    def __init__(self, async_backend: AsyncCampaignBackend):
+        self.async_backend = async_backend
+
+    @property
+    def name(self) -> str:  # type: ignore
+        return self.async_backend.name
+
+    def prepare(self):
+        self.async_backend.prepare()
+
+    @staticmethod
+    async def _list(func, *args):
+        return list(await func(*args))
+
+    def get_audiences(self):
+        return async_to_sync(self._list)(self.async_backend.get_audiences)
+
+    def get_audience_segments(self, audience_id):
+        return async_to_sync(self._list)(
+            self.async_backend.get_audience_segments, audience_id
+        )
+
+    def save_campaign(self, **kwargs):  # type: ignore
+        return async_to_sync(self.async_backend.save_campaign)(**kwargs)
+
+    def get_campaign(self, campaign_id):
+        return async_to_sync(self.async_backend.get_campaign)(campaign_id)
+
+    def get_campaigns(self, campaign_ids):
+        return async_to_sync(self.async_backend.get_campaigns)(campaign_ids)
+
+    def send_test_email(self, *, campaign_id, email):
+        return async_to_sync(self.async_backend.send_test_email)(
+            campaign_id=campaign_id, email=email
+        )
+
+    def send_campaign(self, campaign_id):
+        return async_to_sync(self.async_backend.send_campaign)(campaign_id)
+
+    def validate_schedule_time(self, schedule_time):
+        self.async_backend.validate_schedule_time(schedule_time)
+
+    def schedule_campaign(self, campaign_id, schedule_time):
+        return async_to_sync(self.async_backend.schedule_campaign)(
+            campaign_id, schedule_time
+        )
+
+    def unschedule_campaign(self, campaign_id):
+        return async_to_sync(self.async_backend.unschedule_campaign)(campaign_id)
+
+
+_backends: "dict[str, CampaignBackend]" = {}
+_backends_lock = threading.Lock()
+
+
+def get_backend() -> CampaignBackend:
+    """
+    Return the configured campaign backend.
+
+    Backends are instantiated once per process, and shared between threads, so
+    that expensive resources (like API clients and their connections) are reused
+    across requests. Call `reset_backends()` to discard them; this happens
+    automatically when a `WAGTAIL_NEWSLETTER_*` setting is changed.
+    """
+    dotted_path = getattr(
+        settings, "WAGTAIL_NEWSLETTER_CAMPAIGN_BACKEND", DEFAULT_CAMPAIGN_BACKEND
     )
-    return backend_class()
+
+    backend = _backends.get(dotted_path)
+    if backend is None:
+        with _backends_lock:
+            backend = _backends.get(dotted_path)
+            if backend is None:
+                backend_class = import_string(dotted_path)
+                if issubclass(backend_class, AsyncCampaignBackend):
+                    backend = AsyncToSyncCampaignBackend(backend_class())
+                else:
+                    backend = backend_class()
+                # Set up shared resources while holding the lock, so that
+                # threads never race to create them.
+                backend.prepare()
+                _backends[dotted_path] = backend
+
+    return backend
+
+
+def get_async_backend() -> AsyncCampaignBackend:
+    """Return the configured campaign backend, as an `AsyncCampaignBackend`."""
+    backend = get_backend()
+    if isinstance(backend, AsyncToSyncCampaignBackend):
+        return backend.async_backend
+    return SyncToAsyncCampaignBackend(backend)
+
+
+def reset_backends() -> None:
+    """Discard all backend instances created by `get_backend()`."""
+    with _backends_lock:
+        _backends.clear()
+
+
+@receiver(setting_changed)
+def reset_backends_on_setting_changed(*, setting, **kwargs):
+    if setting.startswith("WAGTAIL_NEWSLETTER_"):
+        reset_backends()
 
 
 class CampaignBackendError(Exception):
@@ -87,3 +463,11 @@ class CampaignBackendError(Exception):
 
     def __init__(self, message):
         self.message = message
+
+
+class CampaignBackendTimeout(CampaignBackendError):
+    """The campaign backend took too long to respond"""
+
+
+class CampaignNotFound(CampaignBackendError):
+    """The campaign doesn't exist in the backend, e.g. it was deleted there"""
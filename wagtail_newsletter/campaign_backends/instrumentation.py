@@ -0,0 +1,151 @@
+import functools
+import threading
+import time
+import types
+
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .. import tracing
+from ..signals import campaign_backend_call
+
+
+@dataclass
+class BackendCall:
+    """
+    Measurements of a campaign backend method call. Backends that talk to an HTTP
+    API report their requests with `record_request`.
+    """
+
+    operation: str
+    duration: float = 0.0
+    outcome: str = "success"
+    error: Optional[BaseException] = None
+    request_count: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    status_code: Optional[int] = None
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    @property
+    def payload_size(self) -> int:
+        return self.request_bytes + self.response_bytes
+
+
+current_call: "ContextVar[Optional[BackendCall]]" = ContextVar(
+    "current_call", default=None
+)
+
+
+def record_request(
+    *, status_code: Optional[int], request_bytes: int = 0, response_bytes: int = 0
+) -> None:
+    """Add an API request to the backend call in progress, if any."""
+    call = current_call.get()
+    if call is None:
+        return
+
+    with call._lock:
+        call.request_count += 1
+        call.request_bytes += request_bytes
+        call.response_bytes += response_bytes
+        call.status_code = status_code
+
+
+def _finish(instance, call: BackendCall, start: float, error=None) -> None:
+    # Imported here to avoid a circular import
+    from . import CampaignBackendTimeout
+
+    if error is not None:
+        call.outcome = (
+            "timeout" if isinstance(error, CampaignBackendTimeout) else "error"
+        )
+        call.error = error
+    call.duration = time.perf_counter() - start
+    campaign_backend_call.send(sender=type(instance), instance=instance, call=call)
+
+
+def _stream(instance, call: BackendCall, start: float, generator):
+    """
+    Yield the items of a generator returned by a backend call, counting the
+    requests it makes towards the call, and send the signal once it's exhausted,
+    closed or raises.
+    """
+    try:
+        while True:
+            token = current_call.set(call)
+            try:
+                item = next(generator)
+            except StopIteration:
+                break
+            finally:
+                current_call.reset(token)
+            yield item
+
+    except GeneratorExit:
+        _finish(instance, call, start)
+        raise
+
+    except BaseException as error:
+        _finish(instance, call, start, error)
+        raise
+
+    else:
+        _finish(instance, call, start)
+
+    finally:
+        generator.close()
+
+
+def instrument(func, operation: Optional[str] = None):
+    """
+    Wrap a backend method, so that each call sends the `campaign_backend_call`
+    signal. Calls made while another one is in progress (e.g. a subclass calling
+    `super()`) are counted as part of the outer call. Generators (e.g. paginated
+    listings) are wrapped, so that the signal is sent once they are consumed,
+    and covers the requests for all their pages; the tracing span only covers
+    the call itself.
+    """
+    if getattr(func, "_instrumented", False):
+        return func
+
+    operation = operation or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if current_call.get() is not None:
+            return func(self, *args, **kwargs)
+
+        call = BackendCall(operation=operation)
+        start = time.perf_counter()
+        with tracing.span(f"backend.{operation}") as span:
+            token = current_call.set(call)
+            try:
+                result = func(self, *args, **kwargs)
+
+            except BaseException as error:
+                _finish(self, call, start, error)
+                raise
+
+            else:
+                if not isinstance(result, types.GeneratorType):
+                    _finish(self, call, start)
+
+            finally:
+                current_call.reset(token)
+                span.attributes.update(
+                    outcome=call.outcome,
+                    request_count=call.request_count,
+                    payload_size=call.payload_size,
+                    status_code=call.status_code,
+                )
+
+        if isinstance(result, types.GeneratorType):
+            return _stream(self, call, start, result)
+        return result
+
+    wrapper._instrumented = True  # type: ignore[attr-defined]
+    return wrapper
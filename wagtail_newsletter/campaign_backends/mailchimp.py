@@ -1,5 +1,13 @@
+import hashlib
+import json
 import logging
+import time
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import nullcontext
+from contextvars import ContextVar, copy_context
 from copy import copy
 from dataclasses import dataclass
 from datetime import datetime
@@ -7,21 +15,68 @@ from enum import Enum
 from typing import Any, NoReturn, Optional, cast
 
 from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
+from django.dispatch import receiver
+from django.utils import timezone
 from django.utils.functional import cached_property
 from mailchimp_marketing import Client
-from mailchimp_marketing.api_client import ApiClientError
+from mailchimp_marketing.api_client import ApiClient, ApiClientError
+from requests import Session, Timeout
+from requests.adapters import HTTPAdapter
 
+from .. import tracing
 from ..audiences import (
     Audience,
     AudienceSegment,
 )
 from ..models import NewsletterRecipientsBase
-from . import Campaign, CampaignBackend, CampaignBackendError
+from ..signals import campaign_backend_call
+from . import (
+    Campaign,
+    CampaignBackend,
+    CampaignBackendError,
+    CampaignBackendTimeout,
+    CampaignNotFound,
+    SyncToAsyncCampaignBackend,
+)
+from .instrumentation import BackendCall, record_request
+from .resilience import CircuitBreaker, backoff_delay
+from .throttling import ConcurrencyLimiter, ConcurrencyLimitExceeded
 
 
 logger = logging.getLogger(__name__)
 
+# Timeout for the API requests made in the current context. It's set by
+# `MailchimpCampaignBackend._call`, according to the operation being performed.
+request_timeout: "ContextVar[Optional[tuple[float, float]]]" = ContextVar(
+    "request_timeout", default=None
+)
+
+# Deadline (in `time.monotonic()` terms) shared by the calls made in the current
+# context. It's set by operations made of several calls, so that each call only
+# gets the time that's left, rather than its own full budget.
+call_deadline: "ContextVar[Optional[float]]" = ContextVar("call_deadline", default=None)
+
+DEFAULT_TIMEOUTS = {
+    "connect": 5.0,
+    "read": 30.0,
+    "get_campaign": 10.0,
+    "get_report": 10.0,
+    "get_campaign_with_report": 10.0,
+    "set_content": 120.0,
+}
+
+# Campaign reports are cached for a time that depends on how long ago the
+# campaign was sent: reports of campaigns sent less than `age` seconds ago are
+# cached for `timeout` seconds. Older reports don't change, and are cached
+# indefinitely.
+DEFAULT_REPORT_CACHE_TIMEOUTS = [
+    (60 * 60, 60),  # First hour: 1 minute
+    (24 * 60 * 60, 10 * 60),  # First day: 10 minutes
+    (30 * 24 * 60 * 60, 6 * 60 * 60),  # First month: 6 hours
+]
+
 
 class CampaignStatus(Enum):
     DRAFT = "save"
@@ -38,6 +93,103 @@ class SegmentType(Enum):
     FUZZY = "fuzzy"  # purpose remains fuzzy
 
 
+class PooledApiClient(ApiClient):
+    """
+    Mailchimp API client that sends all requests through a shared `requests`
+    session, so that connections (and their TLS sessions) are kept alive and
+    reused, instead of being set up again for every API call.
+    """
+
+    def set_config(self, config={}):  # noqa: B006
+        super().set_config(config)
+        self.host = config.get("host", self.host)
+        adapter = HTTPAdapter(
+            pool_connections=config.get("pool_connections", 1),
+            pool_maxsize=config.get("pool_maxsize", 10),
+            pool_block=config.get("pool_block", False),
+        )
+        self.session = Session()
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self.limiter = None
+        concurrency_limit = config.get("concurrency_limit")
+        if concurrency_limit is not None:
+            # Mailchimp limits concurrent connections per API key, so share the
+            # limit between all processes using the same key.
+            key_hash = hashlib.sha256(
+                (self.api_key or self.access_token).encode(), usedforsecurity=False
+            ).hexdigest()[:16]
+            self.limiter = ConcurrencyLimiter(
+                f"wagtail-newsletter-mailchimp-{key_hash}", **concurrency_limit
+            )
+
+    def request(self, method, url, query_params=None, headers=None, body=None):
+        headers = headers or {}
+        auth = None
+
+        if self.is_basic_auth:
+            auth = ("user", self.api_key)
+
+        if self.is_oauth:
+            headers["Authorization"] = "Bearer " + self.access_token
+
+        if method not in ["GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"]:
+            raise ValueError(f"Unsupported HTTP method {method!r}")
+
+        data = None
+        if method in ["POST", "PUT", "PATCH"]:
+            data = json.dumps(body)
+
+        timeout = request_timeout.get() or self.timeout
+        if not isinstance(timeout, tuple):
+            timeout = (timeout, timeout)
+        connect_timeout, read_timeout = timeout
+        try:
+            # Time spent waiting for a slot counts towards the request's timeout
+            start = time.monotonic()
+            with (
+                self.limiter.limit(max_wait=read_timeout)
+                if self.limiter
+                else nullcontext()
+            ):
+                read_timeout -= time.monotonic() - start
+                response = self.session.request(
+                    method,
+                    url,
+                    params=query_params,
+                    data=data,
+                    headers=headers,
+                    auth=auth,
+                    timeout=(connect_timeout, read_timeout),
+                )
+
+        except Exception:
+            record_request(status_code=None, request_bytes=len(data or ""))
+            raise
+
+        record_request(
+            status_code=response.status_code,
+            request_bytes=len(data or ""),
+            response_bytes=len(response.content),
+        )
+        return response
+
+
+class PooledClient(Client):
+    def __init__(self, config={}):  # noqa: B006
+        super().__init__(config)
+
+        # `Client` doesn't let us choose the `ApiClient` class, so swap it in
+        # every API group after the fact.
+        api_client = PooledApiClient(config)
+        for api in vars(self).values():
+            if getattr(api, "api_client", None) is self.api_client:
+                api.api_client = api_client
+        self.api_client = api_client
+
+
 @dataclass
 class MailchimpCampaign(Campaign):
     backend: "MailchimpCampaignBackend"
@@ -70,70 +222,305 @@ class MailchimpCampaign(Campaign):
 
     def get_report(self) -> "dict[str, Any]":
         try:
-            data = self.backend.client.reports.get_campaign_report(self.id)
+            return self.backend._fetch_report(self.id)
 
         except ApiClientError as error:
             _log_and_raise(
                 error, "Error while fetching campaign report", campaign_id=self.id
             )
 
-        report = {
-            "emails_sent": data["emails_sent"],
-            "bounces": sum(data["bounces"].values()),
-            "opens": data["opens"]["unique_opens"],
-            "clicks": data["clicks"]["unique_clicks"],
-        }
-        if data["send_time"]:
-            try:
-                report["send_time"] = datetime.fromisoformat(data["send_time"])
-            except ValueError:
-                pass
-        return report
-
 
 class MailchimpCampaignBackend(CampaignBackend):
     name = "Mailchimp"
     campaign_class = MailchimpCampaign
 
+    # Fields to request from the Mailchimp API, so that we don't download (and
+    # parse) whole resources. Extend them in subclasses to use more data.
+    audience_fields = ["lists.id", "lists.name", "lists.stats.member_count"]
+    segment_fields = ["segments.id", "segments.name", "segments.member_count"]
+    campaign_fields = ["id", "web_id", "status"]
+    report_fields = [
+        "emails_sent",
+        "bounces",
+        "opens.unique_opens",
+        "clicks.unique_clicks",
+        "send_time",
+    ]
+
     @cached_property
     def client(self):
-        client = Client()
-        client.set_config(self.get_client_config())
-        return client
+        return PooledClient(self.get_client_config())
 
-    def get_client_config(self) -> "dict[str, Any]":
+    # Status codes of errors that are likely to go away if the request is retried
+    transient_status_codes = frozenset([429, 500, 502, 503, 504])
+
+    @cached_property
+    def retry_config(self) -> "dict[str, Any]":
+        return {
+            "max_retries": 2,
+            "backoff": 0.5,
+            "max_backoff": 8.0,
+            **getattr(settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_RETRY", {}),
+        }
+
+    @cached_property
+    def circuit_breaker(self):
+        return CircuitBreaker(
+            **{
+                "failure_threshold": 5,
+                "reset_timeout": 30.0,
+                **getattr(settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_CIRCUIT_BREAKER", {}),
+            }
+        )
+
+    def _is_transient(self, error: ApiClientError) -> bool:
+        if error.status_code is None:
+            # Connection errors and timeouts have no status code
+            return True
+        return error.status_code in self.transient_status_codes
+
+    @cached_property
+    def timeouts(self) -> "dict[str, float]":
         return {
+            **DEFAULT_TIMEOUTS,
+            **getattr(settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_TIMEOUTS", {}),
+        }
+
+    def get_timeout(self, operation: str) -> float:
+        """Time budget, in seconds, for an operation, including any retries."""
+        return self.timeouts.get(operation, self.timeouts["read"])
+
+    def _call(self, operation: str, func, *args, retry: bool = False, **kwargs):
+        """
+        Call a Mailchimp API method, through the circuit breaker, within the time
+        budget of `operation`. With `retry`, which should only be used for
+        idempotent calls, transient errors are retried with exponential backoff,
+        as long as the time budget allows.
+        """
+        with tracing.span(f"mailchimp.{operation}") as span:
+            return self._call_with_retries(
+                operation, func, *args, retry=retry, span=span, **kwargs
+            )
+
+    def _call_with_retries(
+        self, operation: str, func, *args, retry: bool, span, **kwargs
+    ):
+        deadline = time.monotonic() + self.get_timeout(operation)
+        outer_deadline = call_deadline.get()
+        if outer_deadline is not None:
+            deadline = min(deadline, outer_deadline)
+
+        attempt = 0
+        while True:
+            span.set_attribute("attempts", attempt + 1)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Out of time before the request is even made, e.g. after
+                # waiting for a worker thread; fail like a request that timed
+                # out, without blaming Mailchimp for it.
+                raise ApiClientError(Timeout(f"No time left for {operation}"))
+
+            if not self.circuit_breaker.allow_request():
+                raise CampaignBackendError(
+                    f"{self.name} is not responding, please try again later."
+                )
+
+            token = request_timeout.set((self.timeouts["connect"], remaining))
+            try:
+                result = func(*args, **kwargs)
+
+            except ApiClientError as error:
+                if isinstance(error.text, ConcurrencyLimitExceeded):
+                    # Running into our own concurrency limit says nothing about
+                    # Mailchimp's health, so it's kept away from the breaker.
+                    raise
+
+                if not self._is_transient(error):
+                    self.circuit_breaker.record_success()
+                    raise
+
+                self.circuit_breaker.record_failure()
+                if not retry or attempt >= self.retry_config["max_retries"]:
+                    raise
+
+                delay = backoff_delay(
+                    attempt,
+                    base=self.retry_config["backoff"],
+                    cap=self.retry_config["max_backoff"],
+                )
+                if time.monotonic() + delay >= deadline:
+                    raise
+
+                logger.warning(
+                    "Retrying %s in %.2fs after error: status_code=%r",
+                    operation,
+                    delay,
+                    error.status_code,
+                )
+                time.sleep(delay)
+                attempt += 1
+
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+            finally:
+                request_timeout.reset(token)
+
+    @cached_property
+    def executor(self):
+        return ThreadPoolExecutor(
+            max_workers=getattr(
+                settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_WORKER_THREADS", 10
+            ),
+            thread_name_prefix="wagtail-newsletter-mailchimp",
+        )
+
+    def prepare(self):
+        # Shared between threads, so create them before the backend is handed
+        # out, rather than on first use, when concurrent calls could each
+        # create their own.
+        for name in ["client", "executor", "circuit_breaker"]:
+            getattr(self, name)
+
+    def _submit(self, func, *args):
+        # Run in the caller's context, so that requests made by the worker
+        # thread count towards the backend call in progress.
+        return self.executor.submit(copy_context().run, func, *args)
+
+    def get_client_config(self) -> "dict[str, Any]":
+        """
+        Configuration for the Mailchimp API client. Besides the options
+        understood by `mailchimp_marketing`, `pool_maxsize` and `pool_block`
+        control the pool of keep-alive connections shared by all API calls, and
+        `concurrency_limit` holds the options of the `ConcurrencyLimiter` shared
+        by all processes using the same API key, and `host` overrides the base
+        URL of the API.
+        """
+        config = {
             "api_key": _require_setting("WAGTAIL_NEWSLETTER_MAILCHIMP_API_KEY"),
-            "timeout": 30,
+            "timeout": (self.timeouts["connect"], self.timeouts["read"]),
+            "pool_maxsize": 10,
+            "pool_block": False,
+            "concurrency_limit": getattr(
+                settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_CONCURRENCY_LIMIT", None
+            ),
         }
+        api_url = getattr(settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_API_URL", None)
+        if api_url:
+            config["host"] = api_url
+        return config
+
+    def _paginate(
+        self, operation: str, func, *args, key: str, fields, page_size=1000, **kwargs
+    ) -> "Iterator[dict[str, Any]]":
+        """
+        Fetch all items from a paginated Mailchimp endpoint. The first page is
+        fetched right away, so that errors are raised by this call. It tells us how
+        many items there are, so the remaining pages are fetched concurrently, and
+        their items are yielded in order.
+        """
+
+        def fetch_page(offset):
+            return self._call(
+                operation,
+                func,
+                *args,
+                count=page_size,
+                offset=offset,
+                fields=[*fields, "total_items"],
+                retry=True,
+                **kwargs,
+            )
+
+        first_page = fetch_page(0)
+        futures = [
+            self._submit(fetch_page, offset)
+            for offset in range(page_size, first_page["total_items"], page_size)
+        ]
+
+        def iter_items():
+            yield from first_page[key]
+            for future in futures:
+                try:
+                    page = future.result()
+
+                except ApiClientError as error:
+                    _log_and_raise(
+                        error, "Error while fetching page", operation=operation
+                    )
+
+                yield from page[key]
+
+        return iter_items()
+
+    def get_audiences(self) -> "Iterator[Audience]":
+        try:
+            audiences = self._paginate(
+                "get_audiences",
+                self.client.lists.get_all_lists,
+                key="lists",
+                fields=self.audience_fields,
+            )
+
+        except ApiClientError as error:
+            _log_and_raise(error, "Error while fetching audiences")
 
-    def get_audiences(self) -> "list[Audience]":
-        audiences = self.client.lists.get_all_lists()["lists"]
-        return [
+        return (
             Audience(
                 id=audience["id"],
                 name=audience["name"],
                 member_count=audience["stats"]["member_count"],
             )
             for audience in audiences
-        ]
+        )
+
+    def get_audience(self, audience_id: str) -> Optional[Audience]:
+        try:
+            audience = self._call(
+                "get_audience",
+                self.client.lists.get_list,
+                audience_id,
+                fields=[field.removeprefix("lists.") for field in self.audience_fields],
+                retry=True,
+            )
+
+        except ApiClientError as error:
+            if error.status_code == 404:
+                return None
+
+            _log_and_raise(
+                error, "Error while fetching audience", audience_id=audience_id
+            )
+
+        return Audience(
+            id=audience["id"],
+            name=audience["name"],
+            member_count=audience["stats"]["member_count"],
+        )
 
     def get_audience_segments(
         self, audience_id, type=SegmentType.SAVED.value, count=1000
-    ) -> "list[AudienceSegment]":
+    ) -> "Iterator[AudienceSegment]":
         """
         Fetch audience segments from Mailchimp.
 
         `type`: filter by segment type.  By default, only "saved" segments are fetched,
         which are the segments created manually by the Mailchimp admin.
 
-        `count`: how many items to fetch. By default, 1000 items are fetched, which is
-        the maximum allowed by Mailchimp, so that we don't have to implement pagination.
+        `count`: how many items to fetch per page. By default, 1000 items are
+        fetched, which is the maximum allowed by Mailchimp.
         """
         try:
-            segments = self.client.lists.list_segments(
-                audience_id, type=type, count=count
-            )["segments"]
+            segments = self._paginate(
+                "get_audience_segments",
+                self.client.lists.list_segments,
+                audience_id,
+                key="segments",
+                fields=self.segment_fields,
+                page_size=count,
+                type=type,
+            )
 
         except ApiClientError as error:
             if error.status_code == 404:
@@ -143,7 +530,7 @@ class MailchimpCampaignBackend(CampaignBackend):
                 error, "Error while fetching audience segments", audience_id=audience_id
             )
 
-        return [
+        return (
             AudienceSegment(
                 # Include the audience ID in the segment ID, so we can find the segment
                 # later.
@@ -152,20 +539,67 @@ class MailchimpCampaignBackend(CampaignBackend):
                 member_count=segment["member_count"],
             )
             for segment in segments
-        ]
+        )
+
+    def get_audience_segment(
+        self, audience_id: str, segment_id: str
+    ) -> Optional[AudienceSegment]:
+        """
+        Fetch a single segment. Like `get_audience_segments`, only "saved"
+        segments are returned; segments of other types are reported as missing.
+        """
+        # Segment IDs include the audience ID, see `get_audience_segments`
+        mailchimp_segment_id = segment_id.rpartition("/")[2]
+        try:
+            segment = self._call(
+                "get_audience_segment",
+                self.client.lists.get_segment,
+                audience_id,
+                mailchimp_segment_id,
+                fields=[
+                    *(field.removeprefix("segments.") for field in self.segment_fields),
+                    "type",
+                ],
+                retry=True,
+            )
+
+        except ApiClientError as error:
+            if error.status_code == 404:
+                return None
+
+            _log_and_raise(
+                error,
+                "Error while fetching audience segment",
+                audience_id=audience_id,
+                segment_id=segment_id,
+            )
+
+        if segment["type"] != SegmentType.SAVED.value:
+            return None
+
+        return AudienceSegment(
+            id=f"{audience_id}/{segment['id']}",
+            name=segment["name"],
+            member_count=segment["member_count"],
+        )
 
     def _create_campaign(self, body) -> str:
         body = copy(body)
         body.setdefault("type", "regular")
         try:
-            return cast(str, self.client.campaigns.create(body)["id"])
+            return cast(
+                str,
+                self._call("create_campaign", self.client.campaigns.create, body)["id"],
+            )
 
         except ApiClientError as error:
             _log_and_raise(error, "Error while creating campaign")
 
     def _update_campaign(self, campaign_id: str, body) -> str:
         try:
-            self.client.campaigns.update(campaign_id, body)
+            self._call(
+                "update_campaign", self.client.campaigns.update, campaign_id, body
+            )
             return campaign_id
 
         except ApiClientError as error:
@@ -179,7 +613,12 @@ class MailchimpCampaignBackend(CampaignBackend):
 
     def _set_content(self, campaign_id: str, html: str) -> None:
         try:
-            self.client.campaigns.set_content(campaign_id, {"html": html})
+            self._call(
+                "set_content",
+                self.client.campaigns.set_content,
+                campaign_id,
+                {"html": html},
+            )
 
         except ApiClientError as error:
             _log_and_raise(
@@ -216,6 +655,26 @@ class MailchimpCampaignBackend(CampaignBackend):
 
         return body
 
+    def get_campaign_digest(
+        self,
+        *,
+        recipients: Optional[NewsletterRecipientsBase],
+        subject: str,
+        html: str,
+        from_name: str,
+        reply_to: str,
+    ) -> str:
+        # Hash the actual request body, so that customizations made in
+        # `get_campaign_request_body` are taken into account.
+        body = self.get_campaign_request_body(
+            recipients=recipients,
+            subject=subject,
+            from_name=from_name,
+            reply_to=reply_to,
+        )
+        data = json.dumps({"body": body, "html": html}, sort_keys=True)
+        return hashlib.sha256(data.encode(), usedforsecurity=False).hexdigest()
+
     def save_campaign(
         self,
         *,
@@ -233,6 +692,11 @@ class MailchimpCampaignBackend(CampaignBackend):
             reply_to=reply_to,
         )
 
+        if campaign_id and getattr(
+            settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_CONCURRENT_SAVE", False
+        ):
+            return self._save_campaign_concurrently(campaign_id, body, html)
+
         if campaign_id:
             campaign_id = self._update_campaign(campaign_id, body)
 
@@ -242,17 +706,165 @@ class MailchimpCampaignBackend(CampaignBackend):
         self._set_content(campaign_id, html)
         return campaign_id
 
+    def _save_campaign_concurrently(self, campaign_id: str, body, html: str) -> str:
+        """
+        Update the settings and the content of an existing campaign in parallel.
+        If the campaign turns out to have been deleted, a new one is created, and
+        the content is uploaded again to the new campaign.
+        """
+        update = self._submit(self._update_campaign, campaign_id, body)
+        set_content = self._submit(
+            self._call,
+            "set_content",
+            self.client.campaigns.set_content,
+            campaign_id,
+            {"html": html},
+        )
+        wait([update, set_content])
+
+        new_campaign_id = update.result()
+        if new_campaign_id != campaign_id:
+            # The content went to the deleted campaign, so the error (if any) is
+            # irrelevant; upload it again.
+            self._set_content(new_campaign_id, html)
+
+        else:
+            try:
+                set_content.result()
+
+            except ApiClientError as error:
+                _log_and_raise(
+                    error,
+                    "Error while saving campaign content",
+                    campaign_id=campaign_id,
+                )
+
+        return new_campaign_id
+
+    @property
+    def campaign_cache_enabled(self) -> bool:
+        # Campaigns can change status on the Mailchimp end (e.g. when a scheduled
+        # campaign is sent), so only cache them when webhooks tell us about it.
+        return bool(
+            getattr(settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_WEBHOOK_SECRET", None)
+        )
+
+    def campaign_cache_key(self, campaign_id: str) -> str:
+        return f"wagtail-newsletter-mailchimp-campaign-{campaign_id}"
+
+    def invalidate_cached_campaign(self, campaign_id: str) -> None:
+        caches["default"].delete(self.campaign_cache_key(campaign_id))
+
+    def update_cached_campaign_status(self, campaign_id: str, status: str) -> None:
+        """Update the status of a cached campaign, e.g. when notified by a webhook."""
+        cache = caches["default"]
+        cache_key = self.campaign_cache_key(campaign_id)
+        data = cache.get(cache_key)
+        if data is not None:
+            data["status"] = status
+            cache.set(cache_key, data, self.campaign_cache_timeout)
+
+    @property
+    def campaign_cache_timeout(self) -> int:
+        return getattr(settings, "WAGTAIL_NEWSLETTER_CACHE_TIMEOUT", 300)
+
+    def report_cache_key(self, campaign_id: str) -> str:
+        return f"wagtail-newsletter-mailchimp-report-{campaign_id}"
+
+    def report_cache_timeout(self, report: "dict[str, Any]") -> Optional[int]:
+        """
+        How long to cache a campaign report, depending on how long ago the
+        campaign was sent. Returns `0` if the report shouldn't be cached (e.g. the
+        campaign isn't sent yet), or `None` to cache it indefinitely.
+        """
+        send_time = report.get("send_time")
+        if send_time is None:
+            return 0
+
+        # `timezone.now()` is naive if `USE_TZ` is off, and send times of custom
+        # campaigns may be naive too, so compare aware datetimes.
+        if timezone.is_naive(send_time):
+            send_time = timezone.make_aware(send_time)
+        age = (datetime.now(tz=send_time.tzinfo) - send_time).total_seconds()
+        if age < 0:
+            return 0
+
+        timeouts = getattr(
+            settings,
+            "WAGTAIL_NEWSLETTER_MAILCHIMP_REPORT_CACHE_TIMEOUTS",
+            DEFAULT_REPORT_CACHE_TIMEOUTS,
+        )
+        for max_age, timeout in timeouts:
+            if age < max_age:
+                return timeout
+
+        return None
+
+    def invalidate_cached_report(self, campaign_id: str) -> None:
+        caches["default"].delete(self.report_cache_key(campaign_id))
+
+    def _fetch_report(self, campaign_id: str) -> "dict[str, Any]":
+        cache = caches["default"]
+        cache_key = self.report_cache_key(campaign_id)
+        report = cache.get(cache_key)
+        if report is not None:
+            return report
+
+        data = self._call(
+            "get_report",
+            self.client.reports.get_campaign_report,
+            campaign_id,
+            fields=self.report_fields,
+            retry=True,
+        )
+
+        report = {
+            "emails_sent": data["emails_sent"],
+            "bounces": sum(data["bounces"].values()),
+            "opens": data["opens"]["unique_opens"],
+            "clicks": data["clicks"]["unique_clicks"],
+        }
+        if data["send_time"]:
+            try:
+                report["send_time"] = datetime.fromisoformat(data["send_time"])
+            except ValueError:
+                pass
+
+        timeout = self.report_cache_timeout(report)
+        if timeout != 0:
+            cache.set(cache_key, report, timeout)
+
+        return report
+
     def get_campaign(self, campaign_id: str) -> Optional[MailchimpCampaign]:
-        try:
-            data = self.client.campaigns.get(campaign_id)
+        cache = caches["default"]
+        cache_key = self.campaign_cache_key(campaign_id)
+        data = cache.get(cache_key) if self.campaign_cache_enabled else None
 
-        except ApiClientError as error:
-            if error.status_code == 404:
-                return None
+        if data is None:
+            try:
+                data = self._call(
+                    "get_campaign",
+                    self.client.campaigns.get,
+                    campaign_id,
+                    fields=self.campaign_fields,
+                    retry=True,
+                )
 
-            _log_and_raise(
-                error, "Error while fetching campaign", campaign_id=campaign_id
-            )
+            except ApiClientError as error:
+                if error.status_code == 404:
+                    return None
+
+                _log_and_raise(
+                    error, "Error while fetching campaign", campaign_id=campaign_id
+                )
+
+            if self.campaign_cache_enabled:
+                cache.set(
+                    cache_key,
+                    {"web_id": data["web_id"], "status": data["status"]},
+                    self.campaign_cache_timeout,
+                )
 
         return self.campaign_class(
             backend=self,
@@ -261,9 +873,129 @@ class MailchimpCampaignBackend(CampaignBackend):
             status=data["status"],
         )
 
+    def get_campaign_with_report(
+        self, campaign_id: str, *, with_report: bool = True
+    ) -> "tuple[Optional[MailchimpCampaign], Optional[dict[str, Any]]]":
+        """
+        Fetch the campaign and its report at the same time: the report in a
+        worker thread, and the campaign in the calling thread, both within the
+        time budget of `get_campaign_with_report`. The report is discarded if the
+        campaign turns out not to be sent or scheduled, and left out if it can't
+        be fetched in time.
+        """
+        # Every request made for this call, in this thread or in the worker
+        # thread, only gets the time that's left until the deadline.
+        deadline = time.monotonic() + self.get_timeout("get_campaign_with_report")
+        token = call_deadline.set(deadline)
+        try:
+            report_future = (
+                self._submit(self._fetch_report, campaign_id) if with_report else None
+            )
+
+            try:
+                campaign = self.get_campaign(campaign_id)
+                if campaign is None or not (campaign.is_sent or campaign.is_scheduled):
+                    return campaign, None
+
+                if report_future is None:
+                    return campaign, None
+
+                try:
+                    if report_future.cancel():
+                        # All worker threads are busy; fetch the report here
+                        # instead of waiting for one.
+                        report = self._fetch_report(campaign_id)
+
+                    else:
+                        report = report_future.result(
+                            timeout=max(deadline - time.monotonic(), 0)
+                        )
+
+                except FuturesTimeoutError:
+                    report = None
+
+                except ApiClientError as error:
+                    if not isinstance(error.text, Timeout):
+                        _log_and_raise(
+                            error,
+                            "Error while fetching campaign report",
+                            campaign_id=campaign_id,
+                        )
+                    report = None
+
+                if report is None:
+                    # The campaign is still worth showing without its report.
+                    logger.warning(
+                        "Campaign report took too long to fetch: campaign_id=%r",
+                        campaign_id,
+                    )
+
+                return campaign, report
+
+            finally:
+                if report_future is not None:
+                    report_future.cancel()
+
+        finally:
+            call_deadline.reset(token)
+
+    def get_campaigns(
+        self, campaign_ids: "Iterable[str]", page_size=1000, max_pages=2
+    ) -> "dict[str, Campaign]":
+        """
+        Fetch several campaigns, by listing campaigns, newest first, until all
+        of them are found. Campaigns not found in the first `max_pages` pages
+        (e.g. old or deleted ones) are fetched one by one.
+        """
+        missing = set(campaign_ids)
+        campaigns: dict[str, Campaign] = {}
+        offset = 0
+        while missing and offset < page_size * max_pages:
+            try:
+                data = self._call(
+                    "get_campaigns",
+                    self.client.campaigns.list,
+                    count=page_size,
+                    offset=offset,
+                    sort_field="create_time",
+                    sort_dir="DESC",
+                    fields=[
+                        *(f"campaigns.{field}" for field in self.campaign_fields),
+                        "total_items",
+                    ],
+                    retry=True,
+                )
+
+            except ApiClientError as error:
+                _log_and_raise(error, "Error while fetching campaigns")
+
+            for item in data["campaigns"]:
+                if item["id"] in missing:
+                    missing.remove(item["id"])
+                    campaigns[item["id"]] = self.campaign_class(
+                        backend=self,
+                        id=item["id"],
+                        web_id=item["web_id"],
+                        status=item["status"],
+                    )
+
+            offset += page_size
+            if offset >= data["total_items"]:
+                break
+
+        else:
+            for campaign_id in missing:
+                campaign = self.get_campaign(campaign_id)
+                if campaign is not None:
+                    campaigns[campaign_id] = campaign
+
+        return campaigns
+
     def send_test_email(self, *, campaign_id: str, email: str) -> None:
         try:
-            self.client.campaigns.send_test_email(
+            self._call(
+                "send_test_email",
+                self.client.campaigns.send_test_email,
                 campaign_id,
                 {
                     "test_emails": [email],
@@ -278,13 +1010,16 @@ class MailchimpCampaignBackend(CampaignBackend):
 
     def send_campaign(self, campaign_id: str) -> None:
         try:
-            self.client.campaigns.send(campaign_id)
+            self._call("send_campaign", self.client.campaigns.send, campaign_id)
 
         except ApiClientError as error:
             _log_and_raise(
                 error, "Error while sending campaign", campaign_id=campaign_id
             )
 
+        finally:
+            self.invalidate_cached_campaign(campaign_id)
+
     def validate_schedule_time(self, schedule_time: datetime) -> None:
         rounded_minute = schedule_time.minute - (schedule_time.minute % 15)
         rounded_time = schedule_time.replace(
@@ -301,8 +1036,11 @@ class MailchimpCampaignBackend(CampaignBackend):
         self.validate_schedule_time(schedule_time)
 
         try:
-            self.client.campaigns.schedule(
-                campaign_id, {"schedule_time": schedule_time.isoformat()}
+            self._call(
+                "schedule_campaign",
+                self.client.campaigns.schedule,
+                campaign_id,
+                {"schedule_time": schedule_time.isoformat()},
             )
 
         except ApiClientError as error:
@@ -310,15 +1048,56 @@ class MailchimpCampaignBackend(CampaignBackend):
                 error, "Error while scheduling campaign", campaign_id=campaign_id
             )
 
+        finally:
+            self.invalidate_cached_campaign(campaign_id)
+
     def unschedule_campaign(self, campaign_id: str) -> None:
         try:
-            self.client.campaigns.unschedule(campaign_id)
+            self._call(
+                "unschedule_campaign", self.client.campaigns.unschedule, campaign_id
+            )
 
         except ApiClientError as error:
             _log_and_raise(
                 error, "Error while unscheduling campaign", campaign_id=campaign_id
             )
 
+        finally:
+            self.invalidate_cached_campaign(campaign_id)
+
+
+class AsyncMailchimpCampaignBackend(SyncToAsyncCampaignBackend):
+    """
+    Async Mailchimp backend. The `mailchimp_marketing` client is synchronous, so
+    API calls are dispatched to worker threads, sharing the pooled connections of
+    a single `MailchimpCampaignBackend`.
+    """
+
+    backend_class = MailchimpCampaignBackend
+
+
+@receiver(campaign_backend_call)
+def log_slow_call(sender, instance, call: BackendCall, **kwargs):
+    if not issubclass(sender, (MailchimpCampaignBackend, MailchimpCampaign)):
+        return
+
+    threshold = getattr(
+        settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_SLOW_CALL_THRESHOLD", 5.0
+    )
+    if threshold is None or call.duration < threshold:
+        return
+
+    logger.warning(
+        "Slow Mailchimp call: operation=%s, duration=%.2fs, outcome=%s, "
+        "requests=%d, payload_size=%d, status_code=%r",
+        call.operation,
+        call.duration,
+        call.outcome,
+        call.request_count,
+        call.payload_size,
+        call.status_code,
+    )
+
 
 def _log_and_raise(error: ApiClientError, message: str, **kwargs) -> NoReturn:
     kwargs["status_code"] = error.status_code
@@ -327,6 +1106,12 @@ def _log_and_raise(error: ApiClientError, message: str, **kwargs) -> NoReturn:
         f"{message}: {', '.join(f'{key}=%r' for key in kwargs.keys())}",
         *kwargs.values(),
     )
+    if isinstance(error.text, Timeout):
+        raise CampaignBackendTimeout(
+            f"{message}: Mailchimp took too long to respond"
+        ) from error
+    if error.status_code == 404 and "campaign_id" in kwargs:
+        raise CampaignNotFound(message) from error
     raise CampaignBackendError(message) from error
 
 
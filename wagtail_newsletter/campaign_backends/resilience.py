@@ -0,0 +1,80 @@
+import logging
+import random
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing service for a while. After `failure_threshold`
+    consecutive failures, the circuit opens and `allow_request()` returns `False`
+    for `reset_timeout` seconds. Then one trial request is let through: if it
+    succeeds, the circuit closes again, otherwise it stays open for another
+    `reset_timeout` seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, *, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = self.CLOSED
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if (
+                self._state == self.OPEN
+                and time.monotonic() - self.opened_at >= self.reset_timeout
+            ):
+                return self.HALF_OPEN
+            return self._state
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_timeout:
+                return False
+
+            # Let a single trial request through. If its outcome is never
+            # recorded, another one is allowed after `reset_timeout`.
+            self._state = self.HALF_OPEN
+            self.opened_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._state == self.HALF_OPEN or (
+                self.failures >= self.failure_threshold and self._state == self.CLOSED
+            ):
+                if self._state == self.CLOSED:
+                    logger.warning(
+                        "Opening circuit after %d consecutive failures", self.failures
+                    )
+                self._state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+def backoff_delay(attempt: int, *, base: float = 0.5, cap: float = 8.0) -> float:
+    """
+    Delay before retry number `attempt` (starting at 0): exponential backoff with
+    full jitter.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))  # noqa: S311
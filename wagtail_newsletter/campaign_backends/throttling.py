@@ -0,0 +1,163 @@
+import logging
+import random
+import threading
+import time
+import uuid
+
+from contextlib import contextmanager
+from typing import Optional
+
+from django.core.cache import caches
+
+
+logger = logging.getLogger(__name__)
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """No slot became available within the maximum waiting time."""
+
+
+class ConcurrencyLimiter:
+    """
+    Semaphore shared by all processes that use the same Django cache. Each
+    in-flight request holds one of `max_concurrent` slots, stored as cache keys.
+    Slots expire after `lease` seconds, so that a crashed process can't hold on
+    to them forever; `lease` should be longer than the slowest request.
+
+    The Django cache can't delete a key only if it holds a given value, so a
+    slot is released by checking that it still holds the request's token, then
+    deleting it. That's only safe while the lease is far from expiring: slots
+    held for longer than `lease - release_margin` seconds are left to expire
+    instead, so that a slot taken over by another request is never deleted.
+
+    The limit is only shared by processes that share the cache: with the default
+    `LocMemCache`, each process has its own.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        *,
+        max_concurrent: int = 10,
+        max_wait: float = 10.0,
+        lease: float = 120.0,
+        release_margin: float = 5.0,
+        poll_interval: float = 0.05,
+        cache_alias: str = "default",
+    ):
+        self.key = key
+        self.max_concurrent = max_concurrent
+        self.max_wait = max_wait
+        self.lease = lease
+        self.release_margin = release_margin
+        self.poll_interval = poll_interval
+        self.cache_alias = cache_alias
+
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "acquired": 0,
+            "rejected": 0,
+            "waiting": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0,
+        }
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    @property
+    def waiting_key(self) -> str:
+        return f"{self.key}-waiting"
+
+    def slot_key(self, index: int) -> str:
+        return f"{self.key}-slot-{index}"
+
+    def get_metrics(self) -> "dict[str, float]":
+        """
+        Return counters for this process, plus `queue_length`, the number of
+        requests waiting for a slot across all processes.
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        metrics["queue_length"] = self.cache.get(self.waiting_key, 0)
+        return metrics
+
+    def _update_metrics(self, **changes):
+        with self._metrics_lock:
+            for name, value in changes.items():
+                self._metrics[name] += value
+
+    def _try_acquire(self, token: str):
+        # Start at a random slot, so that processes don't all compete for the
+        # first ones.
+        offset = random.randrange(self.max_concurrent)  # noqa: S311
+        for i in range(self.max_concurrent):
+            slot = self.slot_key((offset + i) % self.max_concurrent)
+            if self.cache.add(slot, token, self.lease):
+                return slot
+        return None
+
+    def _change_waiting(self, delta: int):
+        self.cache.add(self.waiting_key, 0, None)
+        try:
+            self.cache.incr(self.waiting_key, delta)
+        except ValueError:  # pragma: no cover
+            # The key was evicted in the meantime
+            pass
+
+    def _acquire(self, token: str, max_wait: float) -> str:
+        slot = self._try_acquire(token)
+        if slot is not None:
+            self._update_metrics(acquired=1)
+            return slot
+
+        start = time.monotonic()
+        self._update_metrics(waiting=1)
+        self._change_waiting(1)
+        try:
+            while slot is None:
+                waited = time.monotonic() - start
+                if waited >= max_wait:
+                    self._update_metrics(rejected=1)
+                    raise ConcurrencyLimitExceeded(
+                        f"No connection slot available after {waited:.1f}s"
+                    )
+                time.sleep(min(self.poll_interval, max_wait - waited))
+                slot = self._try_acquire(token)
+
+        finally:
+            self._update_metrics(waiting=-1)
+            self._change_waiting(-1)
+
+        waited = time.monotonic() - start
+        logger.debug("Waited %.3fs for connection slot %s", waited, slot)
+        with self._metrics_lock:
+            self._metrics["acquired"] += 1
+            self._metrics["total_wait_time"] += waited
+            self._metrics["max_wait_time"] = max(self._metrics["max_wait_time"], waited)
+        return slot
+
+    @contextmanager
+    def limit(self, max_wait: Optional[float] = None):
+        """
+        Hold a slot while in the context. Wait at most `max_wait` seconds for a
+        free slot, e.g. the time left for the request; it's capped by the
+        `max_wait` of the limiter.
+        """
+        if max_wait is None or max_wait > self.max_wait:
+            max_wait = self.max_wait
+
+        token = uuid.uuid4().hex
+        slot = self._acquire(token, max_wait)
+        acquired = time.monotonic()
+        try:
+            yield
+        finally:
+            # Past the end of the lease, the slot may belong to someone else,
+            # even between the check and the deletion.
+            held = time.monotonic() - acquired
+            if held < self.lease - self.release_margin and (
+                self.cache.get(slot) == token
+            ):
+                self.cache.delete(slot)
@@ -0,0 +1,189 @@
+import logging
+
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.contrib.messages import DEFAULT_TAGS, ERROR
+from django.db.models import Q
+from django.utils import timezone
+from wagtail.admin import messages
+from wagtail.log_actions import LogContext
+
+from . import models
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_enabled() -> bool:
+    return getattr(settings, "WAGTAIL_NEWSLETTER_BACKGROUND_JOBS", False)
+
+
+def get_stale_cutoff():
+    """Jobs that started running before this time are considered stale."""
+    timeout = getattr(settings, "WAGTAIL_NEWSLETTER_BACKGROUND_JOB_TIMEOUT", 600)
+    return timezone.now() - timedelta(seconds=timeout)
+
+
+def enqueue(
+    request, page: "models.NewsletterPageMixin", action: str
+) -> "models.NewsletterJob":
+    job = models.NewsletterJob.objects.create(
+        page=page,
+        action=action,
+        data={
+            key: value
+            for key, value in request.POST.items()
+            if key.startswith("newsletter-")
+        },
+        user=request.user,
+    )
+    messages.info(
+        request,
+        "The newsletter action will run in the background. Its result will be"
+        " shown in the newsletter tab.",
+    )
+    return job
+
+
+class JobRequest:
+    """
+    Stand-in for the request that queued a job, for running the action. Messages
+    added by the action are collected in `messages`.
+    """
+
+    def __init__(self, job: "models.NewsletterJob"):
+        self.user = job.user
+        self.POST = job.data
+        self.messages: list[dict[str, str]] = []
+        # Picked up by `django.contrib.messages.add_message`
+        self._messages = self
+
+    def add(self, level, message, extra_tags=""):
+        self.messages.append({"level": DEFAULT_TAGS[level], "message": str(message)})
+
+
+def claim(job: "models.NewsletterJob") -> bool:
+    """Mark a pending job as running. Returns `False` if another worker got it."""
+    now = timezone.now()
+    claimed = models.NewsletterJob.objects.filter(
+        pk=job.pk, status=models.NewsletterJob.Status.PENDING
+    ).update(status=models.NewsletterJob.Status.RUNNING, started_at=now)
+    if claimed:
+        job.status = models.NewsletterJob.Status.RUNNING
+        job.started_at = now
+    return bool(claimed)
+
+
+def run_job(job: "models.NewsletterJob") -> None:
+    # Imported here to avoid a circular import
+    from . import actions
+
+    request = JobRequest(job)
+    page = job.page.specific
+
+    try:
+        with LogContext(user=job.user):
+            actions.run_action(request, page, job.action)
+
+    except Exception:
+        logger.exception("Error while running newsletter job %r", job.pk)
+        request.add(ERROR, "An unexpected error occurred. Please try again.")
+
+    failed = any(
+        message["level"] == DEFAULT_TAGS[ERROR] for message in request.messages
+    )
+    job.status = (
+        models.NewsletterJob.Status.FAILED
+        if failed
+        else models.NewsletterJob.Status.DONE
+    )
+    job.messages = request.messages
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "messages", "finished_at"])
+
+
+def fail_stale_jobs() -> int:
+    """
+    Mark jobs that have been running for too long as failed, e.g. because their
+    worker crashed. They aren't run again, since the action may have been
+    carried out already. Returns the number of failed jobs.
+    """
+    return models.NewsletterJob.objects.filter(
+        status=models.NewsletterJob.Status.RUNNING,
+        started_at__lt=get_stale_cutoff(),
+    ).update(
+        status=models.NewsletterJob.Status.FAILED,
+        messages=[
+            {
+                "level": DEFAULT_TAGS[ERROR],
+                "message": "The newsletter action was interrupted. Please check"
+                " the campaign and try again.",
+            }
+        ],
+        finished_at=timezone.now(),
+    )
+
+
+def run_pending_jobs(limit: Optional[int] = None) -> int:
+    """Run pending jobs, oldest first. Returns the number of jobs run."""
+    fail_stale_jobs()
+
+    count = 0
+    while limit is None or count < limit:
+        job = (
+            models.NewsletterJob.objects.filter(
+                status=models.NewsletterJob.Status.PENDING
+            )
+            .select_related("page", "user")
+            .first()
+        )
+        if job is None:
+            break
+
+        if claim(job):
+            run_job(job)
+            count += 1
+
+    return count
+
+
+def has_pending_jobs(page: "models.NewsletterPageMixin") -> bool:
+    """Whether `page` has jobs waiting to run, or running (and not stale)."""
+    return (
+        models.NewsletterJob.objects.filter(page=page)
+        .filter(
+            Q(status=models.NewsletterJob.Status.PENDING)
+            | Q(
+                status=models.NewsletterJob.Status.RUNNING,
+                started_at__gte=get_stale_cutoff(),
+            )
+        )
+        .exists()
+    )
+
+
+def pop_finished_job_messages(
+    page: "models.NewsletterPageMixin", user
+) -> "list[dict[str, str]]":
+    """
+    Messages of the jobs of `page` queued by `user` that finished since they were
+    last shown. Other users' jobs are left alone, so that their messages (e.g.
+    test email addresses) are only shown to the user who queued them.
+    """
+    jobs = list(
+        models.NewsletterJob.objects.filter(
+            page=page,
+            user=user,
+            status__in=[
+                models.NewsletterJob.Status.DONE,
+                models.NewsletterJob.Status.FAILED,
+            ],
+            messages_shown=False,
+        )
+    )
+    models.NewsletterJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+        messages_shown=True
+    )
+    return [message for job in jobs for message in job.messages]
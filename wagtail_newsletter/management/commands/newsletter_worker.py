@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ... import jobs
+
+
+class Command(BaseCommand):
+    help = "Run newsletter actions queued in the background."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the pending jobs, then exit, instead of waiting for more.",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between checks for new jobs.",
+        )
+
+    def handle(self, *args, once=False, interval=2.0, **options):
+        while True:
+            count = jobs.run_pending_jobs()
+            if count:
+                self.stdout.write(f"Ran {count} newsletter job(s)")
+
+            if once:
+                break
+
+            time.sleep(interval)
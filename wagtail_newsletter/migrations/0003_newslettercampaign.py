@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:44
+
+import django.db.models.deletion
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_newsletter", "0002_newsletterjob"),
+        ("wagtailcore", "0089_log_entry_data_json_null_to_object"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NewsletterCampaign",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("campaign_id", models.CharField(max_length=255, unique=True)),
+                ("status", models.CharField(blank=True, max_length=50)),
+                ("is_sent", models.BooleanField(default=False)),
+                ("is_scheduled", models.BooleanField(default=False)),
+                ("web_id", models.CharField(blank=True, max_length=255)),
+                ("url", models.CharField(blank=True, max_length=2000)),
+                ("schedule_time", models.DateTimeField(blank=True, null=True)),
+                ("send_time", models.DateTimeField(blank=True, null=True)),
+                ("last_synced_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "last_pushed_revision",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="wagtailcore.revision",
+                    ),
+                ),
+                (
+                    "page",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="newsletter_campaigns",
+                        to="wagtailcore.page",
+                    ),
+                ),
+            ],
+        ),
+    ]
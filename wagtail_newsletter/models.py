@@ -5,13 +5,14 @@ from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.db import models
 from django.http import HttpResponse
 from django.template.loader import render_to_string
+from django.utils import timezone
 from django.utils.safestring import SafeString
 from django.utils.translation import gettext_lazy as _
 from wagtail.admin.panels import FieldPanel, ObjectList, TabbedInterface
 from wagtail.models import Page
 from wagtail.permissions import ModelPermissionPolicy
 
-from . import audiences, get_recipients_model_string, panels
+from . import audiences, get_recipients_model_string, panels, permissions
 
 
 class NewsletterRecipientsBase(models.Model):
@@ -62,12 +63,207 @@ class NewsletterRecipientsBase(models.Model):
         else:
             return None
 
+    def get_member_count_cache_entry(self) -> Optional[audiences.CacheEntry]:
+        """
+        Cache entry of the audience or segment that `member_count` is read from,
+        without calling the backend. `None` if it isn't cached, or if there are
+        no audience and segment.
+        """
+        if self.segment:
+            queryset = audiences.AudienceSegment.objects
+            pk = self.segment
+
+        elif self.audience:
+            queryset = audiences.Audience.objects
+            pk = self.audience
+
+        else:
+            return None
+
+        return queryset.get_cached(queryset.cache_key(pk))
+
 
 class NewsletterRecipients(NewsletterRecipientsBase):
     class Meta:  # type: ignore
         verbose_name_plural = "Newsletter recipients"
 
 
+class NewsletterJob(models.Model):
+    """
+    Newsletter action queued to run in the background, when
+    `WAGTAIL_NEWSLETTER_BACKGROUND_JOBS` is enabled. Jobs are run by the
+    `newsletter_worker` management command.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    page = models.ForeignKey(
+        "wagtailcore.Page", on_delete=models.CASCADE, related_name="+"
+    )
+    action = models.CharField(max_length=50)
+    # Form data of the action, e.g. the test email address
+    data = models.JSONField(default=dict, blank=True)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        blank=True,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    status = models.CharField(
+        max_length=20, choices=Status.choices, default=Status.PENDING
+    )
+    # Messages produced by the action, as `{"level": ..., "message": ...}`
+    messages = models.JSONField(default=list, blank=True)
+    messages_shown = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:  # type: ignore
+        ordering = ["created_at"]
+        indexes = [models.Index(fields=["status", "created_at"])]
+
+    def __str__(self):
+        return f"{self.action} ({self.status})"
+
+
+class NewsletterCampaign(models.Model):
+    """
+    Local copy of the state of a campaign in the backend, so that it can be shown
+    without calling the backend, and campaigns can be looked up by ID.
+    """
+
+    campaign_id = models.CharField(max_length=255, unique=True)
+    page = models.ForeignKey(
+        "wagtailcore.Page",
+        on_delete=models.CASCADE,
+        related_name="newsletter_campaigns",
+    )
+    status = models.CharField(max_length=50, blank=True)
+    is_sent = models.BooleanField(default=False)
+    is_scheduled = models.BooleanField(default=False)
+    web_id = models.CharField(max_length=255, blank=True)
+    url = models.CharField(max_length=2000, blank=True)
+    schedule_time = models.DateTimeField(blank=True, null=True)
+    send_time = models.DateTimeField(blank=True, null=True)
+    last_pushed_revision = models.ForeignKey(
+        "wagtailcore.Revision",
+        blank=True,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    last_synced_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return self.campaign_id
+
+    @classmethod
+    def record_push(cls, page, campaign_id: str, revision) -> "NewsletterCampaign":
+        """Record that `revision` of `page` was saved to the campaign."""
+        campaign, _ = cls.objects.update_or_create(
+            campaign_id=campaign_id,
+            defaults={"page": page, "last_pushed_revision": revision},
+        )
+        return campaign
+
+    # Campaign statuses, as named by Mailchimp. Campaigns with any other status
+    # (e.g. "sending", "sent" or "canceled") are considered sent.
+    DRAFT = "save"
+    SCHEDULED = "schedule"
+    PAUSED = "paused"
+    SENDING = "sending"
+    SENT = "sent"
+    UNSENT_STATUSES = frozenset([DRAFT, SCHEDULED, PAUSED])
+
+    @classmethod
+    def update_status(
+        cls,
+        campaign_id: str,
+        status: str,
+        *,
+        is_sent: Optional[bool] = None,
+        is_scheduled: Optional[bool] = None,
+        schedule_time=None,
+        page=None,
+        **values,
+    ) -> None:
+        """
+        Update the local copy of a campaign. `is_sent` and `is_scheduled` are
+        derived from `status`, unless the backend tells us otherwise, and are kept
+        consistent with each other and with `schedule_time`. With `page`, the
+        record is created if needed; otherwise only existing records (created
+        when the campaign is saved) are updated. The database is only written to
+        if something changed.
+        """
+        if is_sent is None:
+            is_sent = status not in cls.UNSENT_STATUSES
+        if is_scheduled is None:
+            is_scheduled = status == cls.SCHEDULED
+        is_scheduled = is_scheduled and not is_sent
+
+        values.update(status=status, is_sent=is_sent, is_scheduled=is_scheduled)
+        if not is_scheduled:
+            values["schedule_time"] = None
+        elif schedule_time is not None:
+            values["schedule_time"] = schedule_time
+        if page is not None:
+            values["page"] = page
+
+        if cls.objects.filter(
+            campaign_id=campaign_id, last_synced_at__isnull=False, **values
+        ).exists():
+            return
+
+        values["last_synced_at"] = timezone.now()
+        if page is None:
+            cls.objects.filter(campaign_id=campaign_id).update(**values)
+        else:
+            cls.objects.update_or_create(campaign_id=campaign_id, defaults=values)
+
+    @classmethod
+    def sync(cls, page, campaign_id: str, campaign, report=None):
+        """
+        Update the local copy from the campaign, and optionally its report, as
+        fetched from the backend. As this runs whenever the page is edited, the
+        database is only written to if the campaign changed since it was last
+        synced.
+        """
+        status = getattr(campaign, "status", None)
+        if not isinstance(status, str):
+            status = (
+                cls.SENT
+                if campaign.is_sent
+                else cls.SCHEDULED
+                if campaign.is_scheduled
+                else cls.DRAFT
+            )
+
+        values: dict[str, Any] = {
+            "web_id": str(getattr(campaign, "web_id", "")),
+            "url": str(campaign.url or ""),
+        }
+        if isinstance(report, dict) and report.get("send_time"):
+            send_time = report["send_time"]
+            if not settings.USE_TZ and timezone.is_aware(send_time):
+                send_time = timezone.make_naive(send_time)
+            values["send_time"] = send_time
+
+        cls.update_status(
+            campaign_id,
+            status,
+            is_sent=bool(campaign.is_sent),
+            is_scheduled=bool(campaign.is_scheduled),
+            page=page,
+            **values,
+        )
+
+
 class NewsletterPageMixin(Page):
     base_form_class: type
 
@@ -84,6 +280,11 @@ class NewsletterPageMixin(Page):
     )
     # Campaign ID in the backend system. We store it as an opaque string.
     newsletter_campaign = models.CharField(max_length=1000, blank=True)
+    # Digest of the campaign settings and content last saved to the backend, so
+    # that unchanged campaigns are not uploaded again.
+    newsletter_campaign_digest = models.CharField(
+        max_length=64, blank=True, editable=False
+    )
 
     class Meta:  # type: ignore
         abstract = True
@@ -129,6 +330,7 @@ class NewsletterPageMixin(Page):
     # Subclasses may add their own newsletter-related fields to this list.
     newsletter_persistent_fields = [
         "newsletter_campaign",
+        "newsletter_campaign_digest",
     ]
 
     def with_content_json(self, content):
@@ -149,6 +351,18 @@ class NewsletterPageMixin(Page):
         permission_policy = ModelPermissionPolicy(type(self))
         return permission_policy.user_has_permission(user, "publish")
 
+    def get_newsletter_permissions(self, user) -> "frozenset[str]":
+        """
+        Newsletter actions that `user` is allowed to perform on this page. By
+        default, `has_newsletter_permission` is checked for each action; override
+        this to evaluate them all at once.
+        """
+        return frozenset(
+            action
+            for action in permissions.NEWSLETTER_ACTIONS
+            if self.has_newsletter_permission(user, action)
+        )
+
     newsletter_template: str
 
     def get_newsletter_template(self) -> str:
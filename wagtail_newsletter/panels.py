@@ -1,16 +1,123 @@
 import logging
 
+from django.conf import settings
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured
 from django.middleware import csrf
+from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.html import format_html
 from wagtail.admin.panels import Panel
 
-from . import campaign_backends, forms, models
+from . import campaign_backends, forms, jobs, models, permissions
 
 
 logger = logging.getLogger(__name__)
 
+SLOW_BACKEND_CACHE_KEY = "wagtail-newsletter-backend-slow"
+SLOW_BACKEND_CACHE_TIMEOUT = 60
+
+CAMPAIGN_TEMPLATE_NAME = "wagtail_newsletter/panels/newsletter_campaign.html"
+
+
+def is_deferred() -> bool:
+    return getattr(settings, "WAGTAIL_NEWSLETTER_DEFERRED_PANEL", False)
+
+
+def get_campaign_context(
+    request, page: "models.NewsletterPageMixin", permissions: "frozenset[str]"
+) -> "dict":
+    """
+    Context for the campaign part of the newsletter panel (status, report and
+    action buttons), fetching the campaign from the backend.
+    """
+    context = {}
+    backend = campaign_backends.get_backend()
+    campaign = None
+    slow_backend_message = format_html(
+        "{backend_name} is responding slowly. Campaign details will be"
+        " shown when it recovers.",
+        backend_name=backend.name,
+    )
+
+    if page.pk and page.newsletter_campaign:
+        if caches["default"].get(SLOW_BACKEND_CACHE_KEY):
+            context["error_message"] = slow_backend_message
+
+        else:
+            try:
+                campaign, report = backend.get_campaign_with_report(
+                    page.newsletter_campaign, with_report="get_report" in permissions
+                )
+
+                if campaign is None:
+                    context["campaign_was_deleted"] = True
+                    context["error_message"] = format_html(
+                        """
+                        The campaign <code>{deleted_campaign_id}</code> was
+                        deleted in {backend_name}. Click <strong>Save
+                        campaign to {backend_name}</strong> to recreate it.
+                        """,
+                        deleted_campaign_id=page.newsletter_campaign,
+                        backend_name=backend.name,
+                    )
+
+                else:
+                    if report is not None:
+                        context["report"] = report
+
+                    models.NewsletterCampaign.sync(
+                        page,
+                        page.newsletter_campaign,
+                        campaign,
+                        context.get("report"),
+                    )
+
+            except ImproperlyConfigured:
+                logger.exception("Error loading campaign data")
+                context["error_message"] = (
+                    "The newsletter campaign backend is not properly configured."
+                )
+
+            except campaign_backends.CampaignBackendTimeout:
+                # Don't hold up the next page loads waiting for the
+                # backend again.
+                caches["default"].set(
+                    SLOW_BACKEND_CACHE_KEY, True, SLOW_BACKEND_CACHE_TIMEOUT
+                )
+                context["error_message"] = slow_backend_message
+
+            except campaign_backends.CampaignBackendError as error:
+                context["error_message"] = str(error)
+
+        if (
+            campaign is None
+            and "error_message" in context
+            and not context.get("campaign_was_deleted")
+        ):
+            # The backend is unavailable; show the last known state
+            # of the campaign instead.
+            campaign = models.NewsletterCampaign.objects.filter(
+                campaign_id=page.newsletter_campaign,
+                last_synced_at__isnull=False,
+            ).first()
+
+    context["csrf_token"] = csrf.get_token(request)
+    context["page"] = page
+    context["backend_name"] = backend.name
+    context["campaign"] = campaign
+    context["test_form"] = forms.SendTestEmailForm(
+        initial={"email": request.user.email},
+        prefix="newsletter-test",
+    )
+    context["schedule_form"] = forms.ScheduleCampaignForm(
+        prefix="newsletter-schedule",
+    )
+
+    context["has_action_permission"] = {permission: True for permission in permissions}
+
+    return context
+
 
 class NewsletterPanel(Panel):
     class BoundPanel(Panel.BoundPanel):
@@ -24,73 +131,36 @@ class NewsletterPanel(Panel):
 
         @cached_property
         def permissions(self):
-            return frozenset(
-                action
-                for action in [
-                    "save_campaign",
-                    "send_test_email",
-                    "send_campaign",
-                    "schedule_campaign",
-                    "unschedule_campaign",
-                    "get_report",
-                ]
-                if self.instance.has_newsletter_permission(self.request.user, action)
-            )
+            return permissions.get_permissions(self.request, self.instance)
 
         def get_context_data(self, parent_context=None):
             context = super().get_context_data(parent_context) or {}
-            backend = campaign_backends.get_backend()
-            campaign = None
-
-            if self.instance.pk:
-                if self.instance.newsletter_campaign:
-                    try:
-                        campaign = backend.get_campaign(
-                            self.instance.newsletter_campaign
-                        )
-
-                        if campaign is None:
-                            context["campaign_was_deleted"] = True
-                            context["error_message"] = format_html(
-                                """
-                                The campaign <code>{deleted_campaign_id}</code> was
-                                deleted in {backend_name}. Click <strong>Save
-                                campaign to {backend_name}</strong> to recreate it.
-                                """,
-                                deleted_campaign_id=self.instance.newsletter_campaign,
-                                backend_name=backend.name,
-                            )
-
-                    except ImproperlyConfigured:
-                        logger.exception("Error loading campaign data")
-                        context["error_message"] = (
-                            "The newsletter campaign backend is not properly configured."
-                        )
-
-                    except campaign_backends.CampaignBackendError as error:
-                        context["error_message"] = str(error)
-
-            context["csrf_token"] = csrf.get_token(self.request)
-            context["backend_name"] = backend.name
-            context["campaign"] = campaign
-            context["test_form"] = forms.SendTestEmailForm(
-                initial={"email": self.request.user.email},
-                prefix="newsletter-test",
+            # Wagtail doesn't let the browser cache admin views, so the panel
+            # remembers recipients itself, for as long as audiences are cached.
+            context["recipients_max_age"] = getattr(
+                settings, "WAGTAIL_NEWSLETTER_CACHE_TIMEOUT", 300
             )
-            context["schedule_form"] = forms.ScheduleCampaignForm(
-                prefix="newsletter-schedule",
-            )
-
-            if (
-                campaign is not None
-                and (campaign.is_sent or campaign.is_scheduled)
-                and "get_report" in self.permissions
-            ):
-                context["report"] = campaign.get_report()
 
-            context["has_action_permission"] = {
-                permission: True for permission in self.permissions
-            }
+            if self.instance.pk and jobs.is_enabled():
+                context["job_messages"] = jobs.pop_finished_job_messages(
+                    self.instance, self.request.user
+                )
+                context["has_pending_jobs"] = jobs.has_pending_jobs(self.instance)
+
+            if self.instance.pk and self.instance.newsletter_campaign and is_deferred():
+                # The campaign part of the panel is fetched by the browser from
+                # the `campaign` view, so that the edit view doesn't wait for the
+                # backend.
+                context["backend_name"] = campaign_backends.get_backend().name
+                context["campaign_url"] = reverse(
+                    "wagtail_newsletter:campaign",
+                    kwargs={"page_id": self.instance.pk},
+                )
+
+            else:
+                context.update(
+                    get_campaign_context(self.request, self.instance, self.permissions)
+                )
 
             return context
 
@@ -0,0 +1,38 @@
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .models import NewsletterPageMixin
+
+
+NEWSLETTER_ACTIONS = [
+    "save_campaign",
+    "send_test_email",
+    "send_campaign",
+    "schedule_campaign",
+    "unschedule_campaign",
+    "get_report",
+]
+
+REQUEST_CACHE_ATTRIBUTE = "_wagtail_newsletter_permissions"
+
+
+def get_permissions(request, page: "NewsletterPageMixin") -> "frozenset[str]":
+    """
+    Newsletter actions that the user of `request` is allowed to perform on
+    `page`. They are evaluated at once, and remembered for the rest of the
+    request, so that the panel, the views and the actions don't check them again.
+    """
+    cache = getattr(request, REQUEST_CACHE_ATTRIBUTE, None)
+    if cache is None:
+        cache = {}
+        setattr(request, REQUEST_CACHE_ATTRIBUTE, cache)
+
+    key = (type(page), page.pk)
+    if key not in cache:
+        cache[key] = frozenset(page.get_newsletter_permissions(request.user))
+    return cache[key]
+
+
+def has_permission(request, page: "NewsletterPageMixin", action: str) -> bool:
+    return action in get_permissions(request, page)
@@ -6,10 +6,13 @@ from wagtail.models import Page
 from wagtail.rich_text import EmbedRewriter, LinkRewriter, MultiRuleRewriter, features
 from wagtail.rich_text.pages import PageLinkHandler
 
+from . import tracing
+
 
 def rewrite_db_html_for_email(rich_text):
     rewriter = _get_rewriter_for_email()
-    return rewriter(rich_text.source)
+    with tracing.span("rich_text.rewrite", source_size=len(rich_text.source)):
+        return rewriter(rich_text.source)
 
 
 class LinkHandlerForEmail(PageLinkHandler):
@@ -0,0 +1,8 @@
+from django.dispatch import Signal
+
+
+# Sent after each call to a campaign backend method, or to `Campaign.get_report`.
+# Arguments: `instance` (the backend or campaign), and `call`, a
+# `wagtail_newsletter.campaign_backends.instrumentation.BackendCall` holding the
+# operation name, duration, outcome, and the requests made to the provider.
+campaign_backend_call = Signal()
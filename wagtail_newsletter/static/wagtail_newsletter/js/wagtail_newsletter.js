@@ -1,12 +1,45 @@
 window.wagtail.app.register("wn-panel",
   class extends window.StimulusModule.Controller {
     static targets = [
+      "campaign",
       "sendButton",
       "scheduleButton",
     ]
 
     static values = {
-      recipientsUrl: String
+      campaignUrl: String,
+      recipientsUrl: String,
+      recipientsMaxAge: Number
+    }
+
+    initialize() {
+      // Recipients data by pk, as `{ data, etag, expires }`
+      this.recipients = new Map();
+    }
+
+    connect() {
+      if (this.campaignUrlValue) {
+        this.loadCampaign();
+      }
+    }
+
+    /*
+     * Replace the placeholder in the panel with the campaign status, report and
+     * buttons, fetched from the backend without holding up the edit view.
+     */
+    async loadCampaign() {
+      try {
+        const response = await fetch(new URL(this.campaignUrlValue, window.location.href));
+        if (response.status < 200 || response.status >= 300) {
+          throw new Error(`Response status is ${response.status} ${response.statusText}`);
+        }
+        const data = await response.json();
+        this.campaignTarget.innerHTML = data.html;
+      }
+      catch (error) {
+        console.error(error);
+        this.campaignTarget.textContent = "Error loading campaign details.";
+      }
     }
 
     get sendButtonProgress() {
@@ -41,15 +74,37 @@ window.wagtail.app.register("wn-panel",
       return recipientsId;
     }
 
+    /*
+     * Get the name and member count of recipients. They are remembered for
+     * `recipientsMaxAge` seconds, then revalidated with their ETag.
+     */
     async getRecipientsData(recipientsId) {
+      const cached = this.recipients.get(recipientsId);
+      if (cached && cached.expires > Date.now()) {
+        return cached.data;
+      }
+
       try {
         const url = new URL(this.recipientsUrlValue, window.location.href);
         url.searchParams.set("pk", recipientsId);
-        const response = await fetch(url);
-        if (response.status < 200 || response.status >= 300) {
+        const headers = cached && cached.etag ? { "If-None-Match": cached.etag } : {};
+        const response = await fetch(url, { headers });
+        let data;
+        if (response.status === 304 && cached) {
+          data = cached.data;
+        }
+        else if (response.status < 200 || response.status >= 300) {
           throw new Error(`Response status is ${response.status} ${response.statusText}`);
         }
-        return await response.json();
+        else {
+          data = await response.json();
+        }
+        this.recipients.set(recipientsId, {
+          data,
+          etag: response.headers.get("ETag"),
+          expires: Date.now() + this.recipientsMaxAgeValue * 1000,
+        });
+        return data;
       }
       catch (error) {
         console.error(error);
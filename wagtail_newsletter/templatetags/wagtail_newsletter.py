@@ -6,6 +6,7 @@ from django.utils.safestring import mark_safe
 from wagtail.admin.utils import get_admin_base_url
 from wagtail.rich_text import RichText
 
+from .. import tracing
 from ..rich_text import rewrite_db_html_for_email
 
 
@@ -36,7 +37,9 @@ class MRMLRenderNode(template.Node):
 
         mjml_source = self.nodelist.render(context)
         try:
-            output = mrml.to_html(mjml_source)
+            with tracing.span("mrml.to_html", mjml_size=len(mjml_source)) as span:
+                output = mrml.to_html(mjml_source)
+                span.set_attribute("html_size", len(output.content))
             return output.content
         except OSError as error:
             # The MRML library raises OSError exceptions when something goes wrong.
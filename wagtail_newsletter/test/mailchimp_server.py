@@ -0,0 +1,536 @@
+"""
+A local stand-in for the Mailchimp Marketing API, implementing the endpoints used
+by `MailchimpCampaignBackend`, with the state kept in memory. Latency, server
+errors and rate limiting (429 responses) can be injected, to exercise the backend
+over real HTTP connections, e.g. for load and benchmark testing.
+
+Point the backend at it with the `WAGTAIL_NEWSLETTER_MAILCHIMP_API_URL` setting:
+
+    server = FakeMailchimpServer(latency=0.05, error_rate=0.01)
+    server.start()
+    settings.WAGTAIL_NEWSLETTER_MAILCHIMP_API_URL = server.url
+
+Or run it standalone with `python -m wagtail_newsletter.test.mailchimp_server`.
+"""
+
+import argparse
+import gzip
+import itertools
+import json
+import random
+import re
+import socket
+import threading
+import time
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional, cast
+from urllib.parse import parse_qs, urlsplit
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, title: str, detail: str = ""):
+        super().__init__(detail or title)
+        self.status = status
+        self.title = title
+        self.detail = detail
+
+
+def project(data: "dict[str, Any]", fields: "list[str]") -> "dict[str, Any]":
+    """Keep only the `fields` of `data`, given as dotted paths, like Mailchimp."""
+    result: dict[str, Any] = {}
+    for field in fields:
+        key, _, rest = field.partition(".")
+        if key not in data:
+            continue
+
+        value = data[key]
+        if not rest:
+            result[key] = value
+
+        elif isinstance(value, list):
+            projected = [project(item, [rest]) for item in value]
+            result[key] = [
+                {**existing, **item}
+                for existing, item in itertools.zip_longest(
+                    result.get(key, []), projected, fillvalue={}
+                )
+            ]
+
+        elif isinstance(value, dict):
+            result[key] = {**result.get(key, {}), **project(value, [rest])}
+
+    return result
+
+
+class MailchimpState:
+    """In-memory audiences, segments, campaigns and reports."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.audiences: dict[str, dict[str, Any]] = {}
+        self.segments: dict[str, list[dict[str, Any]]] = {}
+        self.campaigns: dict[str, dict[str, Any]] = {}
+        self.content: dict[str, str] = {}
+        self.test_emails: list[tuple[str, list[str]]] = []
+        self._ids = itertools.count(1)
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def add_audience(
+        self, name: str, *, member_count: int = 0, segments: int = 0
+    ) -> "dict[str, Any]":
+        with self.lock:
+            audience_id = f"{self.next_id():010x}"
+            audience = {
+                "id": audience_id,
+                "name": name,
+                "stats": {"member_count": member_count},
+            }
+            self.audiences[audience_id] = audience
+            self.segments[audience_id] = [
+                {
+                    "id": self.next_id(),
+                    "name": f"{name} segment {i + 1}",
+                    "member_count": member_count // (i + 2),
+                    "type": "saved",
+                    "list_id": audience_id,
+                }
+                for i in range(segments)
+            ]
+            return audience
+
+    def populate(
+        self, *, audiences: int = 3, segments: int = 5, member_count: int = 1000
+    ):
+        for i in range(audiences):
+            self.add_audience(
+                f"Audience {i + 1}", member_count=member_count, segments=segments
+            )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _merge(target: "dict[str, Any]", changes: "dict[str, Any]"):
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(target.get(key), dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+class MailchimpHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    routes = [
+        ("GET", r"/lists", "list_audiences"),
+        ("GET", r"/lists/(?P<audience_id>[^/]+)", "get_audience"),
+        ("GET", r"/lists/(?P<audience_id>[^/]+)/segments", "list_segments"),
+        (
+            "GET",
+            r"/lists/(?P<audience_id>[^/]+)/segments/(?P<segment_id>[^/]+)",
+            "get_segment",
+        ),
+        ("GET", r"/campaigns", "list_campaigns"),
+        ("POST", r"/campaigns", "create_campaign"),
+        ("GET", r"/campaigns/(?P<campaign_id>[^/]+)", "get_campaign"),
+        ("PATCH", r"/campaigns/(?P<campaign_id>[^/]+)", "update_campaign"),
+        ("PUT", r"/campaigns/(?P<campaign_id>[^/]+)/content", "set_content"),
+        ("POST", r"/campaigns/(?P<campaign_id>[^/]+)/actions/test", "send_test"),
+        ("POST", r"/campaigns/(?P<campaign_id>[^/]+)/actions/send", "send"),
+        ("POST", r"/campaigns/(?P<campaign_id>[^/]+)/actions/schedule", "schedule"),
+        (
+            "POST",
+            r"/campaigns/(?P<campaign_id>[^/]+)/actions/unschedule",
+            "unschedule",
+        ),
+        ("GET", r"/reports/(?P<campaign_id>[^/]+)", "get_report"),
+    ]
+
+    def setup(self):
+        super().setup()
+        # Headers and body are written separately; don't let Nagle's algorithm
+        # delay the body.
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        if self.fake_server.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.handle_api_request()
+
+    def do_POST(self):
+        self.handle_api_request()
+
+    def do_PUT(self):
+        self.handle_api_request()
+
+    def do_PATCH(self):
+        self.handle_api_request()
+
+    @property
+    def fake_server(self) -> "FakeMailchimpServer":
+        return cast("FakeMailchimpServer", self.server)
+
+    def resolve(self, path: str):
+        for method, pattern, name in self.routes:
+            match = re.fullmatch(pattern, path)
+            if method == self.command and match:
+                return getattr(self, name), match.groupdict()
+        raise ApiError(404, "Resource Not Found", f"No route for {path}")
+
+    def handle_api_request(self):
+        url = urlsplit(self.path)
+        self.query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw_body = self.rfile.read(length) if length else b""
+
+        if not self.fake_server.enter():
+            self.send_error_response(
+                ApiError(
+                    429,
+                    "Too Many Requests",
+                    "You have exceeded the limit of simultaneous connections.",
+                )
+            )
+            return
+
+        try:
+            self.fake_server.wait()
+            error = self.fake_server.injected_error()
+            if error is not None:
+                self.send_error_response(error)
+                return
+
+            if not self.headers.get("Authorization"):
+                raise ApiError(401, "API Key Missing")
+
+            handler, kwargs = self.resolve(
+                url.path.removeprefix(self.fake_server.base_path)
+            )
+            body = json.loads(raw_body) if raw_body else {}
+            with self.fake_server.state.lock:
+                status, data = handler(body, **kwargs)
+
+            if data is not None and "fields" in self.query:
+                data = project(data, self.query["fields"].split(","))
+            self.send_json(status, data)
+
+        except ApiError as error:
+            self.send_error_response(error)
+
+        finally:
+            self.fake_server.exit()
+
+    def send_json(
+        self, status: int, data: "Optional[dict[str, Any]]", content_type=None
+    ):
+        self.send_response(status)
+        payload = b""
+        if data is not None:
+            payload = json.dumps(data).encode()
+            self.send_header("Content-Type", content_type or "application/json")
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                payload = gzip.compress(payload)
+                self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_error_response(self, error: ApiError):
+        self.send_json(
+            error.status,
+            {
+                "type": "https://mailchimp.com/developer/marketing/docs/errors/",
+                "title": error.title,
+                "status": error.status,
+                "detail": error.detail,
+            },
+            content_type="application/problem+json",
+        )
+
+    @property
+    def state(self) -> MailchimpState:
+        return self.fake_server.state
+
+    def paginate(self, key: str, items: "list[dict[str, Any]]"):
+        count = min(int(self.query.get("count", 10)), 1000)
+        offset = int(self.query.get("offset", 0))
+        return 200, {key: items[offset : offset + count], "total_items": len(items)}
+
+    def get_campaign_or_404(self, campaign_id: str) -> "dict[str, Any]":
+        try:
+            return self.state.campaigns[campaign_id]
+        except KeyError:
+            raise ApiError(
+                404, "Resource Not Found", "The requested resource could not be found."
+            ) from None
+
+    def list_audiences(self, body):
+        return self.paginate("lists", list(self.state.audiences.values()))
+
+    def get_audience(self, body, audience_id):
+        if audience_id not in self.state.audiences:
+            raise ApiError(404, "Resource Not Found", "The list does not exist.")
+
+        return 200, self.state.audiences[audience_id]
+
+    def get_segment(self, body, audience_id, segment_id):
+        for segment in self.state.segments.get(audience_id, []):
+            if str(segment["id"]) == segment_id:
+                return 200, segment
+
+        raise ApiError(404, "Resource Not Found", "The segment does not exist.")
+
+    def list_segments(self, body, audience_id):
+        if audience_id not in self.state.audiences:
+            raise ApiError(404, "Resource Not Found", "The list does not exist.")
+
+        segments = self.state.segments[audience_id]
+        if "type" in self.query:
+            segments = [s for s in segments if s["type"] == self.query["type"]]
+        return self.paginate("segments", segments)
+
+    def list_campaigns(self, body):
+        campaigns = list(self.state.campaigns.values())
+        if self.query.get("sort_field") == "create_time":
+            campaigns.sort(
+                key=lambda campaign: campaign["create_time"],
+                reverse=self.query.get("sort_dir") == "DESC",
+            )
+        return self.paginate("campaigns", campaigns)
+
+    def create_campaign(self, body):
+        campaign_id = f"{self.state.next_id():010x}"
+        campaign = {
+            "id": campaign_id,
+            "web_id": self.state.next_id(),
+            "type": body.get("type", "regular"),
+            "status": "save",
+            "create_time": _now(),
+            "send_time": "",
+            "settings": body.get("settings", {}),
+            "recipients": body.get("recipients", {}),
+        }
+        self.state.campaigns[campaign_id] = campaign
+        return 200, campaign
+
+    def get_campaign(self, body, campaign_id):
+        return 200, self.get_campaign_or_404(campaign_id)
+
+    def update_campaign(self, body, campaign_id):
+        campaign = self.get_campaign_or_404(campaign_id)
+        if campaign["status"] != "save":
+            raise ApiError(400, "Bad Request", "Cannot update a sent campaign.")
+
+        for key in ["settings", "recipients"]:
+            if key in body:
+                _merge(campaign[key], body[key])
+        return 200, campaign
+
+    def set_content(self, body, campaign_id):
+        self.get_campaign_or_404(campaign_id)
+        self.state.content[campaign_id] = body.get("html", "")
+        return 200, {"html": self.state.content[campaign_id]}
+
+    def check_ready(self, campaign):
+        if not campaign["recipients"].get("list_id"):
+            raise ApiError(400, "Bad Request", "The campaign has no recipients.")
+        if campaign["id"] not in self.state.content:
+            raise ApiError(400, "Bad Request", "The campaign has no content.")
+
+    def send_test(self, body, campaign_id):
+        campaign = self.get_campaign_or_404(campaign_id)
+        self.check_ready(campaign)
+        self.state.test_emails.append((campaign_id, body.get("test_emails", [])))
+        return 204, None
+
+    def send(self, body, campaign_id):
+        campaign = self.get_campaign_or_404(campaign_id)
+        self.check_ready(campaign)
+        if campaign["status"] not in ["save", "paused"]:
+            raise ApiError(400, "Bad Request", "The campaign was already sent.")
+
+        campaign["status"] = "sent"
+        campaign["send_time"] = _now()
+        return 204, None
+
+    def schedule(self, body, campaign_id):
+        campaign = self.get_campaign_or_404(campaign_id)
+        self.check_ready(campaign)
+        campaign["status"] = "schedule"
+        campaign["send_time"] = body.get("schedule_time", "")
+        return 204, None
+
+    def unschedule(self, body, campaign_id):
+        campaign = self.get_campaign_or_404(campaign_id)
+        if campaign["status"] != "schedule":
+            raise ApiError(400, "Bad Request", "The campaign is not scheduled.")
+
+        campaign["status"] = "save"
+        campaign["send_time"] = ""
+        return 204, None
+
+    def get_report(self, body, campaign_id):
+        campaign = self.get_campaign_or_404(campaign_id)
+        if campaign["status"] != "sent":
+            raise ApiError(404, "Resource Not Found", "The campaign wasn't sent.")
+
+        audience = self.state.audiences.get(campaign["recipients"]["list_id"], {})
+        emails_sent = audience.get("stats", {}).get("member_count", 0)
+        return 200, {
+            "id": campaign_id,
+            "emails_sent": emails_sent,
+            "bounces": {"hard_bounces": 0, "soft_bounces": 0, "syntax_errors": 0},
+            "opens": {"unique_opens": emails_sent // 2},
+            "clicks": {"unique_clicks": emails_sent // 10},
+            "send_time": campaign["send_time"],
+        }
+
+
+class FakeMailchimpServer(ThreadingHTTPServer):
+    """
+    HTTP server for the fake Mailchimp API.
+
+    `latency` and `latency_jitter`: seconds to wait before handling each request;
+    a random delay of up to `latency_jitter` is added to `latency`.
+
+    `error_rate` and `rate_limit_rate`: fraction of requests that fail with a
+    500 or a 429 error, respectively.
+
+    `max_connections`: like Mailchimp, reject requests with a 429 error when
+    more than this many are in flight.
+    """
+
+    daemon_threads = True
+    base_path = "/3.0"
+
+    def __init__(
+        self,
+        address=("127.0.0.1", 0),
+        *,
+        state: Optional[MailchimpState] = None,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        max_connections: Optional[int] = None,
+        seed: Optional[int] = None,
+        verbose: bool = False,
+    ):
+        super().__init__(address, MailchimpHandler)
+        self.state = state if state is not None else MailchimpState()
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.max_connections = max_connections
+        self.verbose = verbose
+        self.random = random.Random(seed)  # noqa: S311
+        self.request_count = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._counter_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{self.base_path}"
+
+    def enter(self) -> bool:
+        with self._counter_lock:
+            self.request_count += 1
+            if (
+                self.max_connections is not None
+                and self.in_flight >= self.max_connections
+            ):
+                return False
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return True
+
+    def exit(self):
+        with self._counter_lock:
+            self.in_flight -= 1
+
+    def wait(self):
+        with self._counter_lock:
+            delay = self.latency + self.random.uniform(0, self.latency_jitter)
+        if delay:
+            time.sleep(delay)
+
+    def injected_error(self) -> Optional[ApiError]:
+        with self._counter_lock:
+            roll = self.random.random()
+        if roll < self.rate_limit_rate:
+            return ApiError(429, "Too Many Requests", "Injected rate limit error.")
+        if roll < self.rate_limit_rate + self.error_rate:
+            return ApiError(500, "Internal Server Error", "Injected server error.")
+        return None
+
+    def start(self) -> "FakeMailchimpServer":
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="fake-mailchimp", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().partition("\n")[0]
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--max-connections", type=int, default=None)
+    parser.add_argument("--audiences", type=int, default=3)
+    parser.add_argument("--segments", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    state = MailchimpState()
+    state.populate(audiences=args.audiences, segments=args.segments)
+    server = FakeMailchimpServer(
+        (args.host, args.port),
+        state=state,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        max_connections=args.max_connections,
+        seed=args.seed,
+        verbose=True,
+    )
+    print(f"Fake Mailchimp API listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("wagtail_newsletter_test", "0002_simplepage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="articlepage",
+            name="newsletter_campaign_digest",
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+    ]
@@ -0,0 +1,167 @@
+"""
+Lightweight tracing of newsletter actions. Each phase of an action (rendering,
+cache lookups, backend calls...) runs in a nested span; finished spans are sent
+to the exporter configured in `WAGTAIL_NEWSLETTER_TRACE_EXPORTER`.
+"""
+
+import functools
+import json
+import secrets
+import threading
+import time
+
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: secrets.token_hex(8))
+    parent_id: Optional[str] = None
+    start_time: float = field(default_factory=time.time)
+    duration: float = 0.0
+    status: str = "ok"
+    error: Optional[str] = None
+    attributes: "dict[str, Any]" = field(default_factory=dict)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_json(self) -> "dict[str, Any]":
+        return asdict(self)
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span) -> None: ...
+
+
+class InMemorySpanExporter(SpanExporter):
+    """Keep finished spans in memory, e.g. for tests."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+
+class FileSpanExporter(SpanExporter):
+    """Append finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str = "wagtail-newsletter-traces.jsonl"):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_json(), default=str)
+        with self._lock, open(self.path, "a") as f:
+            f.write(line + "\n")
+
+
+_current_span: "ContextVar[Optional[Span]]" = ContextVar("current_span", default=None)
+_exporter: Optional[SpanExporter] = None
+_exporter_loaded = False
+_exporter_lock = threading.Lock()
+
+
+def get_exporter() -> Optional[SpanExporter]:
+    global _exporter, _exporter_loaded
+
+    if not _exporter_loaded:
+        with _exporter_lock:
+            if not _exporter_loaded:
+                dotted_path = getattr(
+                    settings, "WAGTAIL_NEWSLETTER_TRACE_EXPORTER", None
+                )
+                if dotted_path:
+                    options = getattr(
+                        settings, "WAGTAIL_NEWSLETTER_TRACE_EXPORTER_OPTIONS", {}
+                    )
+                    _exporter = import_string(dotted_path)(**options)
+                _exporter_loaded = True
+
+    return _exporter
+
+
+def reset_exporter() -> None:
+    global _exporter, _exporter_loaded
+
+    with _exporter_lock:
+        _exporter = None
+        _exporter_loaded = False
+
+
+@receiver(setting_changed)
+def _reset_exporter_on_setting_change(*, setting, **kwargs):
+    if setting.startswith("WAGTAIL_NEWSLETTER_TRACE_"):
+        reset_exporter()
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """
+    Run the enclosed code in a span, nested in the current one, and return the
+    span so that attributes can be added. Tracing is disabled, and spans aren't
+    recorded, unless an exporter is configured.
+    """
+    exporter = get_exporter()
+    if exporter is None:
+        yield Span(name=name, trace_id="", span_id="", attributes=attributes)
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else secrets.token_hex(16),
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        yield current
+
+    except BaseException as error:
+        current.status = "error"
+        current.error = repr(error)
+        raise
+
+    finally:
+        current.duration = time.perf_counter() - start
+        _current_span.reset(token)
+        exporter.export(current)
+
+
+def traced(name: str):
+    """Decorator to run each call of a function in a span."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,12 @@
+from django.urls import path
+
+from . import webhooks
+
+
+urlpatterns = [
+    path(
+        "mailchimp/webhook/<str:secret>/",
+        webhooks.mailchimp_webhook,
+        name="wagtail_newsletter_mailchimp_webhook",
+    ),
+]
@@ -1,20 +1,33 @@
-from typing import cast
+import hashlib
+import json
+
+from typing import Optional, cast
 
 from django.apps import apps
-from django.http import JsonResponse
+from django.conf import settings
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.utils.html import format_html
+from django.utils.http import http_date, quote_etag
 from django.views.decorators.http import require_http_methods
 from wagtail.admin import messages
 from wagtail.log_actions import log, registry
 from wagtail.models import Page
 
-from . import campaign_backends, get_recipients_model_string
-from .models import NewsletterPageMixin, NewsletterRecipientsBase
+from . import campaign_backends, get_recipients_model_string, panels, permissions
+from .audiences import CacheEntry
+from .models import (
+    NewsletterCampaign,
+    NewsletterPageMixin,
+    NewsletterRecipientsBase,
+)
 
 
 def has_permission_or_show_message(request, page, action):
-    if page.has_newsletter_permission(request.user, action):
+    if permissions.has_permission(request, page, action):
         return True
 
     else:
@@ -26,21 +39,185 @@ def has_permission_or_show_message(request, page, action):
         return False
 
 
+def recipients_json(recipients: NewsletterRecipientsBase):
+    return {
+        "name": recipients.name,
+        "member_count": recipients.member_count,
+    }
+
+
+def get_member_count_cache_entries(
+    recipients_list: "list[NewsletterRecipientsBase]",
+) -> "Optional[list[Optional[CacheEntry]]]":
+    """
+    Cache entries of the audiences and segments that the member counts of
+    recipients are read from, or `None` if some of them aren't cached.
+    """
+    entries = []
+    for recipients in recipients_list:
+        entry = recipients.get_member_count_cache_entry()
+        if entry is None and (recipients.audience or recipients.segment):
+            return None
+        entries.append(entry)
+    return entries
+
+
+def get_recipients_validators(
+    recipients_list: "list[NewsletterRecipientsBase]",
+    entries: "list[Optional[CacheEntry]]",
+) -> "tuple[str, Optional[float]]":
+    """
+    ETag and last modification time of recipients, derived from their database
+    rows and the cache entries of their audiences and segments, so that they
+    can be checked without calling the backend.
+    """
+    state = []
+    last_modified = None
+    for recipients, entry in zip(recipients_list, entries):
+        state.append(
+            [
+                recipients.pk,
+                recipients.name,
+                recipients.audience,
+                recipients.segment,
+                entry and entry.value,
+            ]
+        )
+        if entry is not None:
+            last_modified = max(last_modified or 0, entry.updated_at)
+
+    etag = quote_etag(
+        hashlib.sha256(
+            json.dumps(state, sort_keys=True, default=str).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+    )
+    return etag, last_modified
+
+
+def add_recipients_validators(
+    request, response, etag: str, last_modified: Optional[float]
+):
+    response["ETag"] = etag
+    if last_modified:
+        response["Last-Modified"] = http_date(last_modified)
+    # The Wagtail admin marks its responses as not cacheable, which takes
+    # precedence; the newsletter panel remembers recipients for this long itself.
+    patch_cache_control(
+        response,
+        private=True,
+        max_age=getattr(settings, "WAGTAIL_NEWSLETTER_CACHE_TIMEOUT", 300),
+    )
+    return (
+        get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=int(last_modified) if last_modified else None,
+            response=response,
+        )
+        or response
+    )
+
+
+@require_http_methods(["GET", "HEAD"])
 def recipients(request):
+    """
+    Name and member count of recipients. `?pk=<pk>` returns them for one
+    recipients object; `?pk=<pk>&pk=<pk>...` returns an object keyed by pk,
+    leaving out pks that don't exist. Responses have an ETag and a
+    Last-Modified date, so that clients can revalidate them with a conditional
+    request, which is answered without calling the backend while the audiences
+    and segments are cached.
+    """
     model = apps.get_model(get_recipients_model_string())
-    recipients: NewsletterRecipientsBase = get_object_or_404(
-        model,  # type: ignore
-        pk=request.GET.get("pk"),
+    pks = request.GET.getlist("pk")
+    try:
+        recipients_list = list(model.objects.filter(pk__in=pks).order_by("pk"))
+    except (ValueError, ValidationError):
+        return HttpResponseBadRequest("Invalid pk")
+
+    is_batch = len(pks) > 1
+    if not is_batch and not recipients_list:
+        raise Http404
+
+    entries = get_member_count_cache_entries(recipients_list)
+    if entries is not None:
+        etag, last_modified = get_recipients_validators(recipients_list, entries)
+        response = add_recipients_validators(
+            request, HttpResponse(), etag, last_modified
+        )
+        if response.status_code != 200:
+            return response
+
+    if is_batch:
+        data = {
+            str(recipients.pk): recipients_json(recipients)
+            for recipients in recipients_list
+        }
+    else:
+        data = recipients_json(recipients_list[0])
+
+    # Looking up the member counts has cached the audiences and segments, unless
+    # they weren't found.
+    etag, last_modified = get_recipients_validators(
+        recipients_list,
+        [recipients.get_member_count_cache_entry() for recipients in recipients_list],
     )
+    return add_recipients_validators(request, JsonResponse(data), etag, last_modified)
+
+
+def campaign(request, page_id):
+    """
+    Campaign status and report of a page, and the campaign part of the
+    newsletter panel rendered as HTML, for the deferred newsletter panel.
+    """
+    page = get_object_or_404(Page, id=page_id).specific
+    if not isinstance(page, NewsletterPageMixin):
+        raise Http404
+
+    page_permissions = permissions.get_permissions(request, page)
+    if not page_permissions or not page.permissions_for_user(request.user).can_edit():
+        raise PermissionDenied
+
+    context = panels.get_campaign_context(request, page, page_permissions)
+    campaign = context["campaign"]
+    campaign_data = None
+    if campaign is not None:
+        campaign_data = {
+            "id": page.newsletter_campaign,
+            "status": getattr(campaign, "status", None),
+            "is_sent": campaign.is_sent,
+            "is_scheduled": campaign.is_scheduled,
+            "url": campaign.url,
+        }
 
     return JsonResponse(
         {
-            "name": recipients.name,
-            "member_count": recipients.member_count,
+            "campaign": campaign_data,
+            "report": context.get("report"),
+            "error_message": context.get("error_message"),
+            "html": render_to_string(
+                panels.CAMPAIGN_TEMPLATE_NAME, context, request=request
+            ),
         }
     )
 
 
+@require_http_methods(["POST"])
+def refresh_report(request, page_id):
+    """Discard the cached campaign report of a page, so that it's fetched again."""
+    page = cast(NewsletterPageMixin, get_object_or_404(Page, id=page_id).specific)
+
+    if not permissions.has_permission(request, page, "get_report"):
+        raise PermissionDenied
+
+    if page.newsletter_campaign:
+        backend = campaign_backends.get_backend()
+        backend.invalidate_cached_report(page.newsletter_campaign)
+
+    return redirect("wagtailadmin_pages:edit", page_id=page_id)
+
+
 @require_http_methods(["POST"])
 def unschedule(request, page_id):
     page = cast(NewsletterPageMixin, get_object_or_404(Page, id=page_id).specific)
@@ -55,6 +232,9 @@ def unschedule(request, page_id):
             messages.error(request, error.message)
 
         else:
+            NewsletterCampaign.update_status(
+                page.newsletter_campaign, NewsletterCampaign.DRAFT
+            )
             log(page, "wagtail_newsletter.unschedule_campaign")
             messages.success(request, "Campaign successfully unscheduled")
 
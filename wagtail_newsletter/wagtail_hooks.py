@@ -11,6 +11,7 @@ from . import (
     DEFAULT_RECIPIENTS_MODEL,
     actions,
     get_recipients_model_string,
+    jobs,
     views,
     viewsets,
 )
@@ -26,7 +27,13 @@ def register_admin_urls():
             name="javascript_catalog",
         ),
         path("recipients/", views.recipients, name="recipients"),
+        path("pages/<int:page_id>/campaign/", views.campaign, name="campaign"),
         path("pages/<int:page_id>/unschedule/", views.unschedule, name="unschedule"),
+        path(
+            "pages/<int:page_id>/refresh-report/",
+            views.refresh_report,
+            name="refresh_report",
+        ),
     ]
 
     return [
@@ -81,25 +88,22 @@ def redirect_to_campaign_page(request, page: Page):
     if not views.has_permission_or_show_message(request, page, action):
         return
 
-    with LogContext(user=request.user):
-        if action == "save_campaign":
-            actions.save_campaign(request, page)
-
-        if action == "send_test_email":
-            actions.send_test_email(request, page)
-
-        if action == "send_campaign":
-            actions.send_campaign(request, page)
+    if jobs.is_enabled():
+        jobs.enqueue(request, page, action)
+        return
 
-        if action == "schedule_campaign":
-            actions.schedule_campaign(request, page)
+    with LogContext(user=request.user):
+        actions.run_action(request, page, action)
 
 
 @hooks.register("after_copy_page")  # type: ignore
 def clear_campaign_after_copy(request, page, new_page):
     if isinstance(new_page, NewsletterPageMixin) and new_page.newsletter_campaign:
         new_page.newsletter_campaign = ""
-        new_page.save(update_fields=["newsletter_campaign"])
+        new_page.newsletter_campaign_digest = ""
+        new_page.save(
+            update_fields=["newsletter_campaign", "newsletter_campaign_digest"]
+        )
 
 
 @hooks.register("register_log_actions")  # type: ignore
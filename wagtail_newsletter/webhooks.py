@@ -0,0 +1,62 @@
+import logging
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from django.utils.crypto import constant_time_compare
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_http_methods
+
+from . import campaign_backends
+from .audiences import Audience
+from .models import NewsletterCampaign
+
+
+logger = logging.getLogger(__name__)
+
+# Change of the audience member count for each type of list event
+MEMBER_COUNT_CHANGES = {
+    "subscribe": 1,
+    "unsubscribe": -1,
+    "cleaned": -1,
+}
+
+
+@csrf_exempt
+@require_http_methods(["GET", "HEAD", "POST"])
+def mailchimp_webhook(request, secret):
+    """
+    Receive Mailchimp webhook events, and update the cached campaign statuses and
+    audience member counts, so they can be shown without calling the API.
+    """
+    expected_secret = getattr(
+        settings, "WAGTAIL_NEWSLETTER_MAILCHIMP_WEBHOOK_SECRET", None
+    )
+    if not expected_secret or not constant_time_compare(secret, expected_secret):
+        raise Http404
+
+    if request.method != "POST":
+        # Mailchimp checks that the URL is valid with a GET request
+        return HttpResponse()
+
+    event_type = request.POST.get("type")
+    list_id = request.POST.get("data[list_id]")
+
+    if event_type == "campaign":
+        campaign_id = request.POST.get("data[id]")
+        status = request.POST.get("data[status]")
+        backend = campaign_backends.get_backend()
+        update = getattr(backend, "update_cached_campaign_status", None)
+        if campaign_id and status and update is not None:
+            update(campaign_id, status)
+        if campaign_id and status:
+            NewsletterCampaign.update_status(campaign_id, status)
+
+    elif event_type in MEMBER_COUNT_CHANGES and list_id:
+        Audience.objects.adjust_cached_member_count(
+            list_id, MEMBER_COUNT_CHANGES[event_type]
+        )
+
+    else:
+        logger.debug("Ignoring Mailchimp webhook event %r", event_type)
+
+    return HttpResponse()